@@ -249,7 +249,8 @@ class BaseFeatureManager(ABC):
                 sanitized_cmd.append(arg)
         
         # Log the command execution
-        self.log_debug(f"Executing Git command: {' '.join(str(c) for c in sanitized_cmd)}", 
+        cmd_str = ' '.join(map(str, sanitized_cmd))
+        self.log_debug(f"Executing Git command: {cmd_str}", 
                       "git_command", {"cwd": cwd})
         
         # Determine timeout to use
@@ -300,7 +301,7 @@ class BaseFeatureManager(ABC):
             except subprocess.TimeoutExpired:
                 attempt += 1
                 last_error = f"Command timed out after {timeout} seconds"
-                self.log_error(f"Git command timed out: {' '.join(str(c) for c in sanitized_cmd)}", 
+                self.log_error(f"Git command timed out: {cmd_str}", 
                               "git_command")
                 
                 if attempt < retry_count:
@@ -311,7 +312,7 @@ class BaseFeatureManager(ABC):
             except subprocess.CalledProcessError as e:
                 attempt += 1
                 last_error = f"Command failed with exit code {e.returncode}: {e.stderr}"
-                self.log_error(f"Git command failed: {' '.join(str(c) for c in sanitized_cmd)}", 
+                self.log_error(f"Git command failed: {cmd_str}", 
                               "git_command")
                 
                 if attempt < retry_count:
@@ -322,7 +323,7 @@ class BaseFeatureManager(ABC):
             except Exception as e:
                 attempt += 1
                 last_error = str(e)
-                self.log_error(f"Error executing Git command: {' '.join(str(c) for c in sanitized_cmd)}: {str(e)}", 
+                self.log_error(f"Error executing Git command: {cmd_str}: {str(e)}", 
                               "git_command")
                 
                 if attempt < retry_count:
@@ -432,12 +433,8 @@ class BaseFeatureManager(ABC):
             key: Configuration key to set
             value: Value to set
         """
-        if 'advanced_features' not in self.config:
-            self.config['advanced_features'] = {}
-        if self.feature_name not in self.config['advanced_features']:
-            self.config['advanced_features'][self.feature_name] = {}
-        
-        self.config['advanced_features'][self.feature_name][key] = value
+        feature_config = self.config.setdefault('advanced_features', {}).setdefault(self.feature_name, {})
+        feature_config[key] = value
         self.git_wrapper.save_config()
     
     def update_feature_config(self, config_dict: Dict[str, Any]) -> None:
@@ -447,12 +444,8 @@ class BaseFeatureManager(ABC):
         Args:
             config_dict: Dictionary of configuration key-value pairs
         """
-        if 'advanced_features' not in self.config:
-            self.config['advanced_features'] = {}
-        if self.feature_name not in self.config['advanced_features']:
-            self.config['advanced_features'][self.feature_name] = {}
-        
-        self.config['advanced_features'][self.feature_name].update(config_dict)
+        feature_config = self.config.setdefault('advanced_features', {}).setdefault(self.feature_name, {})
+        feature_config.update(config_dict)
         self.git_wrapper.save_config()
     
     # File Operations Methods
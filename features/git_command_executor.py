@@ -154,6 +154,36 @@ class GitCommandExecutor:
         """
         Validate that a Git command is safe to execute.
         
+        Args:
+            command: Git command to validate
+            
+        Returns:
+            True if command is safe, False otherwise
+        """
+        if not self.validate_options(command):
+            return False
+        
+        # Additional validation using input validator if available
+        if self.input_validator:
+            for i, arg in enumerate(command[1:], 1):
+                # The -C directory is a path handed straight to git, like the
+                # unescaped git executable in _prepare_command
+                if i == 2 and command[1] == '-C':
+                    continue
+                if isinstance(arg, str):
+                    # Check for shell injection patterns
+                    if not self._is_safe_argument(arg):
+                        return False
+        
+        return True
+    
+    def validate_options(self, command: List[str]) -> bool:
+        """
+        Check that a command runs git without options that execute other programs.
+        
+        This is the part of the validation that still applies when every
+        argument is quoted before reaching a shell.
+        
         Args:
             command: Git command to validate
             
@@ -181,14 +211,6 @@ class GitCommandExecutor:
                     if arg == dangerous or arg.startswith(dangerous + '='):
                         return False
         
-        # Additional validation using input validator if available
-        if self.input_validator:
-            for arg in command[1:]:
-                if isinstance(arg, str):
-                    # Check for shell injection patterns
-                    if not self._is_safe_argument(arg):
-                        return False
-        
         return True
     
     def _is_safe_argument(self, arg: str) -> bool:
@@ -237,8 +259,8 @@ class GitCommandExecutor:
         
         for i, arg in enumerate(command):
             if isinstance(arg, str):
-                if i == 0:
-                    # Don't escape the git command itself
+                if i == 0 or (i == 2 and command[1] == '-C'):
+                    # Don't escape the git command itself or its -C directory
                     prepared.append(arg)
                 else:
                     # Escape other arguments for shell safety
@@ -322,7 +344,11 @@ class GitCommandExecutor:
         subprocess_args = {
             'capture_output': config.capture_output,
             'text': True,
-            'check': False  # We'll handle return codes ourselves
+            'check': False,  # We'll handle return codes ourselves
+            # Descriptors opened by Python are non-inheritable (PEP 446), so
+            # skipping the close_fds sweep leaks nothing to git and lets
+            # CPython spawn via posix_spawn instead of fork+exec on Linux
+            'close_fds': False
         }
         
         # Set working directory if specified
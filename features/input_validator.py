@@ -13,10 +13,22 @@ for all advanced Git features. It includes:
 import re
 import os
 import shlex
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union, Pattern, Callable
 
 
+# Control characters rejected in input and stripped during sanitization
+# (everything below 0x20 except tab, newline and carriage return, plus DEL)
+_CONTROL_CHARS_RE = re.compile('[\x01-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> Pattern:
+    """Compile a caller-supplied validation pattern once, outside re's shared cache."""
+    return re.compile(pattern)
+
+
 class InputValidationError(Exception):
     """Exception raised for input validation errors."""
     
@@ -45,8 +57,12 @@ class InputValidator:
         'tag_name': re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9_\-./]+$'),
         'semver': re.compile(r'^v?(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$'),
         'url': re.compile(r'^(https?|git|ssh|file):\/\/[^\s/$.?#].[^\s]*$|^[^\s@]+@[^\s@]+\.[^\s@]+:.+$|^file:\/\/\/.*$'),
+        'ssh_url': re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+:.+$'),
     }
     
+    # Schemes accepted by the 'url' pattern, checked before running it
+    URL_SCHEMES = ('http://', 'https://', 'git://', 'ssh://', 'file://')
+    
     # Characters that should be escaped in shell commands
     SHELL_UNSAFE_CHARS = set('\\\'";$&|<>(){}[]!*?~` \t\n')
     
@@ -172,6 +188,10 @@ class InputValidator:
         if not url or not isinstance(url, str):
             return False
         
+        # Anything the pattern accepts has a known scheme or the user@host: form
+        if not url.startswith(self.URL_SCHEMES) and ('@' not in url or ':' not in url):
+            return False
+        
         return bool(self.PATTERNS['url'].match(url))
     
     def validate_email(self, email: str) -> bool:
@@ -187,6 +207,9 @@ class InputValidator:
         if not email or not isinstance(email, str):
             return False
         
+        if '@' not in email or '.' not in email:
+            return False
+        
         return bool(self.PATTERNS['email'].match(email))
     
     def validate_commit_hash(self, commit_hash: str) -> bool:
@@ -202,6 +225,10 @@ class InputValidator:
         if not commit_hash or not isinstance(commit_hash, str):
             return False
         
+        # The pattern's `$` also accepts one trailing newline, hence 41
+        if not 7 <= len(commit_hash) <= 41:
+            return False
+        
         return bool(self.PATTERNS['commit_hash'].match(commit_hash))
     
     def validate_tag_name(self, tag_name: str) -> bool:
@@ -265,11 +292,7 @@ class InputValidator:
                     return False
                 
                 # Check for other dangerous control characters
-                dangerous_chars = ['\x01', '\x02', '\x03', '\x04', '\x05', '\x06', '\x07', '\x08', 
-                                 '\x0b', '\x0c', '\x0e', '\x0f', '\x10', '\x11', '\x12', '\x13', 
-                                 '\x14', '\x15', '\x16', '\x17', '\x18', '\x19', '\x1a', '\x1b', 
-                                 '\x1c', '\x1d', '\x1e', '\x1f', '\x7f']
-                if any(char in input_value for char in dangerous_chars):
+                if _CONTROL_CHARS_RE.search(input_value):
                     error_msg = f"{field_name} contains dangerous control characters"
                     if self.error_handler:
                         self.error_handler.log_warning(
@@ -351,7 +374,7 @@ class InputValidator:
                             operation="validate_pattern"
                         )
                     return False
-                elif isinstance(pattern, str) and not re.match(pattern, input_value):
+                elif isinstance(pattern, str) and not _compile_pattern(pattern).match(input_value):
                     error_msg = validation_rules.get('pattern_error', f"{field_name} does not match required format")
                     if self.error_handler:
                         self.error_handler.log_warning(
@@ -514,12 +537,7 @@ class InputValidator:
         sanitized = input_str.replace('\x00', '')
         
         # Remove other dangerous control characters
-        dangerous_chars = ['\x01', '\x02', '\x03', '\x04', '\x05', '\x06', '\x07', '\x08', 
-                         '\x0b', '\x0c', '\x0e', '\x0f', '\x10', '\x11', '\x12', '\x13', 
-                         '\x14', '\x15', '\x16', '\x17', '\x18', '\x19', '\x1a', '\x1b', 
-                         '\x1c', '\x1d', '\x1e', '\x1f', '\x7f']
-        for char in dangerous_chars:
-            sanitized = sanitized.replace(char, '')
+        sanitized = _CONTROL_CHARS_RE.sub('', sanitized)
         
         # Check for command injection patterns
         injection_patterns = [
@@ -594,6 +612,32 @@ class InputValidator:
         
         return normalized_path
     
+    def validate_directory(self, directory: str, base: Union[str, Path] = None) -> Path:
+        """
+        Resolve a new directory name to the path it will occupy under base.
+        
+        Args:
+            directory: Directory name entered by the user
+            base: Parent directory (defaults to the current directory)
+        
+        Returns:
+            Absolute path of the directory; its name is the sanitized input
+        
+        Raises:
+            InputValidationError: If the name is empty or would leave base
+        """
+        name = self.sanitize_filename(directory)
+        base_path = Path(base if base is not None else os.getcwd()).resolve()
+        resolved = (base_path / name).resolve(strict=False) if name else base_path
+        
+        if resolved.parent != base_path:
+            raise InputValidationError(
+                f"Directory must be a single name inside {base_path}: {directory!r}",
+                'directory', 'directory'
+            )
+        
+        return resolved
+    
     def sanitize_git_reference(self, ref: str) -> str:
         """
         Sanitize a Git reference (branch, tag, etc.).
@@ -644,7 +688,7 @@ class InputValidator:
         has_valid_protocol = any(sanitized.startswith(protocol) for protocol in valid_protocols)
         
         # Also check for SSH format (user@host:path)
-        is_ssh_format = bool(re.match(r'^[^\s@]+@[^\s@]+\.[^\s@]+:.+$', sanitized))
+        is_ssh_format = bool(self.PATTERNS['ssh_url'].match(sanitized))
         
         if not has_valid_protocol and not is_ssh_format:
             return ""
@@ -532,9 +532,8 @@ class RepositoryHealthDashboard(BaseFeatureManager):
         """Get number of unique contributors."""
         try:
             result = self.run_git_command(['git', 'shortlog', '-sn', '--all'], capture_output=True)
-            if result:
-                return len(result.strip().split('\n'))
-            return 0
+            result = result.strip() if result else ''
+            return result.count('\n') + 1 if result else 0
         except Exception:
             return 0
     
@@ -566,7 +565,7 @@ class RepositoryHealthDashboard(BaseFeatureManager):
         try:
             # Get tracked files
             tracked_result = self.run_git_command(['git', 'ls-files'], capture_output=True)
-            tracked_count = len(tracked_result.split('\n')) if tracked_result else 0
+            tracked_count = tracked_result.count('\n') + 1 if tracked_result else 0
             
             # Get total files in working directory
             git_root = self.get_git_root()
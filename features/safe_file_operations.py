@@ -20,6 +20,54 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Union, Callable
 from contextlib import contextmanager
 
+# orjson is optional; it is used for config (de)serialization when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(data: Any, indent: Optional[int] = 2, sort_keys: bool = True) -> str:
+    """
+    Serialize data to JSON text, using orjson when it is available.
+    
+    orjson only supports two-space indentation, so other indent levels use
+    the standard library encoder.
+    
+    Args:
+        data: Data to serialize
+        indent: Indentation level (2 or None use orjson)
+        sort_keys: Whether to sort dictionary keys
+        
+    Returns:
+        JSON text
+    """
+    if orjson is not None and indent in (2, None):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option).decode('utf-8')
+    return json.dumps(data, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+
+
+def json_loads(content: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or bytes, using orjson when it is available.
+    
+    Both parsers raise json.JSONDecodeError (a ValueError) on invalid input.
+    
+    Args:
+        content: JSON document
+        
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class FileLockError(Exception):
     """Exception raised when file locking fails."""
@@ -39,17 +87,25 @@ class SafeFileOperations:
     against corruption, race conditions, and concurrent access issues.
     """
     
-    def __init__(self, error_handler=None):
+    def __init__(self, error_handler=None, fast_json: bool = True):
         """
         Initialize SafeFileOperations.
         
         Args:
             error_handler: Optional error handler for logging
+            fast_json: Use orjson for JSON reads and writes when it is installed
         """
         self.error_handler = error_handler
+        self._json_dumps = json_dumps if fast_json else self._stdlib_json_dumps
+        self._json_loads = json_loads if fast_json else json.loads
         self._locks = {}  # Track file locks
         self._lock_mutex = threading.Lock()
     
+    @staticmethod
+    def _stdlib_json_dumps(data: Any, indent: Optional[int] = 2, sort_keys: bool = True) -> str:
+        """Serialize data with the standard library encoder"""
+        return json.dumps(data, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+    
     @contextmanager
     def file_lock(self, file_path: Union[str, Path], timeout: float = 10.0):
         """
@@ -250,7 +306,7 @@ class SafeFileOperations:
             True if successful, False otherwise
         """
         try:
-            json_content = json.dumps(data, indent=indent, sort_keys=True, ensure_ascii=False)
+            json_content = self._json_dumps(data, indent=indent, sort_keys=True)
             return self.atomic_write_text(file_path, json_content, backup=backup)
         except (TypeError, ValueError) as e:
             if self.error_handler:
@@ -311,7 +367,7 @@ class SafeFileOperations:
             return default
         
         try:
-            return json.loads(content)
+            return self._json_loads(content)
         except (json.JSONDecodeError, ValueError) as e:
             if self.error_handler:
                 self.error_handler.log_error(f"JSON parsing error for {file_path}: {str(e)}")
@@ -322,7 +378,7 @@ class SafeFileOperations:
                 try:
                     backup_content = self.safe_read_text(backup_path)
                     if backup_content:
-                        backup_data = json.loads(backup_content)
+                        backup_data = self._json_loads(backup_content)
                         if self.error_handler:
                             self.error_handler.log_info(f"Restored JSON data from backup for {file_path}")
                         return backup_data
@@ -4,356 +4,1813 @@ Interactive Git Wrapper - A user-friendly interface for Git operations
 Usage: gw [command] or just gw for interactive mode
 """
 
+import atexit
+import configparser
+import copy
+import dataclasses
+import functools
 import subprocess
 import sys
 import os
 import json
+import re
+import shlex
+import shutil
+import threading
 import time
+import types
+import weakref
 import platform
 import locale
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path, PurePath
 from typing import Dict, Any, List, Optional, Union, Tuple
 
+# Line editing for free-text prompts; not available on all platforms (e.g. Windows)
+try:
+    import readline  # noqa: F401
+except ImportError:
+    readline = None
+
 # Import feature managers (lazy loading to avoid circular imports)
 from features.base_manager import BaseFeatureManager
-from features.input_validator import InputValidator
+from features.input_validator import InputValidator, InputValidationError
 from features.timeout_handler import TimeoutHandler, timeout_context
-from features.safe_file_operations import SafeFileOperations
+from features.safe_file_operations import SafeFileOperations, json_dumps, json_loads
 from features.git_command_executor import GitCommandExecutor, GitCommandConfig, RetryStrategy
 
-class InteractiveGitWrapper:
-    def __init__(self):
-        # Initialize platform-specific settings
-        self.platform_info = self._detect_platform()
-        
-        # Set up configuration file path with platform-specific handling
-        self.config_file = self._get_config_file_path()
-        
-        # Initialize encoding settings for Unicode support
-        self._setup_encoding()
-        
-        self.load_config()
-        self.check_git_available()
-        
-        # Initialize input validator and timeout handler
-        self.input_validator = InputValidator()
-        self.timeout_handler = TimeoutHandler()
-        self.safe_file_ops = SafeFileOperations()
-        
-        # Initialize Git command executor
-        self.git_executor = GitCommandExecutor(
-            error_handler=None,  # Will be set later when error handler is available
-            timeout_handler=self.timeout_handler,
-            input_validator=self.input_validator
-        )
-        
-        # Initialize feature managers (lazy loading)
-        self._feature_managers = {}
-        self._features_initialized = False
-    
-    def load_config(self):
-        """Load user configuration with comprehensive feature support"""
-        # Initialize default configuration with all features
-        self.config = self._get_default_config()
-        
-        if self.config_file.exists():
-            try:
-                # Use safe file operations for loading configuration
-                loaded_config = self.safe_file_ops.safe_read_json(self.config_file)
-                
-                if loaded_config is not None:
-                    # Perform deep merge of configuration
-                    self._deep_merge_config(self.config, loaded_config)
-                    
-                    # Perform configuration migration if needed
-                    self._migrate_config()
-                else:
-                    self.print_error("Error loading configuration: Invalid or corrupted file")
-                    self.print_info("Using default configuration")
-                    
-            except Exception as e:
-                self.print_error(f"Error loading configuration: {str(e)}")
-                self.print_info("Using default configuration")
-        
-        # Validate configuration after loading
-        self._validate_config()
-    
-    def _get_default_config(self) -> Dict[str, Any]:
-        """Get comprehensive default configuration for all features"""
-        return {
-            'name': '', 
-            'email': '', 
-            'default_branch': 'main',
-            'auto_push': True, 
-            'show_emoji': True, 
-            'default_remote': 'origin',
-            'config_version': '2.0',  # Track config version for migrations
-            'advanced_features': {
-                'stash_management': {
-                    'auto_name_stashes': True,
-                    'max_stashes': 50,
-                    'show_preview_lines': 10,
-                    'confirm_deletions': True,
-                    'auto_cleanup_old': False,
-                    'cleanup_days': 30
-                },
-                'commit_templates': {
-                    'default_template': 'conventional',
-                    'auto_suggest': True,
-                    'validate_conventional': True,
-                    'custom_templates_enabled': True,
-                    'template_categories': ['feat', 'fix', 'docs', 'style', 'refactor', 'test', 'chore'],
-                    'require_scope': False,
-                    'require_body': False
-                },
-                'branch_workflows': {
-                    'default_workflow': 'github_flow',
-                    'auto_track_remotes': True,
-                    'base_branch': 'main',
-                    'feature_prefix': 'feature/',
-                    'hotfix_prefix': 'hotfix/',
-                    'release_prefix': 'release/',
-                    'auto_cleanup_merged': True,
-                    'confirm_branch_deletion': True
-                },
-                'conflict_resolution': {
-                    'preferred_editor': 'code',
-                    'auto_stage_resolved': True,
-                    'show_conflict_markers': True,
-                    'backup_before_resolve': True,
-                    'preferred_merge_tool': 'vimdiff',
-                    'auto_continue_merge': False
-                },
-                'health_dashboard': {
-                    'stale_branch_days': 30,
-                    'large_file_threshold_mb': 10,
-                    'auto_refresh': True,
-                    'show_contributor_stats': True,
-                    'check_remote_branches': True,
-                    'warn_large_repo_size_gb': 1.0,
-                    'max_branches_to_analyze': 100
-                },
-                'backup_system': {
-                    'backup_remotes': ['backup', 'mirror'],
-                    'auto_backup_branches': ['main', 'develop'],
-                    'retention_days': 90,
-                    'backup_frequency': 'daily',
-                    'compress_backups': True,
-                    'verify_backup_integrity': True,
-                    'notification_on_failure': True,
-                    'max_backup_size_gb': 5.0
-                }
-            },
-            'platform': self.get_platform_specific_config() if hasattr(self, 'platform_info') else {}
-        }
-    
-    def _deep_merge_config(self, base_config: Dict, loaded_config: Dict) -> None:
-        """
-        Perform deep merge of configuration dictionaries.
-        
-        Args:
-            base_config: Base configuration to merge into
-            loaded_config: Loaded configuration to merge from
-        """
-        for key, value in loaded_config.items():
-            if key in base_config and isinstance(base_config[key], dict) and isinstance(value, dict):
-                self._deep_merge_config(base_config[key], value)
-            else:
-                base_config[key] = value
-    
-    def _migrate_config(self) -> None:
-        """Migrate configuration from older versions if needed"""
-        current_version = self.config.get('config_version', '1.0')
-        
-        if current_version == '1.0':
-            self.print_info("Migrating configuration to version 2.0...")
-            
-            # Migrate old advanced_features structure if it exists
-            if 'advanced_features' in self.config:
-                old_features = self.config['advanced_features']
-                new_features = self._get_default_config()['advanced_features']
-                
-                # Merge old settings with new defaults
-                for feature_name, feature_config in old_features.items():
-                    if feature_name in new_features:
-                        new_features[feature_name].update(feature_config)
-                
-                self.config['advanced_features'] = new_features
-            
-            # Update version
-            self.config['config_version'] = '2.0'
-            self.save_config()
-            self.print_success("Configuration migration completed!")
-    
-    def _validate_config(self) -> None:
-        """Validate configuration values and fix invalid ones"""
-        validation_rules = {
-            'advanced_features.stash_management.max_stashes': (1, 200),
-            'advanced_features.stash_management.show_preview_lines': (1, 50),
-            'advanced_features.stash_management.cleanup_days': (1, 365),
-            'advanced_features.commit_templates.template_categories': (list, None),
-            'advanced_features.branch_workflows.base_branch': (str, None),
-            'advanced_features.conflict_resolution.preferred_editor': (str, None),
-            'advanced_features.health_dashboard.stale_branch_days': (1, 365),
-            'advanced_features.health_dashboard.large_file_threshold_mb': (0.1, 1000),
-            'advanced_features.health_dashboard.warn_large_repo_size_gb': (0.1, 100),
-            'advanced_features.health_dashboard.max_branches_to_analyze': (10, 1000),
-            'advanced_features.backup_system.retention_days': (1, 3650),
-            'advanced_features.backup_system.max_backup_size_gb': (0.1, 100),
-        }
-        
-        for config_path, (min_val, max_val) in validation_rules.items():
-            try:
-                value = self._get_nested_config_value(config_path)
-                if value is not None:
-                    if isinstance(min_val, type):
-                        # Type validation
-                        if not isinstance(value, min_val):
-                            self._set_nested_config_value(config_path, self._get_default_for_path(config_path))
-                    elif isinstance(min_val, (int, float)) and isinstance(value, (int, float)):
-                        # Range validation
-                        if value < min_val or (max_val and value > max_val):
-                            self._set_nested_config_value(config_path, min_val)
-            except Exception:
-                # Reset to default if validation fails
-                self._set_nested_config_value(config_path, self._get_default_for_path(config_path))
-    
-    def _get_nested_config_value(self, config_path: str) -> Any:
-        """Get a nested configuration value using dot notation"""
-        keys = config_path.split('.')
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return None
-        return value
-    
-    def _set_nested_config_value(self, config_path: str, value: Any) -> None:
-        """Set a nested configuration value using dot notation"""
-        keys = config_path.split('.')
-        config = self.config
-        for key in keys[:-1]:
-            if key not in config:
-                config[key] = {}
-            config = config[key]
-        config[keys[-1]] = value
-    
-    def _get_default_for_path(self, config_path: str) -> Any:
-        """Get default value for a configuration path"""
-        default_config = self._get_default_config()
-        keys = config_path.split('.')
-        value = default_config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return None
-        return value
-    
-    def save_config(self):
-        """Save user configuration with atomic operations, validation and backup"""
-        try:
-            # Validate config before saving
-            self._validate_config()
-            
-            # Use safe file operations for atomic write with backup
-            success = self.safe_file_ops.atomic_write_json(
-                self.config_file, 
-                self.config, 
-                indent=2, 
-                backup=True
-            )
-            
-            if not success:
-                self.print_error("Failed to save configuration")
-                return
-            
-            # Verify the saved configuration
-            if not self._verify_saved_config():
-                self.print_error("Configuration verification failed after save")
-            
-            # Clean up old backup files (keep last 3)
-            self.safe_file_ops.cleanup_old_backups(self.config_file, max_backups=3)
-                
-        except Exception as e:
-            self.print_error(f"Unexpected error saving configuration: {str(e)}")
-    
-    def _verify_saved_config(self) -> bool:
-        """
-        Verify that the saved configuration is valid and can be loaded.
-        
-        Returns:
-            True if configuration is valid, False otherwise
-        """
-        try:
-            # Use safe file operations to read and verify
-            loaded_config = self.safe_file_ops.safe_read_json(self.config_file)
-            
-            if loaded_config is None:
-                raise ValueError("Could not load saved configuration")
-            
-            # Basic validation - ensure it's a dictionary
-            if not isinstance(loaded_config, dict):
-                raise ValueError("Configuration is not a valid dictionary")
-            
-            # Check for required keys
-            required_keys = ['name', 'email', 'default_branch']
-            for key in required_keys:
-                if key not in loaded_config:
-                    self.print_error(f"Warning: Missing required configuration key: {key}")
-            
-            return True
-            
-        except Exception as e:
-            self.print_error(f"Configuration verification failed: {str(e)}")
-            return False
-    
-    def export_config(self, export_path: Optional[str] = None) -> bool:
-        """
-        Export configuration to a file.
-        
-        Args:
-            export_path: Path to export to, defaults to gitwrapper_config_export.json
-            
-        Returns:
-            True if successful, False otherwise
-        """
+# Resolved git executable, shared by every wrapper instance in this process
+# ('' once a lookup has failed)
+_GIT_PATH = None
+
+
+def _resolve_git_path() -> Optional[str]:
+    """Locate git on PATH once per process without spawning a subprocess"""
+    global _GIT_PATH
+    if _GIT_PATH is None:
+        _GIT_PATH = shutil.which('git') or ''
+    return _GIT_PATH or None
+
+
+# Cached result of `git --version` as a tuple of ints (empty if unknown)
+_GIT_VERSION = None
+
+
+def _git_version() -> Tuple[int, ...]:
+    """Probe the installed git version once per process"""
+    global _GIT_VERSION
+    if _GIT_VERSION is None:
+        _GIT_VERSION = ()
         try:
-            if not export_path:
-                export_path = "gitwrapper_config_export.json"
-            
-            export_file = Path(export_path)
-            
-            with open(export_file, 'w') as f:
-                json.dump(self.config, f, indent=2, sort_keys=True)
-            
-            self.print_success(f"Configuration exported to: {export_file.absolute()}")
-            return True
-            
-        except Exception as e:
-            self.print_error(f"Failed to export configuration: {str(e)}")
-            return False
-    
-    def import_config(self, import_path: str) -> bool:
-        """
-        Import configuration from a file.
+            result = subprocess.run([_resolve_git_path() or 'git', '--version'],
+                                    capture_output=True, text=True, check=False, timeout=10)
+            # e.g. "git version 2.39.2" or "git version 2.41.0.windows.1"
+            version = result.stdout.split()[2] if result.returncode == 0 else ''
+            _GIT_VERSION = tuple(int(part) for part in version.split('.')[:3] if part.isdigit())
+        except (OSError, subprocess.SubprocessError, IndexError):
+            pass
+    return _GIT_VERSION
+
+
+# General overview help page, written in one go by _show_help_page
+_HELP_TEXT = "📖 General Overview\n" + "=" * 20 + "\n" + """
+🚀 Interactive Git Wrapper - Advanced Git Management Tool
+
+This tool provides an intuitive interface for Git operations with advanced
+features for professional development workflows.
+
+🎯 Core Features:
+• Interactive menus for all Git operations
+• Multi-remote push support (single/multiple/all)
+• Advanced stash management with named stashes
+• Commit message templates with validation
+• Automated branch workflow management
+• Interactive conflict resolution assistant
+• Repository health monitoring and cleanup
+• Smart backup system with multiple destinations
+
+📊 Repository Status:
+The tool automatically detects Git repositories and shows:
+• Current branch and status
+• Uncommitted changes count
+• Available remotes and their status
+
+🔄 Workflow Integration:
+• Supports Git Flow, GitHub Flow, and GitLab Flow
+• Conventional commit message formatting
+• Automated branch lifecycle management
+• Conflict detection and resolution assistance
+
+🛡️ Safety Features:
+• Confirmation prompts for destructive operations
+• Automatic backups before major operations
+• Rollback capabilities for failed workflows
+• Input validation and error handling
+
+Created by Johannes Nguyen
+Enhanced with advanced Git workflow features
         
-        Args:
-            import_path: Path to import from
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            import_file = Path(import_path)
-            
-            if not import_file.exists():
-                self.print_error(f"Import file not found: {import_path}")
-                return False
+"""
+
+# Quick commands help page, written in one go by _show_help_page
+_HELP_QUICK_TEXT = "⚡ Quick Commands\n" + "=" * 18 + "\n" + """
+🚀 Command Line Usage:
+Run 'gw' followed by a command for quick access:
+
+📊 Basic Operations:
+• gw status     - Show detailed repository status
+• gw commit     - Quick commit with interactive message
+• gw sync       - Pull latest changes and push current branch
+• gw push       - Open push operations menu
+• gw config     - Open configuration management
+
+🗂️  Advanced Features (requires Git repository):
+• gw stash      - Open stash management interface
+• gw templates  - Access commit template system
+• gw workflows  - Manage branch workflows
+• gw conflicts  - Resolve merge conflicts interactively
+• gw health     - View repository health dashboard
+• gw backup     - Access smart backup system
+
+💡 Interactive Mode:
+• gw            - Launch full interactive menu system
+
+🔧 Configuration:
+• All commands respect your configuration settings
+• Use 'gw config' to customize behavior
+• Settings are saved automatically
+
+⌨️  Keyboard Shortcuts:
+• Ctrl+C        - Exit current operation
+• Enter         - Accept default values (shown in [brackets])
+• Tab           - Auto-complete where available
+
+🎯 Examples:
+gw status       # Quick status check
+gw commit       # Interactive commit process
+gw sync         # Pull and push in one command
+gw             # Full interactive experience
+        """ + "\n"
+
+# Stash management help page, written in one go by _show_help_page
+_HELP_STASH_TEXT = "🗂️  Stash Management Help\n" + "=" * 25 + "\n" + """
+🎯 Purpose:
+Advanced stash management with named stashes, search capabilities,
+and enhanced organization for temporary changes.
+
+✨ Key Features:
+• Named stashes with custom descriptions
+• Search stashes by name or content
+• Preview stash contents before applying
+• Organized stash listing with timestamps
+• Batch stash operations
+
+📋 Main Operations:
+
+1️⃣  Create Named Stash:
+   • Save current changes with a custom name
+   • Add optional description for context
+   • Automatically includes untracked files option
+
+2️⃣  List & Browse Stashes:
+   • View all stashes with names and timestamps
+   • See stash content preview
+   • Navigate through stash history
+
+3️⃣  Search Stashes:
+   • Find stashes by custom name
+   • Search within stash content
+   • Filter by date or file patterns
+
+4️⃣  Apply/Pop Stashes:
+   • Apply stash while keeping it in stash list
+   • Pop stash (apply and remove from list)
+   • Handle conflicts during application
+
+5️⃣  Stash Management:
+   • Delete individual stashes with confirmation
+   • Clean up old stashes automatically
+   • Export/import stash metadata
+
+🔧 Configuration Options:
+• auto_name_stashes: Automatically suggest names
+• max_stashes: Maximum number of stashes to keep
+• show_preview_lines: Lines to show in preview
+• confirm_deletions: Require confirmation for deletions
+
+💡 Best Practices:
+• Use descriptive names for stashes
+• Regular cleanup of old stashes
+• Preview before applying to avoid conflicts
+• Use search to quickly find specific changes
+
+🗃️  Storage:
+Stash metadata is stored in .git/gitwrapper_stashes.json
+        """ + "\n"
+
+# Commit templates help page, written in one go by _show_help_page
+_HELP_TEMPLATES_TEXT = "📝 Commit Templates Help\n" + "=" * 24 + "\n" + """
+🎯 Purpose:
+Standardize commit messages using predefined templates with
+support for Conventional Commits and custom formats.
+
+✨ Key Features:
+• Pre-built templates for common commit types
+• Conventional Commits format support
+• Custom template creation and management
+• Template validation and suggestions
+• Interactive template application
+
+📋 Built-in Templates:
+
+🚀 feat: New features
+   Format: feat(scope): description
+   Example: feat(auth): add user login system
+
+🐛 fix: Bug fixes
+   Format: fix(scope): description
+   Example: fix(api): handle null response errors
+
+📚 docs: Documentation changes
+   Format: docs(scope): description
+   Example: docs(readme): update installation guide
+
+🎨 style: Code style changes
+   Format: style(scope): description
+   Example: style(components): fix indentation
+
+♻️  refactor: Code refactoring
+   Format: refactor(scope): description
+   Example: refactor(utils): extract common functions
+
+✅ test: Test additions/changes
+   Format: test(scope): description
+   Example: test(auth): add login validation tests
+
+🔧 chore: Maintenance tasks
+   Format: chore(scope): description
+   Example: chore(deps): update dependencies
+
+🔧 Template Management:
+
+1️⃣  Select Template:
+   • Browse available templates by category
+   • Preview template structure
+   • See example usage
+
+2️⃣  Apply Template:
+   • Fill in template placeholders
+   • Validate conventional commit format
+   • Preview final commit message
+
+3️⃣  Custom Templates:
+   • Create your own templates
+   • Define required/optional fields
+   • Set validation rules
+
+4️⃣  Template Validation:
+   • Conventional Commits syntax checking
+   • Required field validation
+   • Format consistency checks
+
+🔧 Configuration Options:
+• default_template: Default template to suggest
+• auto_suggest: Automatically suggest templates
+• validate_conventional: Enable format validation
+• require_scope: Make scope field mandatory
+• require_body: Require commit body text
+
+💡 Best Practices:
+• Use consistent commit types across team
+• Include scope for better organization
+• Write clear, descriptive commit messages
+• Follow conventional commit format for automation
+
+🗃️  Storage:
+Templates are stored in ~/.gitwrapper_templates.json
+        """ + "\n"
+
+# Branch workflows help page, written in one go by _show_help_page
+_HELP_WORKFLOWS_TEXT = "🔀 Branch Workflows Help\n" + "=" * 24 + "\n" + """
+🎯 Purpose:
+Automate branch management following established Git workflows
+like Git Flow, GitHub Flow, and GitLab Flow.
+
+✨ Key Features:
+• Multiple workflow type support
+• Automated branch naming conventions
+• Merge strategy management
+• Remote tracking setup
+• Workflow rollback capabilities
+
+📋 Supported Workflows:
+
+🌊 Git Flow:
+   • feature/ branches for new features
+   • hotfix/ branches for urgent fixes
+   • release/ branches for version releases
+   • Automatic base branch detection (develop/main)
+
+🐙 GitHub Flow:
+   • Feature branches from main
+   • Pull request integration ready
+   • Simple merge back to main
+
+🦊 GitLab Flow:
+   • Environment-based branching
+   • Feature branches with environment promotion
+   • Release branch management
+
+🔧 Workflow Operations:
+
+1️⃣  Start Feature Branch:
+   • Automatically create from base branch
+   • Apply naming conventions
+   • Set up remote tracking
+   • Initialize branch metadata
+
+2️⃣  Work on Feature:
+   • Regular commit and push operations
+   • Conflict detection and resolution
+   • Progress tracking
+
+3️⃣  Finish Feature:
+   • Choose merge strategy (merge/rebase/squash)
+   • Automatic conflict resolution
+   • Clean up local and remote branches
+   • Update base branch
+
+4️⃣  Hotfix Management:
+   • Emergency fix workflows
+   • Automatic versioning
+   • Multi-branch deployment
+
+🔧 Merge Strategies:
+
+🔀 Merge Commit:
+   • Preserves branch history
+   • Clear feature boundaries
+   • Good for collaborative features
+
+📏 Rebase:
+   • Linear history
+   • Clean commit timeline
+   • Good for small features
+
+🗜️  Squash Merge:
+   • Single commit per feature
+   • Clean main branch history
+   • Good for atomic features
+
+🔧 Configuration Options:
+• default_workflow: Preferred workflow type
+• auto_track_remotes: Automatic remote setup
+• base_branch: Default base branch (main/develop)
+• feature_prefix: Branch naming prefix
+• auto_cleanup_merged: Clean up after merge
+
+💡 Best Practices:
+• Choose workflow that fits team size
+• Use descriptive branch names
+• Regular integration with base branch
+• Test before finishing features
+
+🗃️  Storage:
+Workflow config stored in .git/gitwrapper_workflows.json
+        """ + "\n"
+
+# Conflict resolution help page, written in one go by _show_help_page
+_HELP_CONFLICTS_TEXT = "⚔️  Conflict Resolution Help\n" + "=" * 27 + "\n" + """
+🎯 Purpose:
+Interactive assistance for resolving merge conflicts with
+visual tools and automated resolution strategies.
+
+✨ Key Features:
+• Visual conflict highlighting
+• Multiple resolution strategies
+• Editor integration
+• Conflict preview and comparison
+• Automated resolution for simple conflicts
+
+📋 Conflict Resolution Process:
+
+1️⃣  Conflict Detection:
+   • Automatic detection during merge operations
+   • List all conflicted files
+   • Show conflict summary and statistics
+
+2️⃣  Conflict Analysis:
+   • Preview conflicted sections
+   • Show both versions side-by-side
+   • Highlight conflict markers (<<<, ===, >>>)
+
+3️⃣  Resolution Strategies:
+
+   🏠 Accept Ours:
+   • Keep local version (current branch)
+   • Discard incoming changes
+   • Good for protecting local work
+
+   🌐 Accept Theirs:
+   • Keep remote version (merging branch)
+   • Discard local changes
+   • Good for accepting upstream changes
+
+   ✏️  Manual Edit:
+   • Open file in configured editor
+   • Manually resolve conflicts
+   • Full control over final result
+
+   🤖 Auto-resolve:
+   • Automatic resolution for simple conflicts
+   • Non-overlapping changes
+   • Safe merge of compatible changes
+
+4️⃣  Conflict Finalization:
+   • Stage resolved files
+   • Complete merge commit
+   • Verify resolution success
+
+🔧 Editor Integration:
+• Supports popular editors (VS Code, Vim, Emacs)
+• Syntax highlighting for conflict markers
+• Side-by-side diff view
+• Jump to next/previous conflict
+
+🔧 Advanced Features:
+
+🔍 Conflict Preview:
+   • Show conflicts without applying changes
+   • Compare different resolution strategies
+   • Preview final result
+
+🔄 Merge Tools:
+   • Integration with external merge tools
+   • Visual diff and merge interfaces
+   • Three-way merge support
+
+📊 Conflict Statistics:
+   • Number of conflicted files
+   • Types of conflicts (content, rename, delete)
+   • Resolution progress tracking
+
+🔧 Configuration Options:
+• preferred_editor: Default editor for manual resolution
+• auto_stage_resolved: Automatically stage resolved files
+• show_conflict_markers: Highlight conflict markers
+• backup_before_resolve: Create backup before resolution
+
+💡 Best Practices:
+• Understand both versions before resolving
+• Test resolved code before committing
+• Use meaningful commit messages for merges
+• Regular integration to minimize conflicts
+
+⚠️  Safety Features:
+• Automatic backups before resolution
+• Rollback capability for failed merges
+• Confirmation prompts for destructive actions
+        """ + "\n"
+
+# Repository health help page, written in one go by _show_help_page
+_HELP_HEALTH_TEXT = "🏥 Repository Health Help\n" + "=" * 26 + "\n" + """
+🎯 Purpose:
+Monitor repository health, identify issues, and provide
+cleanup recommendations for optimal Git repository maintenance.
+
+✨ Key Features:
+• Branch analysis and cleanup recommendations
+• Large file detection and management
+• Repository statistics and metrics
+• Stale branch identification
+• Automated health scoring
+
+📋 Health Dashboard Sections:
+
+1️⃣  Branch Analysis:
+   📊 Active Branches:
+   • List all local and remote branches
+   • Show ahead/behind status vs main branch
+   • Identify merge status and relationships
+
+   🗑️  Stale Branches:
+   • Find branches older than threshold (default: 30 days)
+   • Show last commit date and author
+   • Recommend branches for cleanup
+
+   🔀 Unmerged Branches:
+   • Identify branches not merged to main
+   • Show unique commits per branch
+   • Highlight potential work in progress
+
+2️⃣  Repository Statistics:
+   📈 Size Metrics:
+   • Total repository size
+   • Object count and pack statistics
+   • Growth trends over time
+
+   👥 Contributor Analysis:
+   • Active contributors and commit counts
+   • Contribution patterns and frequency
+   • Team collaboration metrics
+
+   📅 Activity Metrics:
+   • Commit frequency over time
+   • Peak activity periods
+   • Development velocity trends
+
+3️⃣  File Analysis:
+   📦 Large Files:
+   • Files exceeding size threshold (default: 10MB)
+   • Binary file detection and analysis
+   • Storage optimization recommendations
+
+   🗂️  File Type Distribution:
+   • Code vs documentation vs assets
+   • Language distribution statistics
+   • File organization insights
+
+4️⃣  Health Scoring:
+   🎯 Overall Score:
+   • Composite health score (0-100)
+   • Weighted scoring across categories
+   • Trend analysis over time
+
+   ⚠️  Issue Categories:
+   • Critical: Immediate attention required
+   • Warning: Should be addressed soon
+   • Info: Optimization opportunities
+
+📋 Cleanup Recommendations:
+
+🧹 Automated Cleanup:
+• Delete merged branches
+• Remove stale remote tracking branches
+• Clean up unreferenced objects
+• Optimize repository packing
+
+🔍 Manual Review:
+• Large files that could be moved to LFS
+• Branches that might need merging
+• Contributors who might need access review
+• Configuration optimizations
+
+🔧 Configuration Options:
+• stale_branch_days: Days before branch considered stale
+• large_file_threshold_mb: Size threshold for large files
+• auto_refresh: Automatically refresh dashboard
+• show_contributor_stats: Include contributor analysis
+• max_branches_to_analyze: Limit for performance
+
+📊 Export Options:
+• JSON format for automation
+• Text report for documentation
+• CSV format for spreadsheet analysis
+• Integration with external tools
+
+💡 Best Practices:
+• Regular health checks (weekly/monthly)
+• Address critical issues promptly
+• Use cleanup recommendations as guidelines
+• Monitor trends over time
+
+🔄 Automation:
+• Schedule regular health checks
+• Set up alerts for critical issues
+• Integrate with CI/CD pipelines
+• Export metrics for monitoring systems
+        """ + "\n"
+
+# Smart backup help page, written in one go by _show_help_page
+_HELP_BACKUP_TEXT = "💾 Smart Backup Help\n" + "=" * 20 + "\n" + """
+🎯 Purpose:
+Automated backup system for protecting important branches
+with multiple destinations and intelligent scheduling.
+
+✨ Key Features:
+• Multiple backup destinations
+• Scheduled and event-based backups
+• Backup verification and integrity checks
+• Restoration with conflict detection
+• Retention policy management
+
+📋 Backup System Components:
+
+1️⃣  Backup Configuration:
+   🎯 Backup Remotes:
+   • Configure multiple backup destinations
+   • Support for different remote types (Git, cloud)
+   • Automatic remote verification and testing
+
+   📅 Backup Schedules:
+   • Time-based: Daily, weekly, monthly
+   • Event-based: Before major operations
+   • Manual: On-demand backup creation
+
+   🎛️  Backup Policies:
+   • Which branches to backup automatically
+   • Retention periods for old backups
+   • Compression and optimization settings
+
+2️⃣  Backup Operations:
+   💾 Create Backup:
+   • Single branch or multiple branches
+   • Full repository or incremental
+   • Metadata and configuration backup
+
+   📋 List Backups:
+   • View all available backup versions
+   • Show backup dates and contents
+   • Compare backup versions
+
+   🔄 Restore Backup:
+   • Restore specific branches or entire repository
+   • Conflict detection with current state
+   • Selective restoration options
+
+3️⃣  Backup Types:
+
+   🔄 Incremental Backups:
+   • Only backup changes since last backup
+   • Faster backup process
+   • Efficient storage usage
+
+   📦 Full Backups:
+   • Complete repository backup
+   • Independent restore capability
+   • Higher storage requirements
+
+   🎯 Selective Backups:
+   • Backup specific branches only
+   • Custom file inclusion/exclusion
+   • Metadata-only backups
+
+4️⃣  Backup Destinations:
+
+   🌐 Remote Git Repositories:
+   • GitHub, GitLab, Bitbucket
+   • Self-hosted Git servers
+   • Multiple remote redundancy
+
+   ☁️  Cloud Storage:
+   • Integration with cloud providers
+   • Encrypted backup storage
+   • Cross-region redundancy
+
+   💽 Local Storage:
+   • External drives and NAS
+   • Network attached storage
+   • Local backup verification
+
+🔧 Advanced Features:
+
+🔐 Security:
+• Backup encryption options
+• Secure credential management
+• Access control and permissions
+
+📊 Monitoring:
+• Backup success/failure notifications
+• Storage usage monitoring
+• Backup performance metrics
+
+🔄 Automation:
+• Pre-commit backup hooks
+• CI/CD integration
+• Automated testing of backups
+
+🔧 Configuration Options:
+• backup_remotes: List of backup destinations
+• auto_backup_branches: Branches to backup automatically
+• retention_days: How long to keep backups
+• backup_frequency: How often to backup
+• compress_backups: Enable backup compression
+• verify_backup_integrity: Verify backup after creation
+
+💡 Best Practices:
+• Multiple backup destinations for redundancy
+• Regular backup verification and testing
+• Appropriate retention policies
+• Monitor backup storage usage
+• Test restoration procedures regularly
+
+⚠️  Important Notes:
+• Backups include commit history and metadata
+• Large repositories may take time to backup
+• Network connectivity required for remote backups
+• Verify backup integrity regularly
+
+🗃️  Storage:
+Backup logs stored in ~/.gitwrapper_backups.log
+        """ + "\n"
+
+# Configuration help page, written in one go by _show_help_page
+_HELP_CONFIG_TEXT = "🔧 Configuration Help\n" + "=" * 21 + "\n" + """
+🎯 Purpose:
+Comprehensive configuration management for all Git Wrapper
+features with validation, import/export, and reset capabilities.
+
+✨ Key Features:
+• Feature-specific configuration sections
+• Configuration validation and migration
+• Import/export configuration profiles
+• Reset to defaults with granular control
+• Interactive configuration menus
+
+📋 Configuration Categories:
+
+1️⃣  Basic Settings:
+   👤 User Information:
+   • name: Your name for commits
+   • email: Your email for commits
+   • default_branch: Preferred default branch name
+
+   🎨 Interface Settings:
+   • show_emoji: Enable/disable emoji in output
+   • auto_push: Automatically push after commits
+   • default_remote: Preferred remote for operations
+
+2️⃣  Advanced Feature Settings:
+
+   🗂️  Stash Management:
+   • auto_name_stashes: Suggest names automatically
+   • max_stashes: Maximum stashes to keep
+   • show_preview_lines: Lines in stash preview
+   • confirm_deletions: Require deletion confirmation
+
+   📝 Commit Templates:
+   • default_template: Default template type
+   • auto_suggest: Automatically suggest templates
+   • validate_conventional: Enable format validation
+   • require_scope: Make scope field mandatory
+
+   🔀 Branch Workflows:
+   • default_workflow: Preferred workflow type
+   • auto_track_remotes: Automatic remote tracking
+   • base_branch: Default base branch
+   • auto_cleanup_merged: Clean up after merge
+
+   ⚔️  Conflict Resolution:
+   • preferred_editor: Default editor for conflicts
+   • auto_stage_resolved: Auto-stage resolved files
+   • show_conflict_markers: Highlight markers
+   • backup_before_resolve: Create safety backups
+
+   🏥 Repository Health:
+   • stale_branch_days: Days before branch is stale
+   • large_file_threshold_mb: Large file size limit
+   • auto_refresh: Auto-refresh dashboard
+   • max_branches_to_analyze: Analysis limit
+
+   💾 Smart Backup:
+   • backup_remotes: List of backup destinations
+   • auto_backup_branches: Branches to backup
+   • retention_days: Backup retention period
+   • backup_frequency: How often to backup
+
+🔧 Configuration Management:
+
+📝 Interactive Configuration:
+• Feature-by-feature configuration menus
+• Input validation and help text
+• Preview changes before saving
+• Undo/redo configuration changes
+
+📤 Export Configuration:
+• Export to JSON file for sharing
+• Create configuration templates
+• Backup current configuration
+• Share team configuration standards
+
+📥 Import Configuration:
+• Import from JSON file
+• Merge with existing configuration
+• Validate imported settings
+• Apply team configuration standards
+
+🔄 Reset Configuration:
+• Reset all settings to defaults
+• Reset specific feature settings
+• Selective configuration reset
+• Confirmation prompts for safety
+
+🔧 Configuration Files:
+
+🏠 User Configuration:
+Location: ~/.gitwrapper_config.json
+• Global settings for all repositories
+• User preferences and defaults
+• Feature enable/disable settings
+
+🗂️  Repository-Specific:
+Location: .git/gitwrapper_*.json
+• Repository-specific overrides
+• Local workflow configurations
+• Project-specific settings
+
+📋 Configuration Validation:
+
+✅ Automatic Validation:
+• Type checking for all values
+• Range validation for numeric settings
+• Path validation for file/directory settings
+• Format validation for structured data
+
+🔧 Migration Support:
+• Automatic migration between versions
+• Backward compatibility maintenance
+• Configuration upgrade notifications
+• Safe migration with backups
+
+💡 Best Practices:
+• Regular configuration backups
+• Team configuration standardization
+• Feature-specific customization
+• Performance-conscious settings
+
+🔧 Troubleshooting:
+• Configuration validation errors
+• Reset to defaults if corrupted
+• Import/export for configuration transfer
+• Debug mode for detailed logging
+
+🗃️  Storage:
+Main config: ~/.gitwrapper_config.json
+Backups: ~/.gitwrapper_config.json.backup
+        """ + "\n"
+
+# Tips and best practices page, written in one go by _show_help_page
+_HELP_TIPS_TEXT = "💡 Tips & Best Practices\n" + "=" * 26 + "\n" + """
+🎯 General Usage Tips:
+
+⌨️  Navigation:
+• Use Ctrl+C to exit any operation safely
+• Default values are shown in [brackets] - just press Enter
+• Numbers in menus correspond to options
+• Most operations have confirmation prompts
+
+🔄 Workflow Efficiency:
+• Use quick commands (gw status, gw commit) for speed
+• Set up default remote to avoid repeated selections
+• Enable auto_push for streamlined commits
+• Use named stashes for better organization
+
+📋 Feature-Specific Best Practices:
+
+🗂️  Stash Management:
+• Use descriptive names for stashes
+• Regular cleanup prevents clutter
+• Preview stashes before applying
+• Search functionality saves time with many stashes
+
+📝 Commit Templates:
+• Adopt Conventional Commits for consistency
+• Use scopes to organize changes by component
+• Create custom templates for team standards
+• Enable validation to catch format errors
+
+🔀 Branch Workflows:
+• Choose workflow that matches team size
+• Use feature branches for all new work
+• Regular integration prevents large conflicts
+• Clean up merged branches promptly
+
+⚔️  Conflict Resolution:
+• Understand both sides before resolving
+• Use preview to see conflict context
+• Test resolved code before committing
+• Keep merge commits descriptive
+
+🏥 Repository Health:
+• Run health checks regularly (weekly/monthly)
+• Address critical issues promptly
+• Use cleanup recommendations as guidelines
+• Monitor repository growth trends
+
+💾 Smart Backup:
+• Set up multiple backup destinations
+• Test restoration procedures regularly
+• Use appropriate retention policies
+• Monitor backup success/failure
+
+🔧 Performance Tips:
+
+⚡ Speed Optimization:
+• Use quick commands for common operations
+• Enable lazy loading for large repositories
+• Set reasonable limits for analysis operations
+• Use incremental backups for large repos
+
+💾 Storage Management:
+• Regular cleanup of stale branches
+• Monitor large files and consider Git LFS
+• Use repository health dashboard insights
+• Optimize Git configuration for your workflow
+
+🛡️ Safety Practices:
+
+🔒 Data Protection:
+• Always backup before major operations
+• Use confirmation prompts for destructive actions
+• Test in feature branches before main
+• Keep multiple backup destinations
+
+🔍 Quality Assurance:
+• Use commit templates for consistency
+• Regular conflict resolution practice
+• Monitor repository health metrics
+• Validate configuration changes
+
+👥 Team Collaboration:
+
+🤝 Team Standards:
+• Share configuration profiles
+• Establish commit message standards
+• Use consistent branch naming
+• Regular repository health reviews
+
+📚 Documentation:
+• Document custom workflows
+• Share best practices with team
+• Keep configuration changes documented
+• Regular training on advanced features
+
+🔧 Troubleshooting:
+
+🐛 Common Issues:
+• Configuration corruption: Reset to defaults
+• Feature not working: Check initialization
+• Performance issues: Adjust limits in config
+• Backup failures: Verify remote connectivity
+
+🔍 Debug Mode:
+• Enable debug mode for detailed logging
+• Check feature status in configuration menu
+• Verify Git repository status
+• Review error messages carefully
+
+📞 Getting Help:
+• Use context-sensitive help in feature menus
+• Check configuration validation messages
+• Review operation logs for errors
+• Reset problematic features to defaults
+
+🚀 Advanced Usage:
+
+🔧 Customization:
+• Create custom commit templates
+• Configure workflow-specific settings
+• Set up automated backup schedules
+• Customize health check thresholds
+
+🔗 Integration:
+• Use with existing Git workflows
+• Integrate with CI/CD pipelines
+• Export metrics for monitoring
+• Share configurations across team
+
+Remember: This tool is designed to enhance your Git workflow,
+not replace Git knowledge. Understanding Git fundamentals
+will help you use these features more effectively!
+        """ + "\n"
+
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Build a mutable copy of a frozen value (the inverse of _freeze)"""
+    if isinstance(value, types.MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Default configuration, built once and shared read-only; _get_default_config
+# hands out mutable copies with the platform settings added
+_DEFAULT_CONFIG_TEMPLATE = _freeze({
+    'name': '', 
+    'email': '', 
+    'default_branch': 'main',
+    'auto_push': True, 
+    'show_emoji': True, 
+    'default_remote': 'origin',
+    'clone_jobs': 0,  # Parallel submodule fetches for clone; 0 = one per CPU
+    'clone_filter': '',  # Partial clone filter, e.g. 'blob:none' or 'tree:0'
+    'clone_depth': 0,  # Shallow clone depth; 0 = full history
+    'verify_on_save': False,  # Re-read the config file after each save
+    'no_pause': False,  # Skip "Press Enter to continue" prompts after actions
+    'config_version': '2.0',  # Track config version for migrations
+    'advanced_features': {
+        'stash_management': {
+            'auto_name_stashes': True,
+            'max_stashes': 50,
+            'show_preview_lines': 10,
+            'confirm_deletions': True,
+            'auto_cleanup_old': False,
+            'cleanup_days': 30
+        },
+        'commit_templates': {
+            'default_template': 'conventional',
+            'auto_suggest': True,
+            'validate_conventional': True,
+            'custom_templates_enabled': True,
+            'template_categories': ['feat', 'fix', 'docs', 'style', 'refactor', 'test', 'chore'],
+            'require_scope': False,
+            'require_body': False
+        },
+        'branch_workflows': {
+            'default_workflow': 'github_flow',
+            'auto_track_remotes': True,
+            'base_branch': 'main',
+            'feature_prefix': 'feature/',
+            'hotfix_prefix': 'hotfix/',
+            'release_prefix': 'release/',
+            'auto_cleanup_merged': True,
+            'confirm_branch_deletion': True
+        },
+        'conflict_resolution': {
+            'preferred_editor': 'code',
+            'auto_stage_resolved': True,
+            'show_conflict_markers': True,
+            'backup_before_resolve': True,
+            'preferred_merge_tool': 'vimdiff',
+            'auto_continue_merge': False
+        },
+        'health_dashboard': {
+            'stale_branch_days': 30,
+            'large_file_threshold_mb': 10,
+            'auto_refresh': True,
+            'show_contributor_stats': True,
+            'check_remote_branches': True,
+            'warn_large_repo_size_gb': 1.0,
+            'max_branches_to_analyze': 100
+        },
+        'backup_system': {
+            'backup_remotes': ['backup', 'mirror'],
+            'auto_backup_branches': ['main', 'develop'],
+            'retention_days': 90,
+            'backup_frequency': 'daily',
+            'compress_backups': True,
+            'verify_backup_integrity': True,
+            'notification_on_failure': True,
+            'max_backup_size_gb': 5.0
+        }
+    }
+})
+
+
+@functools.lru_cache(maxsize=128)
+def _split_path(config_path: str) -> Tuple[str, ...]:
+    """Split a dotted configuration path into interned keys (cached per path)"""
+    return tuple(map(sys.intern, config_path.split('.')))
+
+
+@functools.lru_cache(maxsize=64)
+def _default_for_path(config_path: str) -> Any:
+    """Look up a frozen default value by dotted path, or None if it does not exist"""
+    value = _DEFAULT_CONFIG_TEMPLATE
+    for key in _split_path(config_path):
+        if isinstance(value, types.MappingProxyType) and key in value:
+            value = value[key]
+        else:
+            return None
+    return value
+
+
+# Marks a config path that does not resolve, as distinct from a stored None
+_MISSING = object()
+
+
+def _get_in(config: Dict[str, Any], keys: Tuple[str, ...], default: Any = None) -> Any:
+    """Walk nested dicts along keys, returning default if any key is missing"""
+    value = config
+    for key in keys:
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            return default
+    return value
+
+
+def _range_rule(min_val, max_val):
+    """Validator clamping out-of-range numbers to min_val (max_val of None means unbounded)"""
+    def check(value):
+        if isinstance(value, (int, float)) and (value < min_val or (max_val and value > max_val)):
+            return min_val
+        return value
+    return check
+
+
+def _type_rule(expected: type, config_path: str):
+    """Validator replacing values of the wrong type with the default for config_path"""
+    def check(value):
+        if not isinstance(value, expected):
+            return _thaw(_default_for_path(config_path))
+        return value
+    return check
+
+
+# Config validation rules: (min, max) numeric ranges or (type, None) type checks
+_VALIDATION_RULES = {
+    'clone_jobs': (0, 64),
+    'clone_filter': (str, None),
+    'clone_depth': (0, 1000000),
+    'advanced_features.stash_management.max_stashes': (1, 200),
+    'advanced_features.stash_management.show_preview_lines': (1, 50),
+    'advanced_features.stash_management.cleanup_days': (1, 365),
+    'advanced_features.commit_templates.template_categories': (list, None),
+    'advanced_features.branch_workflows.base_branch': (str, None),
+    'advanced_features.conflict_resolution.preferred_editor': (str, None),
+    'advanced_features.health_dashboard.stale_branch_days': (1, 365),
+    'advanced_features.health_dashboard.large_file_threshold_mb': (0.1, 1000),
+    'advanced_features.health_dashboard.warn_large_repo_size_gb': (0.1, 100),
+    'advanced_features.health_dashboard.max_branches_to_analyze': (10, 1000),
+    'advanced_features.backup_system.retention_days': (1, 3650),
+    'advanced_features.backup_system.max_backup_size_gb': (0.1, 100),
+}
+
+# Rules compiled once into (dotted path, keys, validator); each validator returns
+# the value itself when it is valid, or its replacement
+_VALIDATION_PLAN = tuple(
+    (path, _split_path(path),
+     _type_rule(min_val, path) if isinstance(min_val, type) else _range_rule(min_val, max_val))
+    for path, (min_val, max_val) in _VALIDATION_RULES.items()
+)
+
+
+# Numbers accepted when editing a numeric feature setting: optional sign, digits
+# and an optional decimal part
+_NUM_RE = re.compile(r'^[+-]?(?:\d+(?:\.\d*)?|\.\d+)$')
+
+# Per-feature setting rules as (kind, low, high). kind is a range of accepted
+# integers, a type (numbers use low/high as an inclusive range, str uses low as
+# a minimum length, list means a list of strings) or a frozenset of allowed
+# string values
+_BOOL = (bool, None, None)
+_FEATURE_SCHEMA = {
+    'stash_management': {
+        'max_stashes': (range(1, 201), None, None),
+        'show_preview_lines': (range(1, 51), None, None),
+        'cleanup_days': (range(1, 366), None, None),
+        'auto_name_stashes': _BOOL,
+        'confirm_deletions': _BOOL,
+        'auto_cleanup_old': _BOOL,
+    },
+    'commit_templates': {
+        'default_template': (str, 1, None),
+        'auto_suggest': _BOOL,
+        'validate_conventional': _BOOL,
+        'custom_templates_enabled': _BOOL,
+        'template_categories': (list, None, None),
+        'require_scope': _BOOL,
+        'require_body': _BOOL,
+    },
+    'branch_workflows': {
+        'default_workflow': (frozenset({'git_flow', 'github_flow', 'gitlab_flow', 'custom'}), None, None),
+        'auto_track_remotes': _BOOL,
+        'base_branch': (str, 1, None),
+        'feature_prefix': (str, None, None),
+        'hotfix_prefix': (str, None, None),
+        'release_prefix': (str, None, None),
+        'auto_cleanup_merged': _BOOL,
+        'confirm_branch_deletion': _BOOL,
+    },
+    'conflict_resolution': {
+        'preferred_editor': (str, 1, None),
+        'auto_stage_resolved': _BOOL,
+        'show_conflict_markers': _BOOL,
+        'backup_before_resolve': _BOOL,
+        'preferred_merge_tool': (str, 1, None),
+        'auto_continue_merge': _BOOL,
+    },
+    'health_dashboard': {
+        'stale_branch_days': (range(1, 366), None, None),
+        'large_file_threshold_mb': ((int, float), 0.1, 1000),
+        'auto_refresh': _BOOL,
+        'show_contributor_stats': _BOOL,
+        'check_remote_branches': _BOOL,
+        'warn_large_repo_size_gb': ((int, float), 0.1, 100),
+        'max_branches_to_analyze': (range(10, 1001), None, None),
+    },
+    'backup_system': {
+        'backup_remotes': (list, None, None),
+        'auto_backup_branches': (list, None, None),
+        'retention_days': (range(1, 3651), None, None),
+        'backup_frequency': (frozenset({'manual', 'daily', 'weekly', 'monthly'}), None, None),
+        'compress_backups': _BOOL,
+        'verify_backup_integrity': _BOOL,
+        'notification_on_failure': _BOOL,
+        'max_backup_size_gb': ((int, float), 0.1, 100),
+    },
+}
+
+
+# stderr fragments of a push that needed a username, password, passphrase or
+# host key confirmation it was not allowed to ask for
+_AUTH_PROMPT_FAILURES = (
+    'terminal prompts disabled',
+    'could not read username',
+    'could not read password',
+    'authentication failed',
+    'permission denied',
+    'host key verification failed',
+)
+
+
+# Input format hints shown when a validator_type check fails
+_VALIDATION_HINTS = {
+    'branch_name': "Branch names cannot contain spaces or special characters like: ~ ^ : ? * [ \\ .. @{ // /. .lock",
+    'remote_name': "Remote names must contain only alphanumeric characters, hyphens, and underscores",
+    'file_path': "File paths cannot contain dangerous characters like: < > : \" | ? *",
+    'url': "URLs must start with http://, https://, git://, ssh://, file:// or be in SSH format (user@host:path)",
+    'email': "Email addresses must be in the format: user@domain.com",
+    'commit_hash': "Commit hashes must be 7-40 hexadecimal characters",
+    'tag_name': "Tag names must start with alphanumeric characters and can contain: _ - . /",
+    'semver': "Semantic versions must be in format: v1.2.3 or 1.2.3 (with optional pre-release/build metadata)"
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _pretty(key):
+    """Turn a snake_case config or feature key into its menu label, e.g. 'max_stashes' -> 'Max Stashes'"""
+    return key.replace('_', ' ').title()
+
+
+# Wrappers holding settings changes that are not on disk yet; one exit hook
+# writes them all without keeping the instances alive
+_UNSAVED_WRAPPERS = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_unsaved_wrappers():
+    """Write out pending settings changes of every live wrapper at exit"""
+    for wrapper in list(_UNSAVED_WRAPPERS):
+        wrapper._flush_config()
+
+
+# Menu verb for each editable feature setting kind; booleans toggle with Enable/Disable
+_FEATURE_SETTING_ACTIONS = {'number': 'Set', 'str': 'Change', 'list': 'Modify'}
+
+
+@functools.lru_cache(maxsize=64)
+def _feature_display_schema(shape):
+    """
+    Build display rows for a feature's settings, cached by the settings' shape.
+    
+    Args:
+        shape: Tuple of (key, value type) pairs in config order
+        
+    Returns:
+        Tuple of (key, display_key, kind) rows; kind is 'bool', 'number', 'str',
+        'list' or None for values the menu cannot edit
+    """
+    rows = []
+    for key, value_type in shape:
+        if issubclass(value_type, bool):
+            kind = 'bool'
+        elif issubclass(value_type, (int, float)):
+            kind = 'number'
+        elif issubclass(value_type, str):
+            kind = 'str'
+        elif issubclass(value_type, list):
+            kind = 'list'
+        else:
+            kind = None
+        rows.append((key, _pretty(key), kind))
+    return tuple(rows)
+
+
+def _feature_schema_for(feature_config):
+    """Return the cached display rows for a feature config dict"""
+    return _feature_display_schema(tuple((key, type(value)) for key, value in feature_config.items()))
+
+
+# Troubleshooting suggestions for failed git commands: stderr keywords map to
+# buckets, listed in the order their suggestions are shown
+_ERR_RE = re.compile(r'timed out|connection|network|resolve|timeout|permission|denied|not a git repository')
+_ERR_BUCKETS = {
+    'timed out': 'timeout',
+    'connection': 'network',
+    'network': 'network',
+    'resolve': 'network',
+    'timeout': 'network',
+    'permission': 'permission',
+    'denied': 'permission',
+    'not a git repository': 'repository',
+}
+_ERR_SUGGESTIONS = (
+    ('timeout', (
+        "Check your network connection for remote operations",
+        "Large repositories may require more time for operations",
+    )),
+    ('network', (
+        "Check your internet connection",
+        "Verify the remote repository URL is correct",
+        "Try using a different network or VPN",
+        "Check if firewall is blocking Git operations",
+    )),
+    ('permission', (
+        "Check file and directory permissions",
+        "Ensure you have write access to the repository",
+        "Verify SSH key configuration for remote repositories",
+        "Check if files are locked by another process",
+    )),
+    ('repository', (
+        "Initialize a Git repository with 'git init'",
+        "Navigate to a directory that contains a Git repository",
+        "Check if the .git directory exists and is not corrupted",
+    )),
+)
+_MERGE_SUGGESTIONS = (
+    "Check for merge conflicts that need manual resolution",
+    "Ensure working directory is clean before merge/rebase",
+    "Consider using conflict resolution tools",
+    "Try aborting and retrying the operation",
+)
+_OP_SUGGESTIONS = {
+    'push': (
+        "Ensure you have push permissions to the remote repository",
+        "Check if the remote branch exists or needs to be created",
+        "Try 'git pull' first to sync with remote changes",
+        "Verify your authentication credentials",
+    ),
+    'pull': (
+        "Check if there are uncommitted changes that need to be stashed",
+        "Verify the remote repository is accessible",
+        "Try 'git fetch' to test remote connectivity",
+        "Check for merge conflicts that need resolution",
+    ),
+    'clone': (
+        "Verify the repository URL is correct and accessible",
+        "Check if you have access permissions to the repository",
+        "Ensure you have sufficient disk space",
+        "Try cloning with --depth 1 for large repositories",
+    ),
+    'merge': _MERGE_SUGGESTIONS,
+    'rebase': _MERGE_SUGGESTIONS,
+}
+
+def _format_menu_options(options) -> str:
+    """Render numbered menu lines for a table of (label, method_name, args) options"""
+    return "\n".join(f"  {i}. {label}" for i, (label, _, _) in enumerate(options, 1))
+
+
+class InteractiveGitWrapper:
+    # Main menu options as (label, method_name, args); handlers are looked up
+    # by name at dispatch time
+    _REPO_BASE_OPTS = (
+        ("📊 Show Status", 'interactive_status', ()),
+        ("💾 Quick Commit", 'interactive_commit', ()),
+        ("🔄 Sync (Pull & Push)", 'interactive_sync', ()),
+        ("📤 Push Operations", 'interactive_push_menu', ()),
+        ("🌿 Branch Operations", 'interactive_branch_menu', ()),
+        ("📋 View Changes", 'interactive_diff', ()),
+        ("📜 View History", 'interactive_log', ()),
+        ("🔗 Remote Management", 'interactive_remote_menu', ()),
+    )
+    _REPO_ADV_OPTS = (
+        ("🗂️  Stash Management", '_handle_feature_menu', ('stash',)),
+        ("📝 Commit Templates", '_handle_feature_menu', ('templates',)),
+        ("🔀 Branch Workflows", '_handle_feature_menu', ('workflows',)),
+        ("⚔️  Conflict Resolution", '_handle_feature_menu', ('conflicts',)),
+        ("🏥 Repository Health", '_handle_feature_menu', ('health',)),
+        ("💾 Smart Backup", '_handle_feature_menu', ('backup',)),
+    )
+    _NOREPO_OPTS = (
+        ("🎯 Initialize Repository", 'interactive_init', ()),
+        ("📥 Clone Repository", 'interactive_clone', ()),
+    )
+    _TAIL_OPTS = (
+        ("⚙️ Configuration", 'interactive_config_menu', ()),
+        ("❓ Help", 'show_help', ()),
+        ("🚪 Exit", '_exit_wrapper', ()),
+    )
+    
+    _MENU_IN_REPO = _REPO_BASE_OPTS + _TAIL_OPTS
+    _MENU_IN_REPO_ADV = _REPO_BASE_OPTS + _REPO_ADV_OPTS + _TAIL_OPTS
+    _MENU_OUT_REPO = _NOREPO_OPTS + _TAIL_OPTS
+    
+    _MENU_IN_REPO_TEXT = _format_menu_options(_MENU_IN_REPO)
+    _MENU_IN_REPO_ADV_TEXT = _format_menu_options(_MENU_IN_REPO_ADV)
+    _MENU_OUT_REPO_TEXT = _format_menu_options(_MENU_OUT_REPO)
+    
+    # Main menu label -> (method name, args), for dispatch by label; labels rather
+    # than emoji key the table because some emoji are shared ("💾")
+    _MENU_HANDLERS = {label: (method_name, args)
+                      for label, method_name, args in _MENU_IN_REPO_ADV + _NOREPO_OPTS}
+    
+    # Prefixes for print_success/error/info/working; the instance copies follow
+    # the show_emoji setting (see _refresh_emoji_prefixes)
+    _EMOJI_PREFIXES = ("✅ ", "❌ ", "ℹ️  ", "🔄 ")
+    _emoji_success, _emoji_error, _emoji_info, _emoji_working = _EMOJI_PREFIXES
+    
+    # Repository detection cache: seconds an entry stays valid, and entries kept
+    _REPO_CACHE_TTL = 2.0
+    _REPO_CACHE_SIZE = 32
+    
+    # Seconds a local branch listing is reused before git is asked again
+    _BRANCH_CACHE_TTL = 2.0
+    
+    # Upper bound on concurrent `git push` processes when pushing to several remotes
+    _PUSH_WORKERS = 8
+    
+    # Fallback help topics, rendered once; None marks the entry that leaves the menu
+    _HELP_OPTS = (
+        ("📖 General Overview", '_show_help_page', (_HELP_TEXT,)),
+        ("⚡ Quick Commands", '_show_help_page', (_HELP_QUICK_TEXT,)),
+        ("🗂️  Stash Management Help", '_show_help_page', (_HELP_STASH_TEXT,)),
+        ("📝 Commit Templates Help", '_show_help_page', (_HELP_TEMPLATES_TEXT,)),
+        ("🔀 Branch Workflows Help", '_show_help_page', (_HELP_WORKFLOWS_TEXT,)),
+        ("⚔️  Conflict Resolution Help", '_show_help_page', (_HELP_CONFLICTS_TEXT,)),
+        ("🏥 Repository Health Help", '_show_help_page', (_HELP_HEALTH_TEXT,)),
+        ("💾 Smart Backup Help", '_show_help_page', (_HELP_BACKUP_TEXT,)),
+        ("🔧 Configuration Help", '_show_help_page', (_HELP_CONFIG_TEXT,)),
+        ("💡 Tips & Best Practices", '_show_help_page', (_HELP_TIPS_TEXT,)),
+        ("🚪 Back to Main Menu", None, ()),
+    )
+    _HELP_HEADER = "❓ Git Wrapper Help\n" + "=" * 25 + "\n"
+    _HELP_MENU_TEXT = "\nSelect help topic:\n" + _format_menu_options(_HELP_OPTS) + "\n"
+    _HELP_PROMPT = f"\nEnter choice (1-{len(_HELP_OPTS)}): "
+    
+    # Fixed option lists of the settings submenus
+    _LIST_EDIT_OPTS = ("Add Item", "Remove Item", "Clear All", "Done")
+    _IMPORT_EXPORT_OPTS = ("Export Configuration", "Import Configuration",
+                           "Show Current Config Path", "Back to configuration menu")
+    _RESET_OPTS = ("Reset Specific Feature", "Reset All Advanced Features",
+                   "Reset Everything", "Back to configuration menu")
+    
+    def __init__(self):
+        # Initialize platform-specific settings
+        self.platform_info = self._detect_platform()
+        
+        # Set up configuration file path with platform-specific handling
+        self.config_file = self._get_config_file_path()
+        
+        # Initialize encoding settings for Unicode support
+        self._setup_encoding()
+        
+        # Escape sequence used to clear the screen (None falls back to cls/clear)
+        self._clear_seq = self._detect_clear_sequence()
+        
+        # Config loading reads through safe file operations, so set them up first
+        self.safe_file_ops = SafeFileOperations()
+        
+        # Settings changes waiting to be written at the next menu boundary
+        self._config_dirty = False
+        
+        # Parsed config file contents as ((path, mtime_ns, size), config,
+        # whether it already passed validation)
+        self._config_cache = None
+        # Rendered all-features overview; dropped whenever the config is
+        # loaded, saved or scheduled for saving
+        self._overview_cache = None
+        self.load_config()
+        
+        # Initialize input validator and timeout handler
+        self.input_validator = InputValidator()
+        self.timeout_handler = TimeoutHandler()
+        
+        # Initialize Git command executor
+        self.git_executor = GitCommandExecutor(
+            error_handler=None,  # Will be set later when error handler is available
+            timeout_handler=self.timeout_handler,
+            input_validator=self.input_validator
+        )
+        
+        # Settings shared by every run_git_command call, and the per-call configs
+        # derived from it keyed by the values that vary
+        self._git_config_template = GitCommandConfig(
+            retry_strategy=RetryStrategy.EXPONENTIAL,
+            retry_delay=1.0,
+            max_retry_delay=10.0,
+            validate_command=True
+        )
+        self._git_command_configs = {}
+        
+        # Initialize feature managers (lazy loading)
+        self._feature_managers = {}
+        self._features_initialized = False
+        # Whether any feature manager loaded; fixed once initialization has run
+        self._has_adv = None
+        # Help feature manager, or False once it is known to be unavailable
+        self._help_system = None
+        
+        # Repository detection results as (git directory or '', probe time) keyed
+        # by working directory; a small LRU whose entries expire after a short TTL
+        self._repo_cwd_cache = OrderedDict()
+        
+        # Remote names keyed by working directory, as ((config mtime_ns, size), remotes)
+        self._remotes_cache = {}
+        
+        # Local branches keyed by working directory, as ((current, branches), list time);
+        # dropped after branch changes made here, otherwise expires after a short TTL
+        self._branch_cache = {}
+        
+        # Directory git commands run against (via `git -C`); None uses the process cwd.
+        # The main menu resolves it once; only _refresh_cwd (after a chdir) updates it
+        self._cwd = None
+        self._cwd_name = None
+        
+        # Error message to show on the next main menu frame
+        self._pending_error = None
+        
+        # Repository state captured right after a clone, consumed by _load_repo_snapshot
+        self._repo_state = None
+
+    
+    def load_config(self):
+        """Load user configuration with comprehensive feature support"""
+        # Write out any pending settings changes before reading the file back
+        self._flush_config()
+        self._overview_cache = None
+        
+        # Initialize default configuration with all features
+        self.config = self._get_default_config()
+        validated = False
+        
+        # One stat answers both whether there is anything to load and the
+        # cache key; a missing or empty file means defaults
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            stat = None
+        
+        if stat is not None and stat.st_size > 0:
+            try:
+                # Reuse the parsed file while it is unchanged on disk
+                key = (str(self.config_file), stat.st_mtime_ns, stat.st_size)
+                if self._config_cache and self._config_cache[0] == key:
+                    loaded_config = copy.deepcopy(self._config_cache[1])
+                    validated = self._config_cache[2]
+                else:
+                    # Use safe file operations for loading configuration
+                    loaded_config = self.safe_file_ops.safe_read_json(self.config_file)
+                    if loaded_config is not None:
+                        self._config_cache = (key, copy.deepcopy(loaded_config), False)
+                
+                if loaded_config is not None:
+                    # Perform deep merge of configuration
+                    self._deep_merge_config(self.config, loaded_config)
+                    
+                    # Perform configuration migration if needed
+                    self._migrate_config()
+                else:
+                    self.print_error("Error loading configuration: Invalid or corrupted file")
+                    self.print_info("Using default configuration")
+                    
+            except Exception as e:
+                self.print_error(f"Error loading configuration: {str(e)}")
+                self.print_info("Using default configuration")
+                validated = False
+        
+        # Validate configuration after loading, unless this exact file was written
+        # by save_config after passing the current validation rules
+        if not validated:
+            self._validate_config()
+        self._refresh_emoji_prefixes()
+    
+    def _get_default_config(self) -> Dict[str, Any]:
+        """Get comprehensive default configuration for all features"""
+        # Mutable copy of the shared template plus the detected platform settings
+        config = _thaw(_DEFAULT_CONFIG_TEMPLATE)
+        config['platform'] = self.get_platform_specific_config() if hasattr(self, 'platform_info') else {}
+        return config
+    
+    def _deep_merge_config(self, base_config: Dict, loaded_config: Dict) -> None:
+        """
+        Perform deep merge of configuration dictionaries.
+        
+        Args:
+            base_config: Base configuration to merge into
+            loaded_config: Loaded configuration to merge from
+        """
+        if not loaded_config or loaded_config is base_config:
+            return
+        
+        # Iterative walk over (base, overlay) pairs instead of one call per level
+        stack = [(base_config, loaded_config)]
+        while stack:
+            base, overlay = stack.pop()
+            if not any(isinstance(value, dict) for value in overlay.values()):
+                # Only leaf values at this level; nothing to descend into
+                base.update(overlay)
+                continue
+            for key, value in overlay.items():
+                base_value = base.get(key)
+                if base_value is value:
+                    continue
+                if isinstance(base_value, dict) and isinstance(value, dict):
+                    if value:
+                        stack.append((base_value, value))
+                else:
+                    base[key] = value
+    
+    def _migrate_config(self) -> None:
+        """Migrate configuration from older versions if needed"""
+        current_version = self.config.get('config_version', '1.0')
+        if current_version == _DEFAULT_CONFIG_TEMPLATE['config_version']:
+            return
+        
+        if current_version == '1.0':
+            self.print_info("Migrating configuration to version 2.0...")
+            
+            # Migrate old advanced_features structure if it exists
+            if 'advanced_features' in self.config:
+                old_features = self.config['advanced_features']
+                new_features = self._get_default_for_path('advanced_features')
+                
+                # Merge old settings with new defaults
+                for feature_name, feature_config in old_features.items():
+                    if feature_name in new_features:
+                        new_features[feature_name].update(feature_config)
+                
+                self.config['advanced_features'] = new_features
+            
+            # Update version
+            self.config['config_version'] = '2.0'
+            self.save_config()
+            self.print_success("Configuration migration completed!")
+    
+    def _validate_config(self) -> None:
+        """Validate configuration values and fix invalid ones"""
+        # Validators never raise and a resolved path only crosses dicts, so the
+        # setter below cannot fail; unresolved paths are left alone
+        for config_path, keys, check in _VALIDATION_PLAN:
+            value = _get_in(self.config, keys, _MISSING)
+            if value is _MISSING:
+                continue
+            new_value = check(value)
+            if new_value is not value:
+                self._set_nested_config_value(config_path, new_value)
+    
+    def _get_nested_config_value(self, config_path: str) -> Any:
+        """Get a nested configuration value using dot notation"""
+        return _get_in(self.config, _split_path(config_path))
+    
+    def _set_nested_config_value(self, config_path: str, value: Any) -> None:
+        """Set a nested configuration value using dot notation"""
+        keys = _split_path(config_path)
+        config = self.config
+        for key in keys[:-1]:
+            if key not in config:
+                config[key] = {}
+            config = config[key]
+        config[keys[-1]] = value
+    
+    def _get_default_for_path(self, config_path: str) -> Any:
+        """Get default value for a configuration path"""
+        # The lookup is cached on the frozen template; only the result is copied
+        return _thaw(_default_for_path(config_path))
+    
+    def save_config(self):
+        """Save user configuration with atomic operations, validation and backup"""
+        # This write covers any pending changes; a failed one stays pending
+        self._overview_cache = None
+        self._config_dirty = not self._save_config_now()
+        if self._config_dirty:
+            _UNSAVED_WRAPPERS.add(self)
+        else:
+            _UNSAVED_WRAPPERS.discard(self)
+    
+    def _save_config_now(self) -> bool:
+        """
+        Write the configuration to disk.
+        
+        Returns:
+            True if the file was written, False otherwise
+        """
+        try:
+            # Validate config before saving
+            self._validate_config()
+            self._refresh_emoji_prefixes()
+            
+            # Use safe file operations for atomic write with backup
+            success = self.safe_file_ops.atomic_write_json(
+                self.config_file, 
+                self.config, 
+                indent=2, 
+                backup=True
+            )
+            
+            if not success:
+                self.print_error("Failed to save configuration")
+                return False
+            
+            # Remember what was written so a reload skips parsing and validating it
+            stat = self.config_file.stat()
+            self._config_cache = ((str(self.config_file), stat.st_mtime_ns, stat.st_size),
+                                  copy.deepcopy(self.config), True)
+            
+            # The atomic write already compared the file with what was written;
+            # the full reload check is opt-in
+            if self.config.get('verify_on_save', False) and not self._verify_saved_config():
+                self.print_error("Configuration verification failed after save")
+            return True
+                
+        except Exception as e:
+            self.print_error(f"Unexpected error saving configuration: {str(e)}")
+            return False
+    
+    def _schedule_save(self) -> None:
+        """
+        Mark the configuration for saving at the next menu boundary.
+        
+        Rapid toggles in the settings menus are coalesced into a single write
+        when the user returns to the configuration or main menu; anything still
+        pending is written when the process exits.
+        """
+        self._config_dirty = True
+        self._overview_cache = None
+        _UNSAVED_WRAPPERS.add(self)
+    
+    def _flush_config(self) -> None:
+        """Write the configuration now if changes are pending"""
+        if self._config_dirty:
+            self.save_config()
+    
+    def _verify_saved_config(self) -> bool:
+        """
+        Verify that the saved configuration is valid and can be loaded.
+        
+        Returns:
+            True if configuration is valid, False otherwise
+        """
+        try:
+            # Use safe file operations to read and verify
+            loaded_config = self.safe_file_ops.safe_read_json(self.config_file)
+            
+            if loaded_config is None:
+                raise ValueError("Could not load saved configuration")
+            
+            # Basic validation - ensure it's a dictionary
+            if not isinstance(loaded_config, dict):
+                raise ValueError("Configuration is not a valid dictionary")
+            
+            # Check for required keys
+            required_keys = ['name', 'email', 'default_branch']
+            for key in required_keys:
+                if key not in loaded_config:
+                    self.print_error(f"Warning: Missing required configuration key: {key}")
+            
+            return True
+            
+        except Exception as e:
+            self.print_error(f"Configuration verification failed: {str(e)}")
+            return False
+    
+    def export_config(self, export_path: Optional[str] = None) -> bool:
+        """
+        Export configuration to a file.
+        
+        Args:
+            export_path: Path to export to, defaults to gitwrapper_config_export.json
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if not export_path:
+                export_path = "gitwrapper_config_export.json"
+            
+            export_file = Path(export_path)
+            
+            # Serialize in one shot (orjson when available) and write UTF-8 bytes
+            export_file.write_bytes(json_dumps(self.config, indent=2, sort_keys=True).encode('utf-8'))
+            
+            self.print_success(f"Configuration exported to: {export_file.absolute()}")
+            return True
+            
+        except Exception as e:
+            self.print_error(f"Failed to export configuration: {str(e)}")
+            return False
+    
+    def import_config(self, import_path: str) -> bool:
+        """
+        Import configuration from a file.
+        
+        Args:
+            import_path: Path to import from
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            import_file = Path(import_path)
             
-            with open(import_file, 'r') as f:
-                imported_config = json.load(f)
+            if not import_file.exists():
+                self.print_error(f"Import file not found: {import_path}")
+                return False
+            
+            imported_config = json_loads(import_file.read_bytes())
             
             # Validate imported config structure
             if not isinstance(imported_config, dict):
@@ -390,9 +1847,9 @@ class InteractiveGitWrapper:
         try:
             if feature:
                 # Reset specific feature
-                default_config = self._get_default_config()
-                if feature in default_config.get('advanced_features', {}):
-                    self.config['advanced_features'][feature] = default_config['advanced_features'][feature]
+                default_feature = self._get_default_for_path(f'advanced_features.{feature}')
+                if default_feature is not None:
+                    self.config['advanced_features'][feature] = default_feature
                     self.print_success(f"Reset {feature} configuration to defaults")
                 else:
                     self.print_error(f"Unknown feature: {feature}")
@@ -412,41 +1869,145 @@ class InteractiveGitWrapper:
             self.print_error(f"Failed to reset configuration: {str(e)}")
             return False
     
+    def _refresh_emoji_prefixes(self) -> None:
+        """Recompute the message prefixes used by the print_* helpers from the config"""
+        prefixes = self._EMOJI_PREFIXES if self.config.get('show_emoji', True) else ('', '', '', '')
+        self._emoji_success, self._emoji_error, self._emoji_info, self._emoji_working = prefixes
+    
     def print_success(self, message):
-        emoji = "✅ " if self.config['show_emoji'] else ""
-        print(f"{emoji}{message}")
+        print(self._emoji_success + str(message))
     
     def print_error(self, message):
-        emoji = "❌ " if self.config['show_emoji'] else ""
-        print(f"{emoji}{message}")
+        print(self._emoji_error + str(message))
     
     def print_info(self, message):
-        emoji = "ℹ️  " if self.config['show_emoji'] else ""
-        print(f"{emoji}{message}")
+        print(self._emoji_info + str(message))
     
     def print_working(self, message):
-        emoji = "🔄 " if self.config['show_emoji'] else ""
-        print(f"{emoji}{message}")
+        print(self._emoji_working + str(message))
     
-    def check_git_available(self):
-        """Check if git is available"""
+    @functools.cached_property
+    def git_available(self) -> bool:
+        """Whether git can be run; probed on first use rather than at startup"""
+        if _resolve_git_path():
+            return True
+        
+        # Not found on PATH; fall back to actually running git before giving up
         try:
             subprocess.run(['git', '--version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, OSError):
+            return False
+        return True
+    
+    def check_git_available(self):
+        """Exit with an error if git is not available"""
+        if not self.git_available:
             self.print_error("Git is not installed or not available in PATH")
             sys.exit(1)
     
     def is_git_repo(self):
-        """Check if current directory is a git repository"""
+        """Check if current directory is a git repository (cached per directory)"""
+        return bool(self._git_dir())
+    
+    def _git_dir(self) -> str:
+        """
+        Get the absolute git directory for the current directory (cached per directory).
+        
+        Returns:
+            Path of the git directory, or '' when not inside a repository
+        """
+        self.check_git_available()
+        cwd = self._cwd or os.getcwd()
+        now = time.monotonic()
+        cached = self._repo_cwd_cache.get(cwd)
+        if cached is not None and now - cached[1] < self._REPO_CACHE_TTL:
+            self._repo_cwd_cache.move_to_end(cwd)
+            return cached[0]
+        
+        git_dir = self.run_git_capture_text(['git', 'rev-parse', '--git-dir'])
+        git_dir = os.path.join(cwd, git_dir) if git_dir else ''
+        self._repo_cwd_cache[cwd] = (git_dir, now)
+        self._repo_cwd_cache.move_to_end(cwd)
+        if len(self._repo_cwd_cache) > self._REPO_CACHE_SIZE:
+            self._repo_cwd_cache.popitem(last=False)
+        return git_dir
+    
+    def invalidate_repo_cache(self):
+        """Forget cached repository detection results (after init, clone or chdir)"""
+        self._repo_cwd_cache.clear()
+        self._remotes_cache.clear()
+    
+    def _refresh_cwd(self):
+        """Record the process working directory (and its name) after it changes"""
+        self._cwd = os.getcwd()
+        self._cwd_name = os.path.basename(self._cwd)
+    
+    def _invalidate_remotes(self):
+        """Forget the cached remote names for the current directory (after a remote change)"""
+        self._remotes_cache.pop(self._cwd or os.getcwd(), None)
+    
+    def _invalidate_branches(self):
+        """Forget the cached local branches for the current directory (after a branch change)"""
+        self._branch_cache.pop(self._cwd or os.getcwd(), None)
+    
+    def _with_cwd(self, cmd, cwd=None):
+        """
+        Point a git command at a directory using `git -C` instead of the process cwd.
+        
+        Args:
+            cmd: Git command as list of strings
+            cwd: Directory to run in (defaults to the recorded working directory)
+            
+        Returns:
+            The command with `-C <dir>` injected, or unchanged if no directory applies
+        """
+        cwd = cwd or self._cwd
+        if not cwd or len(cmd) < 2 or cmd[1] == '-C':
+            return cmd
+        return [cmd[0], '-C', str(cwd)] + cmd[1:]
+    
+    def run_git_capture_bytes(self, cmd, timeout=None):
+        """
+        Run a read-only git command and return its raw stdout.
+        
+        Skips text decoding entirely, which is all callers that only test
+        for empty output need.
+        
+        Args:
+            cmd: Git command as list of strings
+            timeout: Timeout in seconds (None for no timeout)
+            
+        Returns:
+            Command stdout as bytes, or b'' if the command failed
+        """
         try:
-            subprocess.run(['git', 'rev-parse', '--git-dir'], 
-                         capture_output=True, check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            # close_fds=False is safe (Python fds are non-inheritable) and, with
+            # an absolute executable path, allows the cheaper posix_spawn path
+            cmd = self._with_cwd(cmd)
+            if cmd[0] == 'git' and _resolve_git_path():
+                cmd = [_GIT_PATH] + cmd[1:]
+            result = subprocess.run(cmd, capture_output=True, check=False,
+                                    timeout=timeout, close_fds=False)
+        except (OSError, subprocess.SubprocessError):
+            return b''
+        return result.stdout if result.returncode == 0 else b''
+    
+    def run_git_capture_text(self, cmd, timeout=None):
+        """
+        Run a read-only git command and return its stripped stdout as text.
+        
+        Args:
+            cmd: Git command as list of strings
+            timeout: Timeout in seconds (None for no timeout)
+            
+        Returns:
+            Command stdout decoded as UTF-8, or '' if the command failed
+        """
+        return self.run_git_capture_bytes(cmd, timeout).decode('utf-8', 'replace').strip()
     
     def run_git_command(self, cmd, capture_output=False, show_output=True, 
-                     timeout=None, operation_type=None, retry_count=1):
+                     timeout=None, operation_type=None, retry_count=1, shell_escape=True,
+                     cwd=None):
         """
         Run a git command with enhanced error handling, timeouts, and retries
         
@@ -457,6 +2018,8 @@ class InteractiveGitWrapper:
             timeout: Timeout in seconds (None for default)
             operation_type: Type of operation for dynamic timeout calculation
             retry_count: Number of times to retry on failure
+            shell_escape: Whether to shell-escape arguments (disable for format strings)
+            cwd: Directory to run in via `git -C` (defaults to the recorded working directory)
             
         Returns:
             If capture_output is True, returns command output as string.
@@ -471,6 +2034,7 @@ class InteractiveGitWrapper:
         if not cmd[0] or 'git' not in cmd[0].lower():
             self.print_error("Command must be a Git command")
             return False if not capture_output else ""
+        self.check_git_available()
         
         # Determine timeout to use
         if timeout is None and operation_type:
@@ -483,21 +2047,26 @@ class InteractiveGitWrapper:
             else:
                 timeout = self.timeout_handler.default_timeout
         
-        # Configure Git command execution
-        config = GitCommandConfig(
-            timeout=timeout,
-            retry_count=retry_count,
-            retry_strategy=RetryStrategy.EXPONENTIAL,
-            retry_delay=1.0,
-            max_retry_delay=10.0,
-            capture_output=capture_output,
-            show_output=show_output and not capture_output,
-            shell_escape=True,
-            validate_command=True
-        )
+        # Configure Git command execution; the executor never mutates its config,
+        # so one instance per distinct combination of settings is shared
+        config_key = (timeout, retry_count, capture_output, show_output and not capture_output, shell_escape)
+        config = self._git_command_configs.get(config_key)
+        if config is None:
+            config = dataclasses.replace(
+                self._git_config_template,
+                timeout=timeout,
+                retry_count=retry_count,
+                capture_output=capture_output,
+                show_output=show_output and not capture_output,
+                shell_escape=shell_escape
+            )
+            self._git_command_configs[config_key] = config
         
         # Execute the command using the enhanced executor
-        result = self.git_executor.execute(cmd, config)
+        if config.show_output:
+            # git writes to the inherited descriptor; keep pending Python output ahead of it
+            sys.stdout.flush()
+        result = self.git_executor.execute(self._with_cwd(cmd, cwd), config)
         
         # Handle the result
         if result.success:
@@ -509,6 +2078,81 @@ class InteractiveGitWrapper:
     
 
     
+    def ref_exists(self, ref: str) -> bool:
+        """Check whether a ref or object name exists in the current repository"""
+        return bool(self.run_git_capture_bytes(['git', 'rev-parse', '--verify', '--quiet', ref]))
+    
+    def run_git_batch(self, cmds, capture_output=False, timeout=None, capture_stderr=True):
+        """
+        Run several git commands as a single `&&` chain in one shell.
+        
+        Later commands only run if the earlier ones succeed. On Windows the
+        commands run one after another instead, since cmd.exe does not share
+        POSIX quoting rules.
+        
+        Args:
+            cmds: List of git commands, each a list of strings
+            capture_output: Whether to capture and return combined output
+            timeout: Timeout in seconds for the whole chain (None for default)
+            capture_stderr: Whether a capturing run also captures stderr; pass
+                False to let progress messages reach the terminal
+            
+        Returns:
+            If capture_output is True, returns combined output as string.
+            Otherwise, returns boolean indicating success (True) or failure (False).
+        """
+        failure = "" if capture_output else False
+        self.check_git_available()
+        
+        # The executor's option checks run before anything is joined; shell
+        # metacharacters need no check since every argument gets quoted
+        for cmd in cmds:
+            if not self.git_executor.validate_options(cmd):
+                self.print_error("Invalid or potentially dangerous Git command")
+                return failure
+        
+        if timeout is None:
+            timeout = sum(self.timeout_handler.get_recommended_timeout(cmd[1] if len(cmd) > 1 else 'default')
+                          for cmd in cmds)
+        
+        display = ' && '.join(' '.join(cmd) for cmd in cmds)
+        cmds = [self._with_cwd(cmd) for cmd in cmds]
+        
+        if self.platform_info.get('is_windows', False):
+            steps = [(cmd, {}) for cmd in cmds]
+        else:
+            chain = ' && '.join(shlex.join(cmd) for cmd in cmds)
+            steps = [(chain, {'shell': True, 'executable': '/bin/sh'})]
+        
+        if capture_output:
+            extra_pipes = {'stdout': subprocess.PIPE,
+                           'stderr': subprocess.PIPE if capture_stderr else None}
+        else:
+            extra_pipes = {}
+        
+        output = []
+        for command, extra in steps:
+            try:
+                result = subprocess.run(command, text=True, check=False, timeout=timeout,
+                                        **extra_pipes, **extra)
+            except subprocess.TimeoutExpired:
+                self.print_error(f"Git commands timed out after {timeout} seconds: {display}")
+                return failure
+            except OSError as e:
+                self.print_error(f"Failed to run git commands: {e}")
+                return failure
+            
+            if capture_output:
+                output.append(result.stdout or "")
+            if result.returncode != 0:
+                self.print_error(f"Git command failed: {display}")
+                if capture_output and result.stderr:
+                    print(f"Git error: {result.stderr}")
+                print(f"Git exited with code: {result.returncode}")
+                return failure
+        
+        return "".join(output).strip() if capture_output else True
+    
     def _handle_git_command_failure_enhanced(self, cmd: List[str], result, timeout: int) -> None:
         """
         Handle Git command failure with enhanced error reporting.
@@ -518,7 +2162,9 @@ class InteractiveGitWrapper:
             result: GitCommandResult with failure details
             timeout: The timeout that was used
         """
-        self.print_error(f"Git command failed: {' '.join(str(c) for c in cmd)}")
+        cmd_str = ' '.join(map(str, cmd))
+        operation = cmd[1] if len(cmd) > 1 else None
+        self.print_error(f"Git command failed: {cmd_str}")
         
         # Show specific error details
         if result.stderr:
@@ -535,92 +2181,45 @@ class InteractiveGitWrapper:
             print(f"Execution time: {result.execution_time:.2f} seconds")
         
         # Generate and show troubleshooting suggestions
-        suggestions = self._generate_enhanced_git_suggestions(cmd, result)
+        suggestions = self._generate_enhanced_git_suggestions(cmd, result, operation)
         if suggestions:
             emoji = "💡" if self.config.get('show_emoji', True) else ""
             print(f"\n{emoji} Troubleshooting suggestions:")
             for i, suggestion in enumerate(suggestions[:5], 1):  # Limit to 5 suggestions
                 print(f"  {i}. {suggestion}")
     
-    def _generate_enhanced_git_suggestions(self, cmd: List[str], result) -> List[str]:
+    def _generate_enhanced_git_suggestions(self, cmd: List[str], result,
+                                           operation: Optional[str] = None) -> List[str]:
         """
         Generate enhanced troubleshooting suggestions for Git command failures.
         
         Args:
             cmd: The command that failed
             result: GitCommandResult with failure details
+            operation: Git subcommand, if already taken from cmd by the caller
             
         Returns:
             List of troubleshooting suggestions
         """
-        suggestions = []
-        error_str = result.stderr.lower() if result.stderr else ""
-        
-        # Timeout-specific suggestions
-        if "timed out" in error_str or result.execution_time > 30:
-            suggestions.extend([
-                f"Command took {result.execution_time:.1f} seconds - consider increasing timeout",
-                "Check your network connection for remote operations",
-                "Large repositories may require more time for operations"
-            ])
-        
-        # Network-related suggestions
-        if any(pattern in error_str for pattern in ['connection', 'network', 'resolve', 'timeout']):
-            suggestions.extend([
-                "Check your internet connection",
-                "Verify the remote repository URL is correct",
-                "Try using a different network or VPN",
-                "Check if firewall is blocking Git operations"
-            ])
+        suggestions = []
+        error_str = result.stderr.lower() if result.stderr else ""
         
-        # Permission-related suggestions
-        if 'permission' in error_str or 'denied' in error_str:
-            suggestions.extend([
-                "Check file and directory permissions",
-                "Ensure you have write access to the repository",
-                "Verify SSH key configuration for remote repositories",
-                "Check if files are locked by another process"
-            ])
+        # One scan over stderr finds every keyword bucket that applies
+        buckets = {_ERR_BUCKETS[match.group(0)] for match in _ERR_RE.finditer(error_str)}
+        if result.execution_time > 30:
+            buckets.add('timeout')
         
-        # Repository-specific suggestions
-        if 'not a git repository' in error_str:
-            suggestions.extend([
-                "Initialize a Git repository with 'git init'",
-                "Navigate to a directory that contains a Git repository",
-                "Check if the .git directory exists and is not corrupted"
-            ])
+        if 'timeout' in buckets:
+            suggestions.append(f"Command took {result.execution_time:.1f} seconds - consider increasing timeout")
+        for bucket, bucket_suggestions in _ERR_SUGGESTIONS:
+            if bucket in buckets:
+                suggestions.extend(bucket_suggestions)
         
         # Operation-specific suggestions
-        if len(cmd) > 1:
+        if operation is None and len(cmd) > 1:
             operation = cmd[1]
-            if operation == 'push':
-                suggestions.extend([
-                    "Ensure you have push permissions to the remote repository",
-                    "Check if the remote branch exists or needs to be created",
-                    "Try 'git pull' first to sync with remote changes",
-                    "Verify your authentication credentials"
-                ])
-            elif operation == 'pull':
-                suggestions.extend([
-                    "Check if there are uncommitted changes that need to be stashed",
-                    "Verify the remote repository is accessible",
-                    "Try 'git fetch' to test remote connectivity",
-                    "Check for merge conflicts that need resolution"
-                ])
-            elif operation == 'clone':
-                suggestions.extend([
-                    "Verify the repository URL is correct and accessible",
-                    "Check if you have access permissions to the repository",
-                    "Ensure you have sufficient disk space",
-                    "Try cloning with --depth 1 for large repositories"
-                ])
-            elif operation in ['merge', 'rebase']:
-                suggestions.extend([
-                    "Check for merge conflicts that need manual resolution",
-                    "Ensure working directory is clean before merge/rebase",
-                    "Consider using conflict resolution tools",
-                    "Try aborting and retrying the operation"
-                ])
+        if operation is not None:
+            suggestions.extend(_OP_SUGGESTIONS.get(operation, ()))
         
         # Return code specific suggestions
         if result.return_code == 128:
@@ -641,7 +2240,7 @@ class InteractiveGitWrapper:
             suggestions: List of troubleshooting suggestions
             timeout: The timeout that was used
         """
-        self.print_error(f"Git command failed: {' '.join(str(c) for c in cmd)}")
+        self.print_error(f"Git command failed: {' '.join(map(str, cmd))}")
         
         # Show specific error details
         if hasattr(error, 'stderr') and error.stderr:
@@ -783,2400 +2382,1933 @@ class InteractiveGitWrapper:
                 return None
             except EOFError:
                 print("\nEnd of input reached.")
-                return None
-            except Exception as e:
-                self.print_error(f"Error reading input: {str(e)}")
-                attempts += 1
-                if attempts >= max_attempts:
-                    return None
-        
-        return None
-    
-    def _show_validation_hint(self, validator_type: str) -> None:
-        """
-        Show validation hints based on validator type.
-        
-        Args:
-            validator_type: Type of validator that failed
-        """
-        hints = {
-            'branch_name': "Branch names cannot contain spaces or special characters like: ~ ^ : ? * [ \\ .. @{ // /. .lock",
-            'remote_name': "Remote names must contain only alphanumeric characters, hyphens, and underscores",
-            'file_path': "File paths cannot contain dangerous characters like: < > : \" | ? *",
-            'url': "URLs must start with http://, https://, git://, ssh://, file:// or be in SSH format (user@host:path)",
-            'email': "Email addresses must be in the format: user@domain.com",
-            'commit_hash': "Commit hashes must be 7-40 hexadecimal characters",
-            'tag_name': "Tag names must start with alphanumeric characters and can contain: _ - . /",
-            'semver': "Semantic versions must be in format: v1.2.3 or 1.2.3 (with optional pre-release/build metadata)"
-        }
-        
-        hint = hints.get(validator_type, "Please check the input format")
-        print(f"Hint: {hint}")
-    
-    def _show_generic_validation_hint(self, validation_rules: Dict[str, Any]) -> None:
-        """
-        Show generic validation hints based on validation rules.
-        
-        Args:
-            validation_rules: Dictionary of validation rules
-        """
-        hints = []
-        
-        if validation_rules.get('required'):
-            hints.append("This field is required")
-        
-        if validation_rules.get('min_length'):
-            hints.append(f"Minimum length: {validation_rules['min_length']} characters")
-        
-        if validation_rules.get('max_length'):
-            hints.append(f"Maximum length: {validation_rules['max_length']} characters")
-        
-        if validation_rules.get('min_value'):
-            hints.append(f"Minimum value: {validation_rules['min_value']}")
-        
-        if validation_rules.get('max_value'):
-            hints.append(f"Maximum value: {validation_rules['max_value']}")
-        
-        if validation_rules.get('enum'):
-            hints.append(f"Allowed values: {', '.join(str(v) for v in validation_rules['enum'])}")
-        
-        if validation_rules.get('type'):
-            hints.append(f"Expected type: {validation_rules['type'].__name__}")
-        
-        if hints:
-            print(f"Requirements: {'; '.join(hints)}")
-        elif validation_rules.get('validator_type') == 'branch_name':
-            print("Hint: Branch names cannot contain spaces or special characters like: ~ ^ : ? * [ \\ .. @{")
-        elif validation_rules.get('validator_type') == 'remote_name':
-            print("Hint: Remote names must contain only alphanumeric characters, hyphens, and underscores.")
-    
-    def get_choice(self, prompt, choices, default=None):
-        """Get user choice from a list"""
-        print(f"\n{prompt}")
-        for i, choice in enumerate(choices, 1):
-            marker = " (default)" if default and choice == default else ""
-            print(f"  {i}. {choice}{marker}")
-        
-        while True:
-            try:
-                choice_input = input("\nEnter choice number: ").strip()
-                if not choice_input and default:
-                    return default
-                choice_num = int(choice_input)
-                if 1 <= choice_num <= len(choices):
-                    return choices[choice_num - 1]
-                print("Invalid choice. Please try again.")
-            except ValueError:
-                print("Please enter a valid number.")
-    
-    def get_multiple_choice(self, prompt, choices):
-        """Get multiple choices from a list"""
-        print(f"\n{prompt}")
-        print("(Enter comma-separated numbers, e.g., 1,3,4)")
-        for i, choice in enumerate(choices, 1):
-            print(f"  {i}. {choice}")
-        
-        while True:
-            try:
-                choice_input = input("\nEnter choice numbers: ").strip()
-                if not choice_input:
-                    return []
-                
-                choice_nums = [int(x.strip()) for x in choice_input.split(',')]
-                selected = []
-                for num in choice_nums:
-                    if 1 <= num <= len(choices):
-                        selected.append(choices[num - 1])
-                    else:
-                        print(f"Invalid choice: {num}")
-                        return []
-                return selected
-            except ValueError:
-                print("Please enter valid numbers separated by commas.")
-    
-    def confirm(self, message, default=True):
-        """Ask for confirmation"""
-        suffix = "[Y/n]" if default else "[y/N]"
-        response = input(f"{message} {suffix}: ").strip().lower()
-        return response in ['y', 'yes'] if response else default
-    
-    def get_remotes(self):
-        """Get list of remote repositories"""
-        remotes_output = self.run_git_command(['git', 'remote'], capture_output=True)
-        return remotes_output.split('\n') if remotes_output else []
-    
-    def show_main_menu(self):
-        """Display the main interactive menu"""
-        while True:
-            self.clear_screen()
-            repo_status = "🟢 Git Repository" if self.is_git_repo() else "🔴 Not a Git Repository"
-            current_dir = os.path.basename(os.getcwd())
-            
-            print("=" * 50)
-            print("🚀 Interactive Git Wrapper")
-            print("=" * 50)
-            print(f"📁 Directory: {current_dir}")
-            print(f"📊 Status: {repo_status}")
-            print("=" * 50)
-            
-            if self.is_git_repo():
-                try:
-                    branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
-                    print(f"🌿 Current Branch: {branch}")
-                    
-                    status = self.run_git_command(['git', 'status', '--porcelain'], capture_output=True)
-                    if status:
-                        print(f"📝 Uncommitted Changes: {len(status.splitlines())} files")
-                    else:
-                        print("📝 Working Directory: Clean")
-                    print("-" * 50)
-                except:
-                    pass
-            
-            # Menu options
-            options = []
-            if self.is_git_repo():
-                options.extend([
-                    "📊 Show Status", "💾 Quick Commit", "🔄 Sync (Pull & Push)",
-                    "📤 Push Operations", "🌿 Branch Operations", "📋 View Changes", 
-                    "📜 View History", "🔗 Remote Management"
-                ])
-                
-                # Add advanced features if available
-                if self.has_advanced_features():
-                    options.extend([
-                        "🗂️  Stash Management", "📝 Commit Templates", "🔀 Branch Workflows",
-                        "⚔️  Conflict Resolution", "🏥 Repository Health", "💾 Smart Backup"
-                    ])
-            else:
-                options.extend(["🎯 Initialize Repository", "📥 Clone Repository"])
-            
-            options.extend(["⚙️ Configuration", "❓ Help", "🚪 Exit"])
-            
-            for i, option in enumerate(options, 1):
-                print(f"  {i}. {option}")
-            
-            try:
-                choice = int(input(f"\nEnter your choice (1-{len(options)}): "))
-                if 1 <= choice <= len(options):
-                    self.handle_menu_choice(options[choice-1])
-                else:
-                    self.print_error("Invalid choice!")
-                    time.sleep(1)
-            except ValueError:
-                self.print_error("Please enter a valid number!")
-                time.sleep(1)
-            except KeyboardInterrupt:
-                print("\n\nGoodbye! 👋")
-                break
-    
-    def handle_menu_choice(self, choice):
-        """Handle menu selection"""
-        handlers = {
-            "Show Status": self.interactive_status,
-            "Quick Commit": self.interactive_commit,
-            "Sync": self.interactive_sync,
-            "Push Operations": self.interactive_push_menu,
-            "Branch Operations": self.interactive_branch_menu,
-            "View Changes": self.interactive_diff,
-            "View History": self.interactive_log,
-            "Remote Management": self.interactive_remote_menu,
-            "Stash Management": lambda: self._handle_feature_menu('stash'),
-            "Commit Templates": lambda: self._handle_feature_menu('templates'),
-            "Branch Workflows": lambda: self._handle_feature_menu('workflows'),
-            "Conflict Resolution": lambda: self._handle_feature_menu('conflicts'),
-            "Repository Health": lambda: self._handle_feature_menu('health'),
-            "Smart Backup": lambda: self._handle_feature_menu('backup'),
-            "Initialize Repository": self.interactive_init,
-            "Clone Repository": self.interactive_clone,
-            "Configuration": self.interactive_config_menu,
-            "Help": self.show_help,
-            "Exit": lambda: (print("\nGoodbye! 👋"), sys.exit(0))
-        }
-        
-        for key, handler in handlers.items():
-            if key in choice:
-                handler()
-                break
-    
-    def interactive_status(self):
-        """Interactive status display"""
-        self.clear_screen()
-        print("📊 Repository Status\n" + "=" * 30)
-        
-        branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
-        if branch:
-            print(f"🌿 Current branch: {branch}")
-        
-        print("\n📝 Working Directory Status:")
-        self.run_git_command(['git', 'status'])
-        
-        print(f"\n📜 Recent commits:")
-        self.run_git_command(['git', 'log', '--oneline', '-5'])
-        
-        input("\nPress Enter to continue...")
-    
-    def interactive_commit(self):
-        """Interactive commit process"""
-        self.clear_screen()
-        print("💾 Quick Commit\n" + "=" * 20)
-        
-        # Check status with timeout
-        status = self.run_git_command(['git', 'status', '--porcelain'], 
-                                    capture_output=True, 
-                                    timeout=10, 
-                                    operation_type='status')
-        if not status:
-            self.print_info("No changes to commit!")
-            input("Press Enter to continue...")
-            return
-        
-        print("Files to be added:")
-        print(status)
-        
-        if not self.confirm("\nAdd all changes?", True):
-            return
-        
-        # Define validation rules for commit messages
-        message_validation_rules = {
-            'required': True,
-            'min_length': 3,
-            'max_length': 500
-        }
-        
-        message = self.get_input("\nEnter commit message", validation_rules=message_validation_rules)
-        if not message:
-            return
-        
-        self.print_working("Adding all changes...")
-        if not self.run_git_command(['git', 'add', '.'], 
-                                  show_output=False, 
-                                  timeout=30, 
-                                  operation_type='add',
-                                  retry_count=2):
-            input("Press Enter to continue...")
-            return
-        
-        # Sanitize the commit message to prevent command injection
-        sanitized_message = self.input_validator.sanitize_shell_input(message)
-        
-        self.print_working(f"Committing with message: '{message}'")
-        if self.run_git_command(['git', 'commit', '-m', sanitized_message], 
-                              timeout=30, 
-                              operation_type='commit',
-                              retry_count=2):
-            self.print_success("Commit successful!")
-            
-            if self.config['auto_push'] and self.confirm("Push to remote(s)?", True):
-                self.interactive_push_menu()
-        
-        input("Press Enter to continue...")
-    
-    def interactive_push_menu(self):
-        """Interactive push operations menu"""
-        self.clear_screen()
-        print("📤 Push Operations\n" + "=" * 20)
-        
-        remotes = self.get_remotes()
-        if not remotes:
-            self.print_error("No remotes configured!")
-            input("Press Enter to continue...")
-            return
-        
-        current_branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
-        print(f"Current branch: {current_branch or 'unknown'}")
-        print(f"Available remotes: {', '.join(remotes)}")
-        print("-" * 30)
-        
-        options = [
-            "Push to single remote",
-            "Push to multiple remotes",
-            "Push to all remotes",
-            "Back to main menu"
-        ]
-        
-        choice = self.get_choice("Push Options:", options)
-        
-        if "single remote" in choice:
-            self.interactive_push_single()
-        elif "multiple remotes" in choice:
-            self.interactive_push_multiple()
-        elif "all remotes" in choice:
-            self.interactive_push_all()
-        elif "Back to main menu" in choice:
-            return
-    
-    def interactive_push_single(self):
-        """Push to a single selected remote"""
-        remotes = self.get_remotes()
-        if not remotes:
-            return
-        
-        current_branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
-        branch = self.get_input("Branch to push", current_branch or self.config['default_branch'])
-        
-        default_remote = self.config.get('default_remote', 'origin')
-        if default_remote not in remotes:
-            default_remote = remotes[0]
-        
-        remote = self.get_choice("Select remote to push to:", remotes, default_remote)
-        
-        self.print_working(f"Pushing {branch} to {remote}...")
-        if self.run_git_command(['git', 'push', remote, branch]):
-            self.print_success(f"Successfully pushed to {remote}/{branch}!")
-        
-        input("Press Enter to continue...")
-    
-    def interactive_push_multiple(self):
-        """Push to multiple selected remotes"""
-        remotes = self.get_remotes()
-        if not remotes:
-            return
-        
-        if len(remotes) == 1:
-            self.print_info("Only one remote available. Use single remote push instead.")
-            input("Press Enter to continue...")
-            return
-        
-        current_branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
-        branch = self.get_input("Branch to push", current_branch or self.config['default_branch'])
-        
-        selected_remotes = self.get_multiple_choice("Select remotes to push to:", remotes)
-        
-        if not selected_remotes:
-            self.print_info("No remotes selected.")
-            input("Press Enter to continue...")
-            return
-        
-        self.print_info(f"Pushing {branch} to: {', '.join(selected_remotes)}")
-        
-        success_count = 0
-        failed_remotes = []
-        
-        for remote in selected_remotes:
-            self.print_working(f"Pushing to {remote}...")
-            if self.run_git_command(['git', 'push', remote, branch], show_output=False):
-                self.print_success(f"✓ Pushed to {remote}")
-                success_count += 1
-            else:
-                self.print_error(f"✗ Failed to push to {remote}")
-                failed_remotes.append(remote)
-        
-        print(f"\nSummary: {success_count}/{len(selected_remotes)} remotes successful")
-        if failed_remotes:
-            print(f"Failed remotes: {', '.join(failed_remotes)}")
+                return None
+            except Exception as e:
+                self.print_error(f"Error reading input: {str(e)}")
+                attempts += 1
+                if attempts >= max_attempts:
+                    return None
         
-        input("Press Enter to continue...")
+        return None
     
-    def interactive_push_all(self):
-        """Push to all configured remotes"""
-        remotes = self.get_remotes()
-        if not remotes:
-            return
-        
-        current_branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
-        branch = self.get_input("Branch to push", current_branch or self.config['default_branch'])
-        
-        if not self.confirm(f"Push {branch} to ALL {len(remotes)} remotes?", False):
-            return
-        
-        self.print_info(f"Pushing {branch} to all remotes: {', '.join(remotes)}")
+    def _show_validation_hint(self, validator_type: str) -> None:
+        """
+        Show validation hints based on validator type.
         
-        success_count = 0
-        failed_remotes = []
+        Args:
+            validator_type: Type of validator that failed
+        """
+        print(f"Hint: {_VALIDATION_HINTS.get(validator_type, 'Please check the input format')}")
+    
+    def _show_generic_validation_hint(self, validation_rules: Dict[str, Any]) -> None:
+        """
+        Show generic validation hints based on validation rules.
         
-        for remote in remotes:
-            self.print_working(f"Pushing to {remote}...")
-            if self.run_git_command(['git', 'push', remote, branch], show_output=False):
-                self.print_success(f"✓ Pushed to {remote}")
-                success_count += 1
-            else:
-                self.print_error(f"✗ Failed to push to {remote}")
-                failed_remotes.append(remote)
+        Args:
+            validation_rules: Dictionary of validation rules
+        """
+        hints = []
         
-        print(f"\nSummary: {success_count}/{len(remotes)} remotes successful")
-        if failed_remotes:
-            print(f"Failed remotes: {', '.join(failed_remotes)}")
+        if validation_rules.get('required'):
+            hints.append("This field is required")
         
-        input("Press Enter to continue...")
-    
-    def interactive_sync(self):
-        """Interactive sync process"""
-        self.clear_screen()
-        print("🔄 Sync Repository\n" + "=" * 20)
+        if validation_rules.get('min_length'):
+            hints.append(f"Minimum length: {validation_rules['min_length']} characters")
         
-        current_branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
-        branch = self.get_input("Branch to sync", current_branch or self.config['default_branch'])
+        if validation_rules.get('max_length'):
+            hints.append(f"Maximum length: {validation_rules['max_length']} characters")
         
-        # Select remote for sync
-        remotes = self.get_remotes()
-        if not remotes:
-            self.print_error("No remotes configured!")
-            input("Press Enter to continue...")
-            return
+        if validation_rules.get('min_value'):
+            hints.append(f"Minimum value: {validation_rules['min_value']}")
         
-        default_remote = self.config.get('default_remote', 'origin')
-        if default_remote not in remotes:
-            default_remote = remotes[0]
+        if validation_rules.get('max_value'):
+            hints.append(f"Maximum value: {validation_rules['max_value']}")
         
-        remote = self.get_choice("Select remote for sync:", remotes, default_remote)
+        if validation_rules.get('enum'):
+            hints.append(f"Allowed values: {', '.join(str(v) for v in validation_rules['enum'])}")
         
-        self.print_working(f"Syncing with {remote}/{branch}")
+        if validation_rules.get('type'):
+            hints.append(f"Expected type: {validation_rules['type'].__name__}")
         
-        # Pull and Push
-        self.print_working("Pulling latest changes...")
-        if not self.run_git_command(['git', 'pull', remote, branch]):
-            input("Press Enter to continue...")
-            return
+        if hints:
+            print(f"Requirements: {'; '.join(hints)}")
+        elif validation_rules.get('validator_type') in _VALIDATION_HINTS:
+            print(f"Hint: {_VALIDATION_HINTS[validation_rules['validator_type']]}")
+    
+    def _read_number(self, prompt):
+        """
+        Read a short numeric answer from the user.
         
-        self.print_working("Pushing local commits...")
-        if self.run_git_command(['git', 'push', remote, branch]):
-            self.print_success("Sync completed successfully!")
+        On a terminal the prompt is written directly and one line is read from
+        stdin, bypassing readline's line editing which numeric menu answers
+        do not need. Otherwise falls back to input().
         
-        input("Press Enter to continue...")
-    
-    def interactive_remote_menu(self):
-        """Interactive remote management menu"""
-        while True:
-            self.clear_screen()
-            print("🔗 Remote Management\n" + "=" * 25)
-            
-            remotes = self.get_remotes()
-            if remotes:
-                print("Current remotes:")
-                for remote in remotes:
-                    url = self.run_git_command(['git', 'remote', 'get-url', remote], capture_output=True)
-                    default_marker = f" (default)" if remote == self.config.get('default_remote') else ""
-                    print(f"  {remote}: {url}{default_marker}")
-                print()
-            else:
-                print("No remotes configured\n")
-            
-            options = [
-                "Add remote", "Remove remote", "List remotes", 
-                "Change remote URL", "Set default remote", "Back to main menu"
-            ]
+        Args:
+            prompt: Prompt text to display
             
-            choice = self.get_choice("Remote Operations:", options)
+        Returns:
+            The entered line, stripped of surrounding whitespace
             
-            if "Add remote" in choice:
-                self.interactive_add_remote()
-            elif "Remove remote" in choice:
-                self.interactive_remove_remote()
-            elif "List remotes" in choice:
-                self.interactive_list_remotes()
-            elif "Change remote URL" in choice:
-                self.interactive_change_remote_url()
-            elif "Set default remote" in choice:
-                self.interactive_set_default_remote()
-            elif "Back to main menu" in choice:
-                break
-    
-    def interactive_set_default_remote(self):
-        """Set default remote for operations"""
-        remotes = self.get_remotes()
-        if not remotes:
-            self.print_info("No remotes configured")
-            input("Press Enter to continue...")
-            return
-        
-        current_default = self.config.get('default_remote', 'origin')
-        remote = self.get_choice("Select default remote:", remotes, current_default)
-        
-        self.config['default_remote'] = remote
-        self.save_config()
-        self.print_success(f"Default remote set to: {remote}")
+        Raises:
+            EOFError: If stdin is closed
+        """
+        if not sys.stdin.isatty():
+            return input(prompt).strip()
         
-        input("Press Enter to continue...")
-    
-    def interactive_add_remote(self):
-        """Add a new remote"""
-        name = self.get_input("Remote name", "origin")
-        if not name:
-            return
-    
-        url = self.get_input("Remote URL")
-        if not url:
-            return
-    
-        self.print_working(f"Adding remote '{name}'...")
-        if not self.run_git_command(['git', 'remote', 'add', name, url]):
-            input("Press Enter to continue...")
-            return
-    
-        self.print_success(f"Remote '{name}' added successfully!")
-    
-        # If this is the first remote, make it default
-        remotes = self.get_remotes()
-        if len(remotes) == 1:
-            self.config['default_remote'] = name
-            self.save_config()
-            self.print_info(f"Set as default remote: {name}")
-    
-        # Ask if user wants to set upstream tracking for all branches
-        if self.confirm(f"Set upstream tracking for all branches to '{name}'?", False):
-            self.print_working("Setting upstream tracking for all branches...")
-            if self.run_git_command(['git', 'push', '--set-upstream', name, '--all']):
-                self.print_success("Upstream tracking set for all branches!")
-            else:
-                self.print_error("Failed to set upstream tracking")
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
     
-        input("Press Enter to continue...")
+    def _pauses_enabled(self):
+        """Whether to hold output for the user: stdin is a terminal and no_pause is off"""
+        return not self.config.get('no_pause', False) and sys.stdin.isatty()
     
-    def interactive_remove_remote(self):
-        """Remove an existing remote"""
-        remotes = self.get_remotes()
-        if not remotes:
-            self.print_info("No remotes to remove")
-            input("Press Enter to continue...")
-            return
-        
-        remote = self.get_choice("Select remote to remove:", remotes)
+    def _pause(self, prompt="Press Enter to continue..."):
+        """
+        Wait for Enter so the user can read an action's output.
         
-        if self.confirm(f"Are you sure you want to remove remote '{remote}'?", False):
-            if self.run_git_command(['git', 'remote', 'remove', remote]):
-                self.print_success(f"Remote '{remote}' removed successfully!")
-                
-                # Update default remote if removed
-                if self.config.get('default_remote') == remote:
-                    remaining_remotes = self.get_remotes()
-                    if remaining_remotes:
-                        self.config['default_remote'] = remaining_remotes[0]
-                        self.save_config()
-                        self.print_info(f"Default remote changed to: {remaining_remotes[0]}")
-                    else:
-                        self.config['default_remote'] = 'origin'
-                        self.save_config()
+        Skipped when stdin is not a terminal (scripted or piped runs) or when
+        the no_pause setting is on.
         
-        input("Press Enter to continue...")
-    
-    def interactive_list_remotes(self):
-        """List all remotes with details"""
-        self.clear_screen()
-        print("🔗 All Remotes\n" + "=" * 15)
-        self.run_git_command(['git', 'remote', '-v'])
-        input("\nPress Enter to continue...")
+        Args:
+            prompt: Prompt text to display
+        """
+        if self._pauses_enabled():
+            input(prompt)
     
-    def interactive_change_remote_url(self):
-        """Change URL of existing remote"""
-        remotes = self.get_remotes()
-        if not remotes:
-            self.print_info("No remotes configured")
-            input("Press Enter to continue...")
-            return
-        
-        remote = self.get_choice("Select remote to modify:", remotes)
-        current_url = self.run_git_command(['git', 'remote', 'get-url', remote], capture_output=True)
-        
-        print(f"Current URL: {current_url}")
-        new_url = self.get_input("New URL")
-        if not new_url:
-            return
+    def _linger(self, seconds):
+        """
+        Keep a status message on screen briefly before the menu redraws.
         
-        if self.run_git_command(['git', 'remote', 'set-url', remote, new_url]):
-            self.print_success(f"URL for '{remote}' updated successfully!")
+        Skipped under the same conditions as _pause.
         
-        input("Press Enter to continue...")
+        Args:
+            seconds: How long to wait
+        """
+        if self._pauses_enabled():
+            time.sleep(seconds)
     
-    def interactive_branch_menu(self):
-        """Interactive branch operations menu"""
+    def get_choice(self, prompt, choices, default=None):
+        """Get user choice from a list"""
+        print(f"\n{prompt}")
+        for i, choice in enumerate(choices, 1):
+            marker = " (default)" if default and choice == default else ""
+            print(f"  {i}. {choice}{marker}")
+        
         while True:
-            self.clear_screen()
-            print("🌿 Branch Operations\n" + "=" * 25)
-            
-            current_branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
-            if current_branch:
-                print(f"Current branch: {current_branch}\n")
-            
-            options = [
-                "Create new branch", "Switch to existing branch", "List all branches",
-                "Delete branch", "Back to main menu"
-            ]
-            
-            choice = self.get_choice("Branch Operations:", options)
-            
-            handlers = {
-                "Create new branch": self.interactive_create_branch,
-                "Switch to existing branch": self.interactive_switch_branch,
-                "List all branches": self.interactive_list_branches,
-                "Delete branch": self.interactive_delete_branch,
-                "Back to main menu": lambda: None
-            }
-            
-            for key, handler in handlers.items():
-                if key in choice:
-                    result = handler()
-                    if key == "Back to main menu":
-                        return
-                    break
+            try:
+                choice_input = self._read_number("\nEnter choice number: ")
+                if not choice_input and default:
+                    return default
+                choice_num = int(choice_input)
+                if 1 <= choice_num <= len(choices):
+                    return choices[choice_num - 1]
+                print("Invalid choice. Please try again.")
+            except ValueError:
+                print("Please enter a valid number.")
     
-    def interactive_create_branch(self):
-        """Interactive branch creation"""
-        # Define validation rules for branch names
-        branch_validation_rules = {
-            'required': True,
-            'validator_type': 'branch_name',
-            'min_length': 1,
-            'max_length': 100,
-            'pattern_error': "Branch names cannot contain spaces or special characters like: ~ ^ : ? * [ \\ .. @{"
-        }
-        
-        branch_name = self.get_input("Enter new branch name", validation_rules=branch_validation_rules)
-        if not branch_name:
-            return
-        
-        self.print_working(f"Creating new branch: {branch_name}")
-        if self.run_git_command(['git', 'checkout', '-b', branch_name], timeout=30, operation_type='branch'):
-            self.print_success(f"Created and switched to branch: {branch_name}")
+    def get_multiple_choice(self, prompt, choices):
+        """Get multiple choices from a list"""
+        print(f"\n{prompt}")
+        print("(Enter comma-separated numbers, e.g., 1,3,4)")
+        for i, choice in enumerate(choices, 1):
+            print(f"  {i}. {choice}")
         
-        input("Press Enter to continue...")
+        while True:
+            try:
+                choice_input = self._read_number("\nEnter choice numbers: ")
+                if not choice_input:
+                    return []
+                
+                # Repeated numbers select once; order follows the first mention
+                choice_nums = dict.fromkeys(int(x) for x in choice_input.split(','))
+                invalid = choice_nums.keys() - range(1, len(choices) + 1)
+                if invalid:
+                    print(f"Invalid choice: {', '.join(map(str, sorted(invalid)))}")
+                    continue
+                return [choices[num - 1] for num in choice_nums]
+            except ValueError:
+                print("Please enter valid numbers separated by commas.")
     
-    def interactive_switch_branch(self):
-        """Interactive branch switching"""
-        branches_output = self.run_git_command(['git', 'branch'], capture_output=True)
-        if not branches_output:
-            return
-        
-        branches = [b.strip().replace('* ', '') for b in branches_output.split('\n') if b.strip()]
-        current_branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
-        
-        if len(branches) > 1:
-            branches = [b for b in branches if b != current_branch]
-        
-        if not branches:
-            self.print_info("No other branches available")
-            input("Press Enter to continue...")
-            return
+    def confirm(self, message, default=True):
+        """Ask for confirmation"""
+        suffix = "[Y/n]" if default else "[y/N]"
+        response = input(f"{message} {suffix}: ").strip().lower()
+        return response in ['y', 'yes'] if response else default
+    
+    def _load_repo_snapshot(self) -> Dict[str, Any]:
+        """
+        Capture branch, tracking info, remotes and pending changes in one shell.
         
-        branch = self.get_choice("Select branch to switch to:", branches)
+        State probed right after a clone is reused once instead, while the
+        working directory still matches the cloned checkout.
         
-        self.print_working(f"Switching to branch: {branch}")
-        if self.run_git_command(['git', 'checkout', branch]):
-            self.print_success(f"Switched to branch: {branch}")
+        Returns:
+            Repository state as produced by _parse_repo_snapshot
+        """
+        cwd = self._cwd or os.getcwd()
+        state = self._repo_state
+        if state and state.get('path') == cwd:
+            self._repo_state = None
+            return state
         
-        input("Press Enter to continue...")
-    
-    def interactive_list_branches(self):
-        """Interactive branch listing"""
-        self.clear_screen()
-        print("🌿 All Branches\n" + "=" * 15)
-        self.run_git_command(['git', 'branch', '-a'])
-        input("\nPress Enter to continue...")
+        output = self.run_git_batch(
+            [['git', 'remote', '-v'], ['git', 'status', '--porcelain=v2', '--branch']],
+            capture_output=True
+        )
+        state = self._parse_repo_snapshot(output)
+        state['path'] = cwd
+        return state
     
-    def interactive_delete_branch(self):
-        """Interactive branch deletion"""
-        branches_output = self.run_git_command(['git', 'branch'], capture_output=True)
-        if not branches_output:
-            return
+    def _repo_snapshot(self) -> Tuple[bool, Optional[str], int]:
+        """
+        Gather what the main menu header shows with at most one git process.
         
-        branches = [b.strip().replace('* ', '') for b in branches_output.split('\n') if b.strip()]
-        current_branch = self.run_git_command(['git', 'branch', '--show-current'], capture_output=True)
+        The branch normally comes straight from .git/HEAD, leaving a single
+        `status --porcelain`; when HEAD cannot be read that way, one
+        `status --porcelain=v2 --branch` supplies both instead.
         
-        if len(branches) > 1:
-            branches = [b for b in branches if b != current_branch]
+        Returns:
+            Tuple of (inside a repository, current branch, changed file count)
+        """
+        if not self.is_git_repo():
+            return False, None, 0
         
-        if not branches:
-            self.print_info("No branches available to delete")
-            input("Press Enter to continue...")
-            return
+        branch = self._read_head_ref()
+        if branch is None:
+            state = self._parse_repo_snapshot(
+                self.run_git_capture_text(['git', 'status', '--porcelain=v2', '--branch']))
+            return True, state['branch'] or '', state['changes']
         
-        branch = self.get_choice("Select branch to delete:", branches)
+        status = self.run_git_capture_bytes(['git', 'status', '--porcelain'])
+        changes = status.count(b'\n') + (0 if not status or status.endswith(b'\n') else 1)
+        return True, branch, changes
+    
+    def _git_common_dir(self, git_dir: str) -> str:
+        """
+        Get the directory holding the shared repository config.
         
-        if self.confirm(f"Are you sure you want to delete branch '{branch}'?", False):
-            if self.run_git_command(['git', 'branch', '-d', branch]):
-                self.print_success(f"Deleted branch: {branch}")
+        Linked worktrees keep their own HEAD but point at the main
+        repository through a `commondir` file.
         
-        input("Press Enter to continue...")
+        Args:
+            git_dir: Git directory of the current checkout
+            
+        Returns:
+            The common git directory (git_dir itself for regular checkouts)
+        """
+        try:
+            with open(os.path.join(git_dir, 'commondir'), encoding='utf-8') as f:
+                common_dir = f.read().strip()
+        except OSError:
+            return git_dir
+        return os.path.normpath(os.path.join(git_dir, common_dir))
     
-    def interactive_diff(self):
-        """Interactive diff viewing"""
-        self.clear_screen()
+    def _read_head_ref(self) -> Optional[str]:
+        """
+        Read the current branch straight from HEAD without running git.
         
-        diff_type = self.get_choice("What changes to view?", 
-                                  ["Unstaged changes", "Staged changes"])
+        Returns:
+            Branch name, '' for a detached HEAD (like `git branch --show-current`),
+            or None if HEAD could not be read, points outside refs/heads or the
+            refs are not stored as files
+        """
+        git_dir = self._git_dir()
+        if not git_dir:
+            return None
+        try:
+            with open(os.path.join(git_dir, 'HEAD'), encoding='utf-8') as f:
+                head = f.read().strip()
+        except (OSError, UnicodeDecodeError):
+            return None
         
-        if "Staged" in diff_type:
-            print("📋 Staged changes:")
-            self.run_git_command(['git', 'diff', '--cached'])
-        else:
-            print("📋 Unstaged changes:")
-            self.run_git_command(['git', 'diff'])
+        if head.startswith('ref: refs/heads/'):
+            branch = head[len('ref: refs/heads/'):]
+            # Reftable repositories keep a '.invalid' stub in HEAD and no
+            # refs/heads directory; only git knows their current branch
+            if branch == '.invalid' or not os.path.isdir(os.path.join(git_dir, 'refs', 'heads')):
+                return None
+            return branch
+        return None if head.startswith('ref:') else ''
+    
+    def _current_branch(self) -> str:
+        """
+        Get the current branch, read from HEAD and only asking git when that fails.
         
-        input("\nPress Enter to continue...")
+        Returns:
+            Branch name, or '' for a detached HEAD or outside a repository
+        """
+        branch = self._read_head_ref()
+        if branch is None:
+            branch = self.run_git_capture_text(['git', 'branch', '--show-current'])
+        return branch
     
-    def interactive_log(self):
-        """Interactive log viewing"""
-        self.clear_screen()
+    def _read_remotes_from_config(self, config_path: str) -> Optional[List[str]]:
+        """
+        List remote names from `[remote "<name>"]` sections of a git config file.
         
+        Args:
+            config_path: Path of the repository config file
+            
+        Returns:
+            Sorted remote names, or None if the file could not be parsed
+            or pulls in other files through include directives
+        """
+        parser = configparser.RawConfigParser(strict=False, allow_no_value=True)
         try:
-            count = int(self.get_input("Number of commits to show", "10"))
-        except ValueError:
-            count = 10
-        
-        print(f"📜 Last {count} commits:")
-        self.run_git_command(['git', 'log', '--oneline', f'-{count}'])
+            if not parser.read(config_path, encoding='utf-8'):
+                return None
+        except (configparser.Error, UnicodeDecodeError):
+            return None
         
-        input("\nPress Enter to continue...")
+        remotes = set()
+        for section in parser.sections():
+            kind, _, name = section.partition(' ')
+            kind = kind.lower()
+            if kind in ('include', 'includeif'):
+                return None
+            if kind == 'remote' and len(name) > 1 and name[0] == name[-1] == '"':
+                remotes.add(name[1:-1])
+        # Sorted, matching the order `git remote` prints
+        return sorted(remotes)
     
-    def interactive_init(self):
-        """Interactive repository initialization"""
+    def get_remotes(self):
+        """Get list of remote repositories (cached until .git/config changes)"""
+        cwd = self._cwd or os.getcwd()
+        git_dir = self._git_dir()
+        config_path = os.path.join(self._git_common_dir(git_dir), 'config') if git_dir else None
+        try:
+            # Remotes live in the repository config, so its mtime and size key the cache
+            if config_path:
+                stat = os.stat(config_path)
+                mtime = (stat.st_mtime_ns, stat.st_size)
+            else:
+                mtime = None
+        except OSError:
+            mtime = None
+        
+        cached = self._remotes_cache.get(cwd)
+        if mtime is not None and cached and cached[0] == mtime:
+            return list(cached[1])
+        
+        # Read the config file directly; only ask git when it cannot be parsed
+        remotes = self._read_remotes_from_config(config_path) if mtime is not None else None
+        if remotes is None:
+            remotes_output = self.run_git_command(['git', 'remote'], capture_output=True)
+            remotes = remotes_output.splitlines() if remotes_output else []
+        if mtime is not None:
+            self._remotes_cache[cwd] = (mtime, remotes)
+        return list(remotes)
+    
+    def show_main_menu(self):
+        """Display the main interactive menu"""
+        while True:
+            # Settings changed in a submenu are written on the way back here
+            self._flush_config()
+            self.clear_screen()
+            # Every git call made for this frame and the chosen action targets this directory
+            if self._cwd is None:
+                self._refresh_cwd()
+            in_repo, branch, changes = self._repo_snapshot()
+            repo_status = "🟢 Git Repository" if in_repo else "🔴 Not a Git Repository"
+            current_dir = self._cwd_name
+            
+            # Option tables are precomputed per repository state
+            if not in_repo:
+                options, menu_text = self._MENU_OUT_REPO, self._MENU_OUT_REPO_TEXT
+            elif self.has_advanced_features():
+                options, menu_text = self._MENU_IN_REPO_ADV, self._MENU_IN_REPO_ADV_TEXT
+            else:
+                options, menu_text = self._MENU_IN_REPO, self._MENU_IN_REPO_TEXT
+            
+            # Render the whole frame in one write
+            lines = [
+                "=" * 50,
+                "🚀 Interactive Git Wrapper",
+                "=" * 50,
+                f"📁 Directory: {current_dir}",
+                f"📊 Status: {repo_status}",
+                "=" * 50
+            ]
+            if in_repo:
+                lines.append(f"🌿 Current Branch: {branch}")
+                lines.append(f"📝 Uncommitted Changes: {changes} files" if changes
+                             else "📝 Working Directory: Clean")
+                lines.append("-" * 50)
+            lines.append(menu_text)
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+            
+            # Show the error from the previous frame instead of pausing on it
+            if self._pending_error:
+                print()
+                self.print_error(self._pending_error)
+                self._pending_error = None
+            
+            try:
+                choice = int(self._read_number(f"\nEnter your choice (1-{len(options)}): "))
+                if 1 <= choice <= len(options):
+                    _, method_name, args = options[choice-1]
+                    getattr(self, method_name)(*args)
+                else:
+                    self._pending_error = "Invalid choice!"
+            except ValueError:
+                self._pending_error = "Please enter a valid number!"
+            except KeyboardInterrupt:
+                print("\n\nGoodbye! 👋")
+                break
+    
+    def handle_menu_choice(self, choice):
+        """Handle menu selection by its exact option label"""
+        entry = self._MENU_HANDLERS.get(choice)
+        if entry:
+            method_name, args = entry
+            getattr(self, method_name)(*args)
+    
+    def _exit_wrapper(self):
+        """Say goodbye and exit the interactive session"""
+        print("\nGoodbye! 👋")
+        sys.exit(0)
+    
+    def interactive_status(self):
+        """Interactive status display"""
         self.clear_screen()
-        print("🎯 Initialize Repository\n" + "=" * 25)
+        state = self._load_repo_snapshot()
+        
+        # Everything up to git's own output goes out in one write
+        lines = ["📊 Repository Status\n" + "=" * 30]
+        if state['branch']:
+            lines.append(f"🌿 Current branch: {state['branch']}")
+        if state['upstream']:
+            lines.append(f"🔗 Tracking: {state['upstream']} (ahead {state['ahead']}, behind {state['behind']})")
+        lines.extend(f"📡 Remote {name}: {url}" for name, url in state['remotes'].items())
+        lines.append("\n📝 Working Directory Status:")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        self.run_git_command(['git', 'status'])
         
-        if self.confirm("Initialize git repository in current directory?", True):
-            self.print_working("Initializing repository...")
-            if not self.run_git_command(['git', 'init']):
-                input("Press Enter to continue...")
-                return
-            
-            if self.config['name'] and self.config['email']:
-                self.run_git_command(['git', 'config', 'user.name', self.config['name']], show_output=False)
-                self.run_git_command(['git', 'config', 'user.email', self.config['email']], show_output=False)
-                self.print_info("Applied your saved configuration")
-            
-            if self.confirm("Add remote origin?", False):
-                remote_url = self.get_input("Remote URL")
-                if remote_url:
-                    if self.run_git_command(['git', 'remote', 'add', 'origin', remote_url]):
-                        self.print_success("Remote origin added")
-                        self.config['default_remote'] = 'origin'
-                        self.save_config()
-            
-            self.print_success("Repository initialized successfully!")
+        print(f"\n📜 Recent commits:")
+        self.run_git_command(['git', 'log', '--oneline', '-5'])
         
-        input("Press Enter to continue...")
+        self._pause("\nPress Enter to continue...")
     
-    def interactive_clone(self):
-        """Interactive repository cloning"""
+    def interactive_commit(self):
+        """
+        Interactive commit process.
+        
+        The message is passed to git as a single argument: run_git_batch quotes
+        every argument with shlex.join (or runs the list directly on Windows),
+        so shell metacharacters in it stay literal text. get_input already
+        rejects null bytes and control characters.
+        """
         self.clear_screen()
-        print("📥 Clone Repository\n" + "=" * 20)
+        print("💾 Quick Commit\n" + "=" * 20)
         
-        # Define validation rules for repository URL
-        url_validation_rules = {
+        # Check status with timeout
+        status = self.run_git_command(['git', 'status', '--porcelain'], 
+                                    capture_output=True, 
+                                    timeout=10, 
+                                    operation_type='status')
+        if not status:
+            self.print_info("No changes to commit!")
+            self._pause()
+            return
+        
+        print("Files to be added:")
+        print(status)
+        
+        if not self.confirm("\nAdd all changes?", True):
+            return
+        
+        # Define validation rules for commit messages
+        message_validation_rules = {
             'required': True,
-            'validator_type': 'url',
-            'pattern_error': "Please enter a valid Git repository URL (e.g., https://github.com/user/repo.git or git@github.com:user/repo.git)"
+            'min_length': 3,
+            'max_length': 500
         }
         
-        url = self.get_input("Repository URL", validation_rules=url_validation_rules)
-        if not url:
+        message = self.get_input("\nEnter commit message", validation_rules=message_validation_rules)
+        if not message:
             return
         
-        # Define validation rules for directory name
-        dir_validation_rules = {
-            'required': False,
-            'pattern': r'^[a-zA-Z0-9][a-zA-Z0-9_\-\.]*$',
-            'pattern_error': "Directory name should contain only alphanumeric characters, underscores, hyphens, and dots"
-        }
+        # Stage and commit in one shell; the commit only runs if staging succeeded
+        self.print_working(f"Adding all changes and committing with message: '{message}'")
+        if self.run_git_batch([['git', 'add', '-A'], ['git', 'commit', '-m', message]],
+                              timeout=60):
+            self.print_success("Commit successful!")
+            
+            if self.config['auto_push'] and self.confirm("Push to remote(s)?", True):
+                self.interactive_push_menu()
         
-        directory = self.get_input("Directory name (optional)", validation_rules=dir_validation_rules)
+        self._pause()
+    
+    def interactive_push_menu(self):
+        """Interactive push operations menu"""
+        self.clear_screen()
+        header = "📤 Push Operations\n" + "=" * 20
         
-        # Sanitize inputs
-        sanitized_url = self.input_validator.sanitize_url(url)
+        snapshot = self._load_repo_snapshot()
+        remotes = list(snapshot['remotes'])
+        if not remotes:
+            print(header)
+            self.print_error("No remotes configured!")
+            self._pause()
+            return
         
-        cmd = ['git', 'clone', sanitized_url]
-        if directory:
-            sanitized_directory = self.input_validator.sanitize_filename(directory)
-            cmd.append(sanitized_directory)
+        sys.stdout.write("\n".join((
+            header,
+            f"Current branch: {snapshot['branch'] or 'unknown'}",
+            f"Available remotes: {', '.join(remotes)}",
+            "-" * 30,
+            ""
+        )))
+        sys.stdout.flush()
         
-        self.print_working(f"Cloning repository: {url}")
-        self.print_info("This may take a while for large repositories...")
+        handlers = {
+            "Push to single remote": self.interactive_push_single,
+            "Push to multiple remotes": self.interactive_push_multiple,
+            "Push to all remotes": self.interactive_push_all
+        }
         
-        # Use longer timeout for clone operations with retry
-        if self.run_git_command(cmd, timeout=300, operation_type='clone', retry_count=2):
-            self.print_success("Repository cloned successfully!")
-            
-            if directory and self.confirm("Change to cloned directory?", True):
-                try:
-                    # Sanitize directory path before changing to it
-                    safe_directory = self.input_validator.sanitize_path(directory)
-                    os.chdir(safe_directory)
-                    self.print_success(f"Changed to directory: {safe_directory}")
-                except FileNotFoundError:
-                    self.print_error("Could not change directory")
-                except PermissionError:
-                    self.print_error("Permission denied when trying to access directory")
+        choice = self.get_choice("Push Options:", list(handlers) + ["Back to main menu"])
         
-        input("Press Enter to continue...")
-    
-    def interactive_config_menu(self):
-        """Interactive configuration menu with advanced features support"""
-        while True:
-            self.clear_screen()
-            print("⚙️ Configuration\n" + "=" * 20)
-            print(f"Name: {self.config['name'] or 'Not set'}")
-            print(f"Email: {self.config['email'] or 'Not set'}")
-            print(f"Default Branch: {self.config['default_branch']}")
-            print(f"Default Remote: {self.config['default_remote']}")
-            print(f"Auto Push: {self.config['auto_push']}")
-            print(f"Show Emoji: {self.config['show_emoji']}")
-            print(f"Config Version: {self.config.get('config_version', '1.0')}")
-            print("-" * 50)
-            
-            options = [
-                "Basic Settings", "Advanced Feature Settings", "Import/Export Config",
-                "Reset Configuration", "Back to main menu"
-            ]
-            
-            choice = self.get_choice("Configuration Categories:", options)
-            
-            config_handlers = {
-                "Basic Settings": self.interactive_basic_config_menu,
-                "Advanced Feature Settings": self.interactive_advanced_features_menu,
-                "Import/Export Config": self.interactive_import_export_menu,
-                "Reset Configuration": self.interactive_reset_config_menu,
-                "Back to main menu": lambda: None
-            }
-            
-            for key, handler in config_handlers.items():
-                if key in choice:
-                    result = handler()
-                    if key == "Back to main menu":
-                        return
-                    break
-    
-    def interactive_basic_config_menu(self):
-        """Interactive basic configuration menu"""
-        while True:
-            self.clear_screen()
-            print("⚙️ Basic Configuration\n" + "=" * 30)
-            print(f"Name: {self.config['name'] or 'Not set'}")
-            print(f"Email: {self.config['email'] or 'Not set'}")
-            print(f"Default Branch: {self.config['default_branch']}")
-            print(f"Default Remote: {self.config['default_remote']}")
-            print(f"Auto Push: {self.config['auto_push']}")
-            print(f"Show Emoji: {self.config['show_emoji']}")
-            print("-" * 50)
-            
-            options = [
-                "Set Name", "Set Email", "Set Default Branch", "Set Default Remote",
-                "Toggle Auto Push", "Toggle Emoji", "Back to configuration menu"
-            ]
-            
-            choice = self.get_choice("Basic Configuration Options:", options)
-            
-            config_handlers = {
-                "Set Name": lambda: self.update_config('name', self.get_input("Enter your name", self.config['name'])),
-                "Set Email": lambda: self.update_config('email', self.get_input("Enter your email", self.config['email'])),
-                "Set Default Branch": lambda: self.update_config('default_branch', self.get_input("Enter default branch", self.config['default_branch'])),
-                "Set Default Remote": self.interactive_set_default_remote_config,
-                "Toggle Auto Push": lambda: self.toggle_config('auto_push'),
-                "Toggle Emoji": lambda: self.toggle_config('show_emoji'),
-                "Back to configuration menu": lambda: None
-            }
-            
-            for key, handler in config_handlers.items():
-                if key in choice:
-                    result = handler()
-                    if key == "Back to configuration menu":
-                        return
-                    break
-            
-            if "Back to configuration menu" not in choice:
-                time.sleep(1)
-    
-    def interactive_advanced_features_menu(self):
-        """Interactive advanced features configuration menu"""
-        while True:
-            self.clear_screen()
-            print("🚀 Advanced Features Configuration\n" + "=" * 40)
-            
-            # Show current feature status
-            features = self.config.get('advanced_features', {})
-            for feature_name, feature_config in features.items():
-                status = "✅ Configured" if feature_config else "⚠️  Default"
-                print(f"{feature_name.replace('_', ' ').title()}: {status}")
-            
-            print("-" * 50)
-            
-            options = [
-                "🗂️  Stash Management", "📝 Commit Templates", "🔀 Branch Workflows",
-                "⚔️  Conflict Resolution", "🏥 Repository Health", "💾 Smart Backup",
-                "🔧 All Features Overview", "Back to configuration menu"
-            ]
-            
-            choice = self.get_choice("Select Feature to Configure:", options)
-            
-            feature_handlers = {
-                "Stash Management": lambda: self.interactive_feature_config_menu('stash_management'),
-                "Commit Templates": lambda: self.interactive_feature_config_menu('commit_templates'),
-                "Branch Workflows": lambda: self.interactive_feature_config_menu('branch_workflows'),
-                "Conflict Resolution": lambda: self.interactive_feature_config_menu('conflict_resolution'),
-                "Repository Health": lambda: self.interactive_feature_config_menu('health_dashboard'),
-                "Smart Backup": lambda: self.interactive_feature_config_menu('backup_system'),
-                "All Features Overview": self.interactive_all_features_overview,
-                "Back to configuration menu": lambda: None
-            }
-            
-            for key, handler in feature_handlers.items():
-                if key in choice:
-                    result = handler()
-                    if key == "Back to configuration menu":
-                        return
-                    break
+        handler = handlers.get(choice)
+        if handler is not None:
+            handler(snapshot)
     
-    def interactive_feature_config_menu(self, feature_name: str):
-        """
-        Interactive configuration menu for a specific feature.
+    def interactive_push_single(self, snapshot=None):
+        """Push to a single selected remote"""
+        if snapshot is None:
+            snapshot = self._load_repo_snapshot()
+        remotes = list(snapshot['remotes'])
+        if not remotes:
+            return
         
-        Args:
-            feature_name: Name of the feature to configure
-        """
-        feature_display_name = feature_name.replace('_', ' ').title()
+        branch = self.get_input("Branch to push", snapshot['branch'] or self.config['default_branch'])
         
-        while True:
-            self.clear_screen()
-            print(f"⚙️ {feature_display_name} Configuration\n" + "=" * 50)
-            
-            # Get current feature configuration
-            feature_config = self.get_feature_config(feature_name)
-            
-            # Display current settings
-            for key, value in feature_config.items():
-                display_key = key.replace('_', ' ').title()
-                if isinstance(value, bool):
-                    display_value = "✅ Enabled" if value else "❌ Disabled"
-                elif isinstance(value, list):
-                    display_value = f"[{', '.join(map(str, value))}]"
-                else:
-                    display_value = str(value)
-                print(f"{display_key}: {display_value}")
-            
-            print("-" * 50)
-            
-            # Generate options based on feature configuration
-            options = self._get_feature_config_options(feature_name, feature_config)
-            options.extend(["Reset to Defaults", "Back to features menu"])
-            
-            choice = self.get_choice(f"{feature_display_name} Options:", options)
-            
-            if "Reset to Defaults" in choice:
-                if self.confirm(f"Reset {feature_display_name} to default settings?", False):
-                    self.reset_config_to_defaults(feature_name)
-                    time.sleep(1)
-            elif "Back to features menu" in choice:
-                return
-            else:
-                self._handle_feature_config_choice(feature_name, choice, feature_config)
-                time.sleep(1)
+        default_remote = self.config.get('default_remote', 'origin')
+        if default_remote not in remotes:
+            default_remote = remotes[0]
+        
+        remote = self.get_choice("Select remote to push to:", remotes, default_remote)
+        
+        self.print_working(f"Pushing {branch} to {remote}...")
+        if self.run_git_command(['git', 'push', remote, branch]):
+            self.print_success(f"Successfully pushed to {remote}/{branch}!")
+        
+        self._pause()
     
-    def _get_feature_config_options(self, feature_name: str, feature_config: Dict) -> List[str]:
-        """
-        Get configuration options for a specific feature.
+    def interactive_push_multiple(self, snapshot=None):
+        """Push to multiple selected remotes"""
+        if snapshot is None:
+            snapshot = self._load_repo_snapshot()
+        remotes = list(snapshot['remotes'])
+        if not remotes:
+            return
         
-        Args:
-            feature_name: Name of the feature
-            feature_config: Current feature configuration
-            
-        Returns:
-            List of configuration option strings
-        """
-        options = []
+        if len(remotes) == 1:
+            self.print_info("Only one remote available. Use single remote push instead.")
+            self._pause()
+            return
         
-        for key, value in feature_config.items():
-            display_key = key.replace('_', ' ').title()
-            
-            if isinstance(value, bool):
-                action = "Disable" if value else "Enable"
-                options.append(f"{action} {display_key}")
-            elif isinstance(value, (int, float)):
-                options.append(f"Set {display_key}")
-            elif isinstance(value, str):
-                options.append(f"Change {display_key}")
-            elif isinstance(value, list):
-                options.append(f"Modify {display_key}")
+        branch = self.get_input("Branch to push", snapshot['branch'] or self.config['default_branch'])
         
-        return options
+        selected_remotes = self.get_multiple_choice("Select remotes to push to:", remotes)
+        
+        if not selected_remotes:
+            self.print_info("No remotes selected.")
+            self._pause()
+            return
+        
+        self.print_info(f"Pushing {branch} to: {', '.join(selected_remotes)}")
+        
+        failed_remotes = self._push_to_remotes(selected_remotes, branch)
+        success_count = len(selected_remotes) - len(failed_remotes)
+        
+        print(f"\nSummary: {success_count}/{len(selected_remotes)} remotes successful")
+        if failed_remotes:
+            print(f"Failed remotes: {', '.join(failed_remotes)}")
+        
+        self._pause()
     
-    def _handle_feature_config_choice(self, feature_name: str, choice: str, feature_config: Dict):
-        """
-        Handle a feature configuration choice.
+    def interactive_push_all(self, snapshot=None):
+        """Push to all configured remotes"""
+        if snapshot is None:
+            snapshot = self._load_repo_snapshot()
+        remotes = list(snapshot['remotes'])
+        if not remotes:
+            return
         
-        Args:
-            feature_name: Name of the feature
-            choice: User's choice
-            feature_config: Current feature configuration
-        """
-        # Extract the key from the choice
-        for key, value in feature_config.items():
-            display_key = key.replace('_', ' ').title()
-            
-            if display_key in choice:
-                if isinstance(value, bool):
-                    # Toggle boolean value
-                    new_value = not value
-                    self.set_feature_config(feature_name, key, new_value)
-                    status = "enabled" if new_value else "disabled"
-                    self.print_success(f"{display_key} {status}!")
-                    
-                elif isinstance(value, (int, float)):
-                    # Get numeric input
-                    new_value = self._get_numeric_input(key, value, feature_name)
-                    if new_value is not None:
-                        self.set_feature_config(feature_name, key, new_value)
-                        self.print_success(f"{display_key} set to {new_value}!")
-                    
-                elif isinstance(value, str):
-                    # Get string input
-                    new_value = self.get_input(f"Enter new {display_key.lower()}", value)
-                    if new_value:
-                        self.set_feature_config(feature_name, key, new_value)
-                        self.print_success(f"{display_key} updated!")
-                    
-                elif isinstance(value, list):
-                    # Handle list input
-                    self._handle_list_config(feature_name, key, value, display_key)
-                
-                break
+        branch = self.get_input("Branch to push", snapshot['branch'] or self.config['default_branch'])
+        
+        if not self.confirm(f"Push {branch} to ALL {len(remotes)} remotes?", False):
+            return
+        
+        self.print_info(f"Pushing {branch} to all remotes: {', '.join(remotes)}")
+        
+        failed_remotes = self._push_to_remotes(remotes, branch)
+        success_count = len(remotes) - len(failed_remotes)
+        
+        print(f"\nSummary: {success_count}/{len(remotes)} remotes successful")
+        if failed_remotes:
+            print(f"Failed remotes: {', '.join(failed_remotes)}")
+        
+        self._pause()
     
-    def _get_numeric_input(self, key: str, current_value: float, feature_name: str) -> Optional[float]:
+    def _push_to_remotes(self, remotes: List[str], branch: str) -> List[str]:
         """
-        Get numeric input with validation.
+        Push a branch to several remotes concurrently, one git process per remote.
+        
+        Results are reported from the calling thread as each push finishes, so
+        output lines never interleave. The concurrent pushes cannot prompt;
+        remotes that failed for want of credentials are pushed again one at a
+        time through run_git_command, where git and ssh may ask the user.
+        Ctrl-C kills the pushes still running and skips those not yet started.
         
         Args:
-            key: Configuration key
-            current_value: Current value
-            feature_name: Name of the feature
+            remotes: Remote names to push to
+            branch: Branch to push
             
         Returns:
-            New numeric value or None if invalid
-        """
-        try:
-            input_str = self.get_input(f"Enter new value for {key.replace('_', ' ')}", str(current_value))
-            if not input_str:
-                return None
-            
-            # Try to parse as int first, then float
+            Remotes the push failed for (or, if cancelled, was not confirmed
+            for), in the order they were given
+        """
+        timeout = self.timeout_handler.get_recommended_timeout('push')
+        # Parallel pushes cannot share the terminal for credential prompts;
+        # credential helpers and SSH agents still work. ssh reads passphrases
+        # from the terminal itself, so it runs in batch mode unless the user
+        # configured their own ssh command, and on POSIX the pushes also get
+        # no controlling terminal
+        env = dict(os.environ, GIT_TERMINAL_PROMPT='0')
+        if not (env.get('GIT_SSH_COMMAND') or env.get('GIT_SSH')
+                or self.run_git_capture_text(['git', 'config', '--get', 'core.sshCommand'])):
+            env['GIT_SSH_COMMAND'] = 'ssh -o BatchMode=yes'
+        detach = {} if self.platform_info.get('is_windows', False) else {'start_new_session': True}
+        
+        # Detached pushes never see Ctrl-C, so the calling thread kills the
+        # running ones itself; once stopped no further push may start
+        running = set()
+        lock = threading.Lock()
+        stop = threading.Event()
+        
+        def push(remote):
+            cmd = self._with_cwd(['git', 'push', remote, branch])
+            if _resolve_git_path():
+                cmd[0] = _GIT_PATH
+            with lock:
+                if stop.is_set():
+                    return False, "cancelled"
+                try:
+                    process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                               stderr=subprocess.PIPE, text=True, env=env, **detach)
+                except OSError as e:
+                    return False, str(e)
+                running.add(process)
             try:
-                new_value = int(input_str)
-            except ValueError:
-                new_value = float(input_str)
-            
-            # Validate the value
-            if self._validate_feature_config_value(feature_name, key, new_value):
-                return new_value
+                _, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                return False, f"timed out after {timeout} seconds"
+            finally:
+                with lock:
+                    running.discard(process)
+            return process.returncode == 0, (stderr or "").strip()
+        
+        self.print_working(f"Pushing to {len(remotes)} remote(s) in parallel...")
+        pushed = set()
+        failed = set()
+        needs_auth = []
+        pool = ThreadPoolExecutor(max_workers=min(self._PUSH_WORKERS, len(remotes)))
+        futures = {pool.submit(push, remote): remote for remote in remotes}
+        try:
+            for future in as_completed(futures):
+                remote = futures[future]
+                ok, error = future.result()
+                if ok:
+                    pushed.add(remote)
+                    self.print_success(f"✓ Pushed to {remote}")
+                elif any(marker in error.lower() for marker in _AUTH_PROMPT_FAILURES):
+                    needs_auth.append(remote)
+                else:
+                    self.print_error(f"✗ Failed to push to {remote}")
+                    if error:
+                        print(f"  {error}")
+                    failed.add(remote)
+        except KeyboardInterrupt:
+            with lock:
+                stop.set()
+                for process in running:
+                    process.kill()
+            for future in futures:
+                future.cancel()
+            self.print_info("\nPush cancelled")
+            return [remote for remote in remotes if remote not in pushed]
+        finally:
+            pool.shutdown(wait=True)
+        
+        # One at a time with the terminal, so each remote can ask for credentials
+        for remote in sorted(needs_auth, key=remotes.index):
+            self.print_working(f"Pushing to {remote} (credentials may be requested)...")
+            if self.run_git_command(['git', 'push', remote, branch], operation_type='push'):
+                self.print_success(f"✓ Pushed to {remote}")
             else:
-                self.print_error("Invalid value! Please check the allowed range.")
-                return None
-                
-        except ValueError:
-            self.print_error("Please enter a valid number!")
-            return None
+                self.print_error(f"✗ Failed to push to {remote}")
+                failed.add(remote)
+        
+        return [remote for remote in remotes if remote in failed]
     
-    def _handle_list_config(self, feature_name: str, key: str, current_list: List, display_key: str):
-        """
-        Handle list configuration editing.
+    def interactive_sync(self):
+        """Interactive sync process"""
+        self.clear_screen()
+        print("🔄 Sync Repository\n" + "=" * 20)
+        
+        snapshot = self._load_repo_snapshot()
+        current_branch = snapshot['branch']
+        branch = self.get_input("Branch to sync", current_branch or self.config['default_branch'])
+        
+        # Catch mistyped branch names before pulling; a missing branch cannot be pushed
+        if branch and branch != current_branch and not self.ref_exists(f'refs/heads/{branch}'):
+            self.print_error(f"Local branch '{branch}' does not exist!")
+            self._pause()
+            return
+        
+        # Select remote for sync
+        remotes = list(snapshot['remotes'])
+        if not remotes:
+            self.print_error("No remotes configured!")
+            self._pause()
+            return
+        
+        default_remote = self.config.get('default_remote', 'origin')
+        if default_remote not in remotes:
+            default_remote = remotes[0]
+        
+        remote = self.get_choice("Select remote for sync:", remotes, default_remote)
+        
+        self.print_working(f"Syncing with {remote}/{branch}")
+        
+        if self.config['auto_push']:
+            # Pull and push in one shell; push only runs if the pull succeeded
+            self.print_working("Pulling latest changes and pushing local commits...")
+            if self.run_git_batch([['git', 'pull', remote, branch], ['git', 'push', remote, branch]]):
+                self.print_success("Sync completed successfully!")
+        else:
+            # Pull and Push
+            self.print_working("Pulling latest changes...")
+            if not self.run_git_command(['git', 'pull', remote, branch]):
+                self._pause()
+                return
+            
+            self.print_working("Pushing local commits...")
+            if self.run_git_command(['git', 'push', remote, branch]):
+                self.print_success("Sync completed successfully!")
+        
+        self._pause()
+    
+    def interactive_remote_menu(self):
+        """Interactive remote management menu"""
+        handlers = {
+            "Add remote": self.interactive_add_remote,
+            "Remove remote": self.interactive_remove_remote,
+            "List remotes": self.interactive_list_remotes,
+            "Change remote URL": self.interactive_change_remote_url,
+            "Set default remote": self.interactive_set_default_remote
+        }
+        options = list(handlers) + ["Back to main menu"]
         
-        Args:
-            feature_name: Name of the feature
-            key: Configuration key
-            current_list: Current list value
-            display_key: Display name for the key
-        """
         while True:
             self.clear_screen()
-            print(f"📝 Edit {display_key}\n" + "=" * 30)
-            
-            if current_list:
-                print("Current items:")
-                for i, item in enumerate(current_list, 1):
-                    print(f"  {i}. {item}")
+            remote_urls = self._get_remote_urls()
+            
+            lines = ["🔗 Remote Management\n" + "=" * 25]
+            if remote_urls:
+                lines.append("Current remotes:")
+                default_remote = self.config.get('default_remote')
+                for remote, url in remote_urls.items():
+                    default_marker = f" (default)" if remote == default_remote else ""
+                    lines.append(f"  {remote}: {url}{default_marker}")
+                lines.append("")
             else:
-                print("No items configured")
+                lines.append("No remotes configured\n")
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
             
-            print("-" * 30)
-            
-            options = ["Add Item", "Remove Item", "Clear All", "Done"]
-            choice = self.get_choice("List Options:", options)
+            choice = self.get_choice("Remote Operations:", options)
             
-            if "Add Item" in choice:
-                new_item = self.get_input("Enter new item")
-                if new_item and new_item not in current_list:
-                    current_list.append(new_item)
-                    self.set_feature_config(feature_name, key, current_list)
-                    self.print_success(f"Added '{new_item}'!")
-                    time.sleep(1)
-                elif new_item in current_list:
-                    self.print_error("Item already exists!")
-                    time.sleep(1)
-                    
-            elif "Remove Item" in choice and current_list:
-                item_to_remove = self.get_choice("Select item to remove:", current_list)
-                current_list.remove(item_to_remove)
-                self.set_feature_config(feature_name, key, current_list)
-                self.print_success(f"Removed '{item_to_remove}'!")
-                time.sleep(1)
-                
-            elif "Clear All" in choice:
-                if self.confirm("Clear all items?", False):
-                    current_list.clear()
-                    self.set_feature_config(feature_name, key, current_list)
-                    self.print_success("All items cleared!")
-                    time.sleep(1)
-                    
-            elif "Done" in choice:
+            handler = handlers.get(choice)
+            if handler is None:
                 break
+            handler()
     
-    def interactive_all_features_overview(self):
-        """Show overview of all feature configurations"""
-        self.clear_screen()
-        print("🔧 All Features Configuration Overview\n" + "=" * 50)
+    def interactive_set_default_remote(self):
+        """Set default remote for operations"""
+        remotes = self.get_remotes()
+        if not remotes:
+            self.print_info("No remotes configured")
+            self._pause()
+            return
         
-        features = self.config.get('advanced_features', {})
+        current_default = self.config.get('default_remote', 'origin')
+        remote = self.get_choice("Select default remote:", remotes, current_default)
         
-        for feature_name, feature_config in features.items():
-            print(f"\n📋 {feature_name.replace('_', ' ').title()}:")
-            print("-" * 30)
-            
-            for key, value in feature_config.items():
-                display_key = key.replace('_', ' ').title()
-                if isinstance(value, bool):
-                    display_value = "✅ Yes" if value else "❌ No"
-                elif isinstance(value, list):
-                    display_value = f"[{len(value)} items]"
-                else:
-                    display_value = str(value)
-                print(f"  {display_key}: {display_value}")
+        self.config['default_remote'] = remote
+        self._schedule_save()
+        self.print_success(f"Default remote set to: {remote}")
         
-        input("\nPress Enter to continue...")
+        self._pause()
     
-    def interactive_import_export_menu(self):
-        """Interactive import/export configuration menu"""
-        while True:
-            self.clear_screen()
-            print("📁 Import/Export Configuration\n" + "=" * 40)
-            
-            options = [
-                "Export Configuration", "Import Configuration", 
-                "Show Current Config Path", "Back to configuration menu"
-            ]
-            
-            choice = self.get_choice("Import/Export Options:", options)
-            
-            if "Export Configuration" in choice:
-                export_path = self.get_input("Export path (leave empty for default)", "")
-                if self.export_config(export_path if export_path else None):
-                    time.sleep(2)
-                    
-            elif "Import Configuration" in choice:
-                import_path = self.get_input("Import path")
-                if import_path:
-                    if self.import_config(import_path):
-                        time.sleep(2)
-                        
-            elif "Show Current Config Path" in choice:
-                self.print_info(f"Current config file: {self.config_file.absolute()}")
-                time.sleep(2)
+    def interactive_add_remote(self):
+        """Add a new remote"""
+        name = self.get_input("Remote name", "origin")
+        if not name:
+            return
+    
+        url = self.get_input("Remote URL")
+        if not url:
+            return
+    
+        self.print_working(f"Adding remote '{name}'...")
+        if not self.run_git_command(['git', 'remote', 'add', name, url]):
+            self._pause()
+            return
+        self._invalidate_remotes()
+    
+        self.print_success(f"Remote '{name}' added successfully!")
+    
+        # If this is the first remote, make it default
+        remotes = self.get_remotes()
+        if len(remotes) == 1:
+            self.config['default_remote'] = name
+            self._schedule_save()
+            self.print_info(f"Set as default remote: {name}")
+    
+        # Ask if user wants to set upstream tracking for all branches
+        if self.confirm(f"Set upstream tracking for all branches to '{name}'?", False):
+            self.print_working("Setting upstream tracking for all branches...")
+            if self.run_git_command(['git', 'push', '--set-upstream', name, '--all']):
+                self.print_success("Upstream tracking set for all branches!")
+            else:
+                self.print_error("Failed to set upstream tracking")
+    
+        self._pause()
+    
+    def interactive_remove_remote(self):
+        """Remove an existing remote"""
+        remotes = self.get_remotes()
+        if not remotes:
+            self.print_info("No remotes to remove")
+            self._pause()
+            return
+        
+        remote = self.get_choice("Select remote to remove:", remotes)
+        
+        if self.confirm(f"Are you sure you want to remove remote '{remote}'?", False):
+            if self.run_git_command(['git', 'remote', 'remove', remote]):
+                self._invalidate_remotes()
+                self.print_success(f"Remote '{remote}' removed successfully!")
                 
-            elif "Back to configuration menu" in choice:
-                return
+                # Update default remote if removed
+                if self.config.get('default_remote') == remote:
+                    remaining_remotes = self.get_remotes()
+                    if remaining_remotes:
+                        self.config['default_remote'] = remaining_remotes[0]
+                        self._schedule_save()
+                        self.print_info(f"Default remote changed to: {remaining_remotes[0]}")
+                    else:
+                        self.config['default_remote'] = 'origin'
+                        self._schedule_save()
+        
+        self._pause()
+    
+    def interactive_list_remotes(self):
+        """List all remotes with details"""
+        self.clear_screen()
+        print("🔗 All Remotes\n" + "=" * 15)
+        self.run_git_command(['git', 'remote', '-v'])
+        self._pause("\nPress Enter to continue...")
     
-    def interactive_reset_config_menu(self):
-        """Interactive reset configuration menu"""
+    def interactive_change_remote_url(self):
+        """Change URL of existing remote"""
+        remotes = self.get_remotes()
+        if not remotes:
+            self.print_info("No remotes configured")
+            self._pause()
+            return
+        
+        remote = self.get_choice("Select remote to modify:", remotes)
+        current_url = self.run_git_command(['git', 'remote', 'get-url', remote], capture_output=True)
+        
+        print(f"Current URL: {current_url}")
+        new_url = self.get_input("New URL")
+        if not new_url:
+            return
+        
+        if self.run_git_command(['git', 'remote', 'set-url', remote, new_url]):
+            self._invalidate_remotes()
+            self.print_success(f"URL for '{remote}' updated successfully!")
+        
+        self._pause()
+    
+    def interactive_branch_menu(self):
+        """Interactive branch operations menu"""
+        handlers = {
+            "Create new branch": self.interactive_create_branch,
+            "Switch to existing branch": self.interactive_switch_branch,
+            "List all branches": self.interactive_list_branches,
+            "Delete branch": self.interactive_delete_branch
+        }
+        options = list(handlers) + ["Back to main menu"]
+        
         while True:
             self.clear_screen()
-            print("🔄 Reset Configuration\n" + "=" * 30)
+            current_branch = self._current_branch()
             
-            options = [
-                "Reset Specific Feature", "Reset All Advanced Features", 
-                "Reset Everything", "Back to configuration menu"
-            ]
+            header = "🌿 Branch Operations\n" + "=" * 25 + "\n"
+            if current_branch:
+                header += f"Current branch: {current_branch}\n\n"
+            sys.stdout.write(header)
+            sys.stdout.flush()
             
-            choice = self.get_choice("Reset Options:", options)
+            choice = self.get_choice("Branch Operations:", options)
             
-            if "Reset Specific Feature" in choice:
-                features = list(self.config.get('advanced_features', {}).keys())
-                if features:
-                    feature = self.get_choice("Select feature to reset:", features)
-                    if self.reset_config_to_defaults(feature):
-                        time.sleep(2)
-                else:
-                    self.print_info("No features configured")
-                    time.sleep(2)
-                    
-            elif "Reset All Advanced Features" in choice:
-                if self.confirm("Reset ALL advanced feature settings?", False):
-                    default_features = self._get_default_config()['advanced_features']
-                    self.config['advanced_features'] = default_features
-                    self.save_config()
-                    self.print_success("All advanced features reset to defaults!")
-                    time.sleep(2)
-                    
-            elif "Reset Everything" in choice:
-                if self.reset_config_to_defaults():
-                    time.sleep(2)
-                    
-            elif "Back to configuration menu" in choice:
+            handler = handlers.get(choice)
+            if handler is None:
                 return
+            handler()
     
-    def interactive_set_default_remote_config(self):
-        """Set default remote from config menu"""
-        if not self.is_git_repo():
-            self.print_error("Not in a git repository")
-            return
+    def interactive_create_branch(self):
+        """Interactive branch creation"""
+        # Define validation rules for branch names
+        branch_validation_rules = {
+            'required': True,
+            'validator_type': 'branch_name',
+            'min_length': 1,
+            'max_length': 100,
+            'pattern_error': "Branch names cannot contain spaces or special characters like: ~ ^ : ? * [ \\ .. @{"
+        }
         
-        remotes = self.get_remotes()
-        if not remotes:
-            self.print_info("No remotes configured in current repository")
+        branch_name = self.get_input("Enter new branch name", validation_rules=branch_validation_rules)
+        if not branch_name:
             return
         
-        current_default = self.config.get('default_remote', 'origin')
-        remote = self.get_choice("Select default remote:", remotes, current_default)
+        self.print_working(f"Creating new branch: {branch_name}")
+        if self.run_git_command(['git', 'checkout', '-b', branch_name], timeout=30, operation_type='branch'):
+            self._invalidate_branches()
+            self.print_success(f"Created and switched to branch: {branch_name}")
         
-        self.config['default_remote'] = remote
-        self.save_config()
-        self.print_success(f"Default remote set to: {remote}")
-    
-    def update_config(self, key, value):
-        """Update configuration value"""
-        if value:
-            self.config[key] = value
-            self.save_config()
-            self.print_success(f"{key.replace('_', ' ').title()} updated!")
-    
-    def toggle_config(self, key):
-        """Toggle boolean configuration value"""
-        self.config[key] = not self.config[key]
-        self.save_config()
-        status = 'enabled' if self.config[key] else 'disabled'
-        self.print_success(f"{key.replace('_', ' ').title()} {status}!")
+        self._pause()
     
-    def get_feature_config(self, feature_name: str, key: str = None) -> Any:
+    def _get_local_branches(self):
         """
-        Get feature-specific configuration.
+        List local branches and the current branch with a single git call.
         
-        Args:
-            feature_name: Name of the feature
-            key: Specific configuration key, or None for entire feature config
-            
         Returns:
-            Configuration value or entire feature config
-        """
-        feature_config = self.config.get('advanced_features', {}).get(feature_name, {})
-        return feature_config.get(key) if key else feature_config
-    
-    def set_feature_config(self, feature_name: str, key: str, value: Any) -> bool:
-        """
-        Set feature-specific configuration.
+            Tuple of (current_branch, branches); current_branch is None when HEAD is detached
+        """
+        cwd = self._cwd or os.getcwd()
+        now = time.monotonic()
+        cached = self._branch_cache.get(cwd)
+        if cached is not None and now - cached[1] < self._BRANCH_CACHE_TTL:
+            current_branch, branches = cached[0]
+            # A checkout made outside the wrapper shows up in HEAD first
+            if (self._read_head_ref() or None) == current_branch:
+                return current_branch, list(branches)
+        
+        # Format placeholders must reach git verbatim, so skip shell escaping;
+        # the argument list is never passed through a shell. The HEAD marker
+        # goes last because captured output is stripped.
+        output = self.run_git_command(
+            ['git', 'for-each-ref', '--format=%(refname:short)\t%(HEAD)', 'refs/heads'],
+            capture_output=True, shell_escape=False
+        )
         
-        Args:
-            feature_name: Name of the feature
-            key: Configuration key to set
-            value: Value to set
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            if 'advanced_features' not in self.config:
-                self.config['advanced_features'] = {}
-            if feature_name not in self.config['advanced_features']:
-                self.config['advanced_features'][feature_name] = {}
-            
-            # Validate the value before setting
-            if self._validate_feature_config_value(feature_name, key, value):
-                self.config['advanced_features'][feature_name][key] = value
-                self.save_config()
-                return True
-            else:
-                self.print_error(f"Invalid value for {feature_name}.{key}: {value}")
-                return False
-                
-        except Exception as e:
-            self.print_error(f"Failed to set configuration: {str(e)}")
-            return False
-    
-    def _validate_feature_config_value(self, feature_name: str, key: str, value: Any) -> bool:
-        """
-        Validate a feature configuration value.
+        current_branch = None
+        branches = []
+        for line in output.splitlines():
+            name, _, marker = line.partition('\t')
+            name = name.strip()
+            if not name:
+                continue
+            if marker.strip() == '*':
+                current_branch = name
+            branches.append(name)
         
-        Args:
-            feature_name: Name of the feature
-            key: Configuration key
-            value: Value to validate
-            
-        Returns:
-            True if valid, False otherwise
-        """
-        validation_map = {
-            'stash_management': {
-                'max_stashes': lambda v: isinstance(v, int) and 1 <= v <= 200,
-                'show_preview_lines': lambda v: isinstance(v, int) and 1 <= v <= 50,
-                'cleanup_days': lambda v: isinstance(v, int) and 1 <= v <= 365,
-                'auto_name_stashes': lambda v: isinstance(v, bool),
-                'confirm_deletions': lambda v: isinstance(v, bool),
-                'auto_cleanup_old': lambda v: isinstance(v, bool)
-            },
-            'commit_templates': {
-                'default_template': lambda v: isinstance(v, str) and len(v) > 0,
-                'auto_suggest': lambda v: isinstance(v, bool),
-                'validate_conventional': lambda v: isinstance(v, bool),
-                'custom_templates_enabled': lambda v: isinstance(v, bool),
-                'template_categories': lambda v: isinstance(v, list) and all(isinstance(x, str) for x in v),
-                'require_scope': lambda v: isinstance(v, bool),
-                'require_body': lambda v: isinstance(v, bool)
-            },
-            'branch_workflows': {
-                'default_workflow': lambda v: v in ['git_flow', 'github_flow', 'gitlab_flow', 'custom'],
-                'auto_track_remotes': lambda v: isinstance(v, bool),
-                'base_branch': lambda v: isinstance(v, str) and len(v) > 0,
-                'feature_prefix': lambda v: isinstance(v, str),
-                'hotfix_prefix': lambda v: isinstance(v, str),
-                'release_prefix': lambda v: isinstance(v, str),
-                'auto_cleanup_merged': lambda v: isinstance(v, bool),
-                'confirm_branch_deletion': lambda v: isinstance(v, bool)
-            },
-            'conflict_resolution': {
-                'preferred_editor': lambda v: isinstance(v, str) and len(v) > 0,
-                'auto_stage_resolved': lambda v: isinstance(v, bool),
-                'show_conflict_markers': lambda v: isinstance(v, bool),
-                'backup_before_resolve': lambda v: isinstance(v, bool),
-                'preferred_merge_tool': lambda v: isinstance(v, str) and len(v) > 0,
-                'auto_continue_merge': lambda v: isinstance(v, bool)
-            },
-            'health_dashboard': {
-                'stale_branch_days': lambda v: isinstance(v, int) and 1 <= v <= 365,
-                'large_file_threshold_mb': lambda v: isinstance(v, (int, float)) and 0.1 <= v <= 1000,
-                'auto_refresh': lambda v: isinstance(v, bool),
-                'show_contributor_stats': lambda v: isinstance(v, bool),
-                'check_remote_branches': lambda v: isinstance(v, bool),
-                'warn_large_repo_size_gb': lambda v: isinstance(v, (int, float)) and 0.1 <= v <= 100,
-                'max_branches_to_analyze': lambda v: isinstance(v, int) and 10 <= v <= 1000
-            },
-            'backup_system': {
-                'backup_remotes': lambda v: isinstance(v, list) and all(isinstance(x, str) for x in v),
-                'auto_backup_branches': lambda v: isinstance(v, list) and all(isinstance(x, str) for x in v),
-                'retention_days': lambda v: isinstance(v, int) and 1 <= v <= 3650,
-                'backup_frequency': lambda v: v in ['manual', 'daily', 'weekly', 'monthly'],
-                'compress_backups': lambda v: isinstance(v, bool),
-                'verify_backup_integrity': lambda v: isinstance(v, bool),
-                'notification_on_failure': lambda v: isinstance(v, bool),
-                'max_backup_size_gb': lambda v: isinstance(v, (int, float)) and 0.1 <= v <= 100
-            }
-        }
+        self._branch_cache[cwd] = ((current_branch, tuple(branches)), now)
+        return current_branch, branches
+    
+    def interactive_switch_branch(self):
+        """Interactive branch switching"""
+        current_branch, branches = self._get_local_branches()
+        if not branches:
+            return
         
-        if feature_name in validation_map and key in validation_map[feature_name]:
-            try:
-                return validation_map[feature_name][key](value)
-            except Exception:
-                return False
+        if len(branches) > 1:
+            branches = [b for b in branches if b != current_branch]
         
-        # If no specific validation rule, allow any value
-        return True
-    
-    def show_help(self):
-        """Show comprehensive help information with feature-specific documentation"""
-        # Use the dedicated help system if available
-        help_system = self.get_feature_manager('help')
-        if help_system:
-            help_system.show_help()
+        if not branches:
+            self.print_info("No other branches available")
+            self._pause()
             return
-            
-        # Fallback to basic help if help system is not available
-        self.clear_screen()
-        print("❓ Git Wrapper Help\n" + "=" * 25)
-        
-        # Show main help menu
-        help_options = [
-            "📖 General Overview",
-            "⚡ Quick Commands",
-            "🗂️  Stash Management Help",
-            "📝 Commit Templates Help", 
-            "🔀 Branch Workflows Help",
-            "⚔️  Conflict Resolution Help",
-            "🏥 Repository Health Help",
-            "💾 Smart Backup Help",
-            "🔧 Configuration Help",
-            "💡 Tips & Best Practices",
-            "🚪 Back to Main Menu"
-        ]
         
-        while True:
-            print("\nSelect help topic:")
-            for i, option in enumerate(help_options, 1):
-                print(f"  {i}. {option}")
-            
-            try:
-                choice = int(input(f"\nEnter choice (1-{len(help_options)}): "))
-                if 1 <= choice <= len(help_options):
-                    selected_option = help_options[choice-1]
-                    
-                    if "General Overview" in selected_option:
-                        self._show_general_help()
-                    elif "Quick Commands" in selected_option:
-                        self._show_quick_commands_help()
-                    elif "Stash Management" in selected_option:
-                        self._show_stash_help()
-                    elif "Commit Templates" in selected_option:
-                        self._show_templates_help()
-                    elif "Branch Workflows" in selected_option:
-                        self._show_workflows_help()
-                    elif "Conflict Resolution" in selected_option:
-                        self._show_conflicts_help()
-                    elif "Repository Health" in selected_option:
-                        self._show_health_help()
-                    elif "Smart Backup" in selected_option:
-                        self._show_backup_help()
-                    elif "Configuration" in selected_option:
-                        self._show_config_help()
-                    elif "Tips & Best Practices" in selected_option:
-                        self._show_tips_help()
-                    elif "Back to Main Menu" in selected_option:
-                        return
-                    
-                    self.clear_screen()
-                    print("❓ Git Wrapper Help\n" + "=" * 25)
-                else:
-                    print("Invalid choice!")
-            except ValueError:
-                print("Please enter a valid number!")
-            except KeyboardInterrupt:
-                return
+        branch = self.get_choice("Select branch to switch to:", branches)
+        
+        self.print_working(f"Switching to branch: {branch}")
+        if self.run_git_command(['git', 'checkout', branch]):
+            self._invalidate_branches()
+            self.print_success(f"Switched to branch: {branch}")
+        
+        self._pause()
     
-    def _show_general_help(self):
-        """Show general overview help"""
+    def interactive_list_branches(self):
+        """Interactive branch listing"""
         self.clear_screen()
-        print("📖 General Overview\n" + "=" * 20)
-        print("""
-🚀 Interactive Git Wrapper - Advanced Git Management Tool
-
-This tool provides an intuitive interface for Git operations with advanced
-features for professional development workflows.
-
-🎯 Core Features:
-• Interactive menus for all Git operations
-• Multi-remote push support (single/multiple/all)
-• Advanced stash management with named stashes
-• Commit message templates with validation
-• Automated branch workflow management
-• Interactive conflict resolution assistant
-• Repository health monitoring and cleanup
-• Smart backup system with multiple destinations
-
-📊 Repository Status:
-The tool automatically detects Git repositories and shows:
-• Current branch and status
-• Uncommitted changes count
-• Available remotes and their status
-
-🔄 Workflow Integration:
-• Supports Git Flow, GitHub Flow, and GitLab Flow
-• Conventional commit message formatting
-• Automated branch lifecycle management
-• Conflict detection and resolution assistance
-
-🛡️ Safety Features:
-• Confirmation prompts for destructive operations
-• Automatic backups before major operations
-• Rollback capabilities for failed workflows
-• Input validation and error handling
-
-Created by Johannes Nguyen
-Enhanced with advanced Git workflow features
-        """)
-        input("\nPress Enter to continue...")
+        print("🌿 All Branches\n" + "=" * 15)
+        self.run_git_command(['git', 'branch', '-a'])
+        self._pause("\nPress Enter to continue...")
     
-    def _show_quick_commands_help(self):
-        """Show quick commands help"""
-        self.clear_screen()
-        print("⚡ Quick Commands\n" + "=" * 18)
-        print("""
-🚀 Command Line Usage:
-Run 'gw' followed by a command for quick access:
-
-📊 Basic Operations:
-• gw status     - Show detailed repository status
-• gw commit     - Quick commit with interactive message
-• gw sync       - Pull latest changes and push current branch
-• gw push       - Open push operations menu
-• gw config     - Open configuration management
-
-🗂️  Advanced Features (requires Git repository):
-• gw stash      - Open stash management interface
-• gw templates  - Access commit template system
-• gw workflows  - Manage branch workflows
-• gw conflicts  - Resolve merge conflicts interactively
-• gw health     - View repository health dashboard
-• gw backup     - Access smart backup system
-
-💡 Interactive Mode:
-• gw            - Launch full interactive menu system
-
-🔧 Configuration:
-• All commands respect your configuration settings
-• Use 'gw config' to customize behavior
-• Settings are saved automatically
-
-⌨️  Keyboard Shortcuts:
-• Ctrl+C        - Exit current operation
-• Enter         - Accept default values (shown in [brackets])
-• Tab           - Auto-complete where available
-
-🎯 Examples:
-gw status       # Quick status check
-gw commit       # Interactive commit process
-gw sync         # Pull and push in one command
-gw             # Full interactive experience
-        """)
-        input("\nPress Enter to continue...")
+    def interactive_delete_branch(self):
+        """Interactive branch deletion"""
+        current_branch, branches = self._get_local_branches()
+        if not branches:
+            return
+        
+        if len(branches) > 1:
+            branches = [b for b in branches if b != current_branch]
+        
+        if not branches:
+            self.print_info("No branches available to delete")
+            self._pause()
+            return
+        
+        branch = self.get_choice("Select branch to delete:", branches)
+        
+        if self.confirm(f"Are you sure you want to delete branch '{branch}'?", False):
+            if self.run_git_command(['git', 'branch', '-d', branch]):
+                self._invalidate_branches()
+                self.print_success(f"Deleted branch: {branch}")
+        
+        self._pause()
     
-    def _show_stash_help(self):
-        """Show stash management help"""
+    def interactive_diff(self):
+        """Interactive diff viewing"""
         self.clear_screen()
-        print("🗂️  Stash Management Help\n" + "=" * 25)
-        print("""
-🎯 Purpose:
-Advanced stash management with named stashes, search capabilities,
-and enhanced organization for temporary changes.
-
-✨ Key Features:
-• Named stashes with custom descriptions
-• Search stashes by name or content
-• Preview stash contents before applying
-• Organized stash listing with timestamps
-• Batch stash operations
-
-📋 Main Operations:
-
-1️⃣  Create Named Stash:
-   • Save current changes with a custom name
-   • Add optional description for context
-   • Automatically includes untracked files option
-
-2️⃣  List & Browse Stashes:
-   • View all stashes with names and timestamps
-   • See stash content preview
-   • Navigate through stash history
-
-3️⃣  Search Stashes:
-   • Find stashes by custom name
-   • Search within stash content
-   • Filter by date or file patterns
-
-4️⃣  Apply/Pop Stashes:
-   • Apply stash while keeping it in stash list
-   • Pop stash (apply and remove from list)
-   • Handle conflicts during application
-
-5️⃣  Stash Management:
-   • Delete individual stashes with confirmation
-   • Clean up old stashes automatically
-   • Export/import stash metadata
-
-🔧 Configuration Options:
-• auto_name_stashes: Automatically suggest names
-• max_stashes: Maximum number of stashes to keep
-• show_preview_lines: Lines to show in preview
-• confirm_deletions: Require confirmation for deletions
-
-💡 Best Practices:
-• Use descriptive names for stashes
-• Regular cleanup of old stashes
-• Preview before applying to avoid conflicts
-• Use search to quickly find specific changes
-
-🗃️  Storage:
-Stash metadata is stored in .git/gitwrapper_stashes.json
-        """)
-        input("\nPress Enter to continue...")
+        
+        diff_commands = {
+            "Unstaged changes": ['git', 'diff'],
+            "Staged changes": ['git', 'diff', '--cached']
+        }
+        diff_type = self.get_choice("What changes to view?", list(diff_commands))
+        
+        print(f"📋 {diff_type}:")
+        self.run_git_command(diff_commands.get(diff_type, diff_commands["Unstaged changes"]))
+        
+        self._pause("\nPress Enter to continue...")
     
-    def _show_templates_help(self):
-        """Show commit templates help"""
+    def interactive_log(self):
+        """Interactive log viewing"""
         self.clear_screen()
-        print("📝 Commit Templates Help\n" + "=" * 24)
-        print("""
-🎯 Purpose:
-Standardize commit messages using predefined templates with
-support for Conventional Commits and custom formats.
-
-✨ Key Features:
-• Pre-built templates for common commit types
-• Conventional Commits format support
-• Custom template creation and management
-• Template validation and suggestions
-• Interactive template application
-
-📋 Built-in Templates:
-
-🚀 feat: New features
-   Format: feat(scope): description
-   Example: feat(auth): add user login system
-
-🐛 fix: Bug fixes
-   Format: fix(scope): description
-   Example: fix(api): handle null response errors
-
-📚 docs: Documentation changes
-   Format: docs(scope): description
-   Example: docs(readme): update installation guide
-
-🎨 style: Code style changes
-   Format: style(scope): description
-   Example: style(components): fix indentation
-
-♻️  refactor: Code refactoring
-   Format: refactor(scope): description
-   Example: refactor(utils): extract common functions
-
-✅ test: Test additions/changes
-   Format: test(scope): description
-   Example: test(auth): add login validation tests
-
-🔧 chore: Maintenance tasks
-   Format: chore(scope): description
-   Example: chore(deps): update dependencies
-
-🔧 Template Management:
-
-1️⃣  Select Template:
-   • Browse available templates by category
-   • Preview template structure
-   • See example usage
-
-2️⃣  Apply Template:
-   • Fill in template placeholders
-   • Validate conventional commit format
-   • Preview final commit message
-
-3️⃣  Custom Templates:
-   • Create your own templates
-   • Define required/optional fields
-   • Set validation rules
-
-4️⃣  Template Validation:
-   • Conventional Commits syntax checking
-   • Required field validation
-   • Format consistency checks
-
-🔧 Configuration Options:
-• default_template: Default template to suggest
-• auto_suggest: Automatically suggest templates
-• validate_conventional: Enable format validation
-• require_scope: Make scope field mandatory
-• require_body: Require commit body text
-
-💡 Best Practices:
-• Use consistent commit types across team
-• Include scope for better organization
-• Write clear, descriptive commit messages
-• Follow conventional commit format for automation
-
-🗃️  Storage:
-Templates are stored in ~/.gitwrapper_templates.json
-        """)
-        input("\nPress Enter to continue...")
+        
+        try:
+            count = int(self.get_input("Number of commits to show", "10"))
+        except ValueError:
+            count = 10
+        
+        print(f"📜 Last {count} commits:")
+        self.run_git_command(['git', 'log', '--oneline', f'-{count}'])
+        
+        self._pause("\nPress Enter to continue...")
     
-    def _show_workflows_help(self):
-        """Show branch workflows help"""
+    def interactive_init(self):
+        """Interactive repository initialization"""
         self.clear_screen()
-        print("🔀 Branch Workflows Help\n" + "=" * 24)
-        print("""
-🎯 Purpose:
-Automate branch management following established Git workflows
-like Git Flow, GitHub Flow, and GitLab Flow.
-
-✨ Key Features:
-• Multiple workflow type support
-• Automated branch naming conventions
-• Merge strategy management
-• Remote tracking setup
-• Workflow rollback capabilities
-
-📋 Supported Workflows:
-
-🌊 Git Flow:
-   • feature/ branches for new features
-   • hotfix/ branches for urgent fixes
-   • release/ branches for version releases
-   • Automatic base branch detection (develop/main)
-
-🐙 GitHub Flow:
-   • Feature branches from main
-   • Pull request integration ready
-   • Simple merge back to main
-
-🦊 GitLab Flow:
-   • Environment-based branching
-   • Feature branches with environment promotion
-   • Release branch management
-
-🔧 Workflow Operations:
-
-1️⃣  Start Feature Branch:
-   • Automatically create from base branch
-   • Apply naming conventions
-   • Set up remote tracking
-   • Initialize branch metadata
-
-2️⃣  Work on Feature:
-   • Regular commit and push operations
-   • Conflict detection and resolution
-   • Progress tracking
-
-3️⃣  Finish Feature:
-   • Choose merge strategy (merge/rebase/squash)
-   • Automatic conflict resolution
-   • Clean up local and remote branches
-   • Update base branch
-
-4️⃣  Hotfix Management:
-   • Emergency fix workflows
-   • Automatic versioning
-   • Multi-branch deployment
-
-🔧 Merge Strategies:
-
-🔀 Merge Commit:
-   • Preserves branch history
-   • Clear feature boundaries
-   • Good for collaborative features
-
-📏 Rebase:
-   • Linear history
-   • Clean commit timeline
-   • Good for small features
-
-🗜️  Squash Merge:
-   • Single commit per feature
-   • Clean main branch history
-   • Good for atomic features
-
-🔧 Configuration Options:
-• default_workflow: Preferred workflow type
-• auto_track_remotes: Automatic remote setup
-• base_branch: Default base branch (main/develop)
-• feature_prefix: Branch naming prefix
-• auto_cleanup_merged: Clean up after merge
-
-💡 Best Practices:
-• Choose workflow that fits team size
-• Use descriptive branch names
-• Regular integration with base branch
-• Test before finishing features
-
-🗃️  Storage:
-Workflow config stored in .git/gitwrapper_workflows.json
-        """)
-        input("\nPress Enter to continue...")
+        print("🎯 Initialize Repository\n" + "=" * 25)
+        
+        if self.confirm("Initialize git repository in current directory?", True):
+            # Ask everything up front so init, identity and remote run as one git batch
+            remote_url = None
+            if self.confirm("Add remote origin?", False):
+                remote_url = self.get_input("Remote URL")
+            
+            cmds = [['git', 'init']]
+            apply_identity = bool(self.config['name'] and self.config['email'])
+            if apply_identity:
+                cmds.append(['git', 'config', 'user.name', self.config['name']])
+                cmds.append(['git', 'config', 'user.email', self.config['email']])
+            if remote_url:
+                cmds.append(['git', 'remote', 'add', 'origin', remote_url])
+            
+            self.print_working("Initializing repository...")
+            succeeded = self.run_git_batch(cmds)
+            # Even a failed chain may have created .git or a remote
+            self.invalidate_repo_cache()
+            self._invalidate_remotes()
+            if not succeeded:
+                self._pause()
+                return
+            
+            if apply_identity:
+                self.print_info("Applied your saved configuration")
+            if remote_url:
+                self.print_success("Remote origin added")
+                self.config['default_remote'] = 'origin'
+                self._schedule_save()
+            
+            self.print_success("Repository initialized successfully!")
+        
+        self._pause()
     
-    def _show_conflicts_help(self):
-        """Show conflict resolution help"""
+    def interactive_clone(self):
+        """Interactive repository cloning"""
         self.clear_screen()
-        print("⚔️  Conflict Resolution Help\n" + "=" * 27)
-        print("""
-🎯 Purpose:
-Interactive assistance for resolving merge conflicts with
-visual tools and automated resolution strategies.
-
-✨ Key Features:
-• Visual conflict highlighting
-• Multiple resolution strategies
-• Editor integration
-• Conflict preview and comparison
-• Automated resolution for simple conflicts
-
-📋 Conflict Resolution Process:
-
-1️⃣  Conflict Detection:
-   • Automatic detection during merge operations
-   • List all conflicted files
-   • Show conflict summary and statistics
-
-2️⃣  Conflict Analysis:
-   • Preview conflicted sections
-   • Show both versions side-by-side
-   • Highlight conflict markers (<<<, ===, >>>)
-
-3️⃣  Resolution Strategies:
-
-   🏠 Accept Ours:
-   • Keep local version (current branch)
-   • Discard incoming changes
-   • Good for protecting local work
-
-   🌐 Accept Theirs:
-   • Keep remote version (merging branch)
-   • Discard local changes
-   • Good for accepting upstream changes
-
-   ✏️  Manual Edit:
-   • Open file in configured editor
-   • Manually resolve conflicts
-   • Full control over final result
-
-   🤖 Auto-resolve:
-   • Automatic resolution for simple conflicts
-   • Non-overlapping changes
-   • Safe merge of compatible changes
-
-4️⃣  Conflict Finalization:
-   • Stage resolved files
-   • Complete merge commit
-   • Verify resolution success
-
-🔧 Editor Integration:
-• Supports popular editors (VS Code, Vim, Emacs)
-• Syntax highlighting for conflict markers
-• Side-by-side diff view
-• Jump to next/previous conflict
-
-🔧 Advanced Features:
-
-🔍 Conflict Preview:
-   • Show conflicts without applying changes
-   • Compare different resolution strategies
-   • Preview final result
-
-🔄 Merge Tools:
-   • Integration with external merge tools
-   • Visual diff and merge interfaces
-   • Three-way merge support
-
-📊 Conflict Statistics:
-   • Number of conflicted files
-   • Types of conflicts (content, rename, delete)
-   • Resolution progress tracking
-
-🔧 Configuration Options:
-• preferred_editor: Default editor for manual resolution
-• auto_stage_resolved: Automatically stage resolved files
-• show_conflict_markers: Highlight conflict markers
-• backup_before_resolve: Create backup before resolution
-
-💡 Best Practices:
-• Understand both versions before resolving
-• Test resolved code before committing
-• Use meaningful commit messages for merges
-• Regular integration to minimize conflicts
-
-⚠️  Safety Features:
-• Automatic backups before resolution
-• Rollback capability for failed merges
-• Confirmation prompts for destructive actions
-        """)
-        input("\nPress Enter to continue...")
+        print("📥 Clone Repository\n" + "=" * 20)
+        
+        # Define validation rules for repository URL
+        url_validation_rules = {
+            'required': True,
+            'validator_type': 'url',
+            'pattern_error': "Please enter a valid Git repository URL (e.g., https://github.com/user/repo.git or git@github.com:user/repo.git)"
+        }
+        
+        url = self.get_input("Repository URL", validation_rules=url_validation_rules)
+        if not url:
+            return
+        
+        # Define validation rules for directory name
+        dir_validation_rules = {
+            'required': False,
+            'pattern': r'^[a-zA-Z0-9][a-zA-Z0-9_\-\.]*$',
+            'pattern_error': "Directory name should contain only alphanumeric characters, underscores, hyphens, and dots"
+        }
+        
+        directory = self.get_input("Directory name (optional)", validation_rules=dir_validation_rules)
+        
+        # Sanitize inputs
+        sanitized_url = self.input_validator.sanitize_url(url)
+        
+        cmd = self._build_clone_command(sanitized_url)
+        base_dir = self._cwd or os.getcwd()
+        if directory:
+            # One resolve serves the clone argument and the later chdir
+            try:
+                target = self.input_validator.validate_directory(directory, base_dir)
+            except InputValidationError as e:
+                self.print_error(e.message)
+                self._pause()
+                return
+            cmd.append(target.name)
+            target_path = str(target)
+        else:
+            target_path = os.path.join(base_dir, self._clone_target_dir(sanitized_url))
+        
+        self.print_working(f"Cloning repository: {url}")
+        self.print_info("This may take a while for large repositories...")
+        
+        # Only the clone itself decides success; clone progress on stderr
+        # still reaches the terminal
+        try:
+            cloned = self.run_git_batch([cmd], timeout=300)
+        except KeyboardInterrupt:
+            # Ctrl-C reaches git too, which removes the partial clone; only
+            # the clone is abandoned, not the whole session
+            self.print_info("\nClone cancelled")
+            self._pause()
+            return
+        if cloned:
+            self.print_success("Repository cloned successfully!")
+            
+            # Without a directory argument the checkout path is a guess of the
+            # name git picked; probe it only if it is there
+            if os.path.isdir(os.path.join(target_path, '.git')):
+                probe_output = self.run_git_batch(
+                    [['git', '-C', target_path, 'remote', '-v'],
+                     ['git', '-C', target_path, 'status', '--porcelain=v2', '--branch']],
+                    capture_output=True
+                )
+                if probe_output:
+                    self._repo_state = self._parse_repo_snapshot(probe_output)
+                    self._repo_state['path'] = target_path
+            
+            if directory and self.confirm("Change to cloned directory?", True):
+                try:
+                    os.chdir(target_path)
+                    self._refresh_cwd()
+                    self.invalidate_repo_cache()
+                    self.print_success(f"Changed to directory: {target_path}")
+                except FileNotFoundError:
+                    self.print_error("Could not change directory")
+                except PermissionError:
+                    self.print_error("Permission denied when trying to access directory")
+        
+        self._pause()
+    
+    def _clone_target_dir(self, url: str) -> str:
+        """
+        Guess the directory name `git clone` picks when none is given.
+        
+        Only used to find the new checkout for the post-clone probe; a wrong
+        guess (e.g. a bare host:port URL or a bundle path) just skips the probe.
+        
+        Args:
+            url: Repository URL
+            
+        Returns:
+            Directory name derived from the last path component of the URL
+        """
+        name = url.rstrip('/')
+        if name.endswith('/.git'):
+            name = name[:-5]
+        name = name.replace(':', '/').rsplit('/', 1)[-1]
+        return name[:-4] if name.endswith('.git') else name
+    
+    def _parse_repo_snapshot(self, output: str) -> Dict[str, Any]:
+        """
+        Parse the combined `remote -v` and `status --porcelain=v2 --branch` output.
+        
+        Args:
+            output: Captured stdout of the repository probe
+            
+        Returns:
+            Repository state with branch, upstream, ahead/behind, remotes and change count
+        """
+        state = {'branch': None, 'upstream': None, 'ahead': 0, 'behind': 0,
+                 'remotes': {}, 'changes': 0}
+        
+        for line in output.splitlines():
+            if line.startswith('# branch.head '):
+                head = line[len('# branch.head '):]
+                state['branch'] = None if head == '(detached)' else head
+            elif line.startswith('# branch.upstream '):
+                state['upstream'] = line[len('# branch.upstream '):]
+            elif line.startswith('# branch.ab '):
+                ahead, _, behind = line[len('# branch.ab '):].partition(' ')
+                state['ahead'], state['behind'] = abs(int(ahead)), abs(int(behind))
+            elif line.startswith('#'):
+                continue
+            elif line[:2] in ('1 ', '2 ', 'u ', '? ', '! '):
+                # Change entries; rename entries also contain a tab, and remote
+                # names cannot contain spaces, so check these first
+                state['changes'] += 1
+            elif '\t' in line:
+                # remote -v: "<name>\t<url> (fetch)"
+                name, _, rest = line.partition('\t')
+                state['remotes'].setdefault(name, rest.rsplit(' ', 1)[0])
+        
+        return state
+    
+    def _get_remote_urls(self) -> Dict[str, str]:
+        """
+        Map each remote to its fetch URL with a single `git remote -v`.
+        
+        Returns:
+            Remote name -> URL, in git's listing order
+        """
+        output = self.run_git_capture_text(['git', 'remote', '-v'])
+        return self._parse_repo_snapshot(output)['remotes']
+    
+    def _build_clone_command(self, url: str) -> List[str]:
+        """
+        Build a `git clone` command with the configured performance flags.
+        
+        Args:
+            url: Repository URL to clone
+            
+        Returns:
+            Clone command as list of strings
+        """
+        cmd = ['git', 'clone']
+        
+        jobs = self.config.get('clone_jobs') or os.cpu_count() or 1
+        cmd.append(f'--jobs={jobs}')
+        
+        # Partial clone needs git 2.19+; older versions would reject the flag
+        clone_filter = self.config.get('clone_filter')
+        if clone_filter and _git_version() >= (2, 19):
+            cmd.append(f'--filter={clone_filter}')
+        
+        depth = self.config.get('clone_depth')
+        if depth:
+            cmd.append(f'--depth={depth}')
+        
+        cmd.append(url)
+        return cmd
+    
+    def interactive_config_menu(self):
+        """Interactive configuration menu with advanced features support"""
+        config_handlers = {
+            "Basic Settings": self.interactive_basic_config_menu,
+            "Advanced Feature Settings": self.interactive_advanced_features_menu,
+            "Import/Export Config": self.interactive_import_export_menu,
+            "Reset Configuration": self.interactive_reset_config_menu
+        }
+        options = list(config_handlers) + ["Back to main menu"]
+        
+        while True:
+            # Settings changed in a submenu are written on the way back here
+            self._flush_config()
+            self.clear_screen()
+            # Render the whole summary in one write
+            sys.stdout.write("\n".join((
+                "⚙️ Configuration\n" + "=" * 20,
+                f"Name: {self.config['name'] or 'Not set'}",
+                f"Email: {self.config['email'] or 'Not set'}",
+                f"Default Branch: {self.config['default_branch']}",
+                f"Default Remote: {self.config['default_remote']}",
+                f"Auto Push: {self.config['auto_push']}",
+                f"Show Emoji: {self.config['show_emoji']}",
+                f"Config Version: {self.config.get('config_version', '1.0')}",
+                "-" * 50,
+                ""
+            )))
+            sys.stdout.flush()
+            
+            choice = self.get_choice("Configuration Categories:", options)
+            
+            handler = config_handlers.get(choice)
+            if handler is None:
+                return
+            handler()
+    
+    def interactive_basic_config_menu(self):
+        """Interactive basic configuration menu"""
+        config_handlers = {
+            "Set Name": self._set_name,
+            "Set Email": self._set_email,
+            "Set Default Branch": self._set_default_branch,
+            "Set Default Remote": self.interactive_set_default_remote_config,
+            "Toggle Auto Push": self._toggle_auto_push,
+            "Toggle Emoji": self._toggle_emoji,
+            "Toggle Pause After Actions": self._toggle_no_pause,
+            "Set Clone Jobs": self._set_clone_jobs,
+            "Set Clone Filter": self._set_clone_filter,
+            "Set Clone Depth": self._set_clone_depth
+        }
+        options = list(config_handlers) + ["Back to configuration menu"]
+        
+        while True:
+            self.clear_screen()
+            # Render the whole summary in one write
+            sys.stdout.write("\n".join((
+                "⚙️ Basic Configuration\n" + "=" * 30,
+                f"Name: {self.config['name'] or 'Not set'}",
+                f"Email: {self.config['email'] or 'Not set'}",
+                f"Default Branch: {self.config['default_branch']}",
+                f"Default Remote: {self.config['default_remote']}",
+                f"Auto Push: {self.config['auto_push']}",
+                f"Show Emoji: {self.config['show_emoji']}",
+                f"Pause After Actions: {not self.config.get('no_pause', False)}",
+                f"Clone Jobs: {self.config.get('clone_jobs') or 'Auto'}",
+                f"Clone Filter: {self.config.get('clone_filter') or 'None (full clone)'}",
+                f"Clone Depth: {self.config.get('clone_depth') or 'Full history'}",
+                "-" * 50,
+                ""
+            )))
+            sys.stdout.flush()
+            
+            choice = self.get_choice("Basic Configuration Options:", options)
+            
+            handler = config_handlers.get(choice)
+            if handler is None:
+                return
+            handler()
+            self._linger(1)
+    
+    def _set_name(self) -> None:
+        """Prompt for and save the user name"""
+        self.update_config('name', self.get_input("Enter your name", self.config['name']))
+    
+    def _set_email(self) -> None:
+        """Prompt for and save the user email"""
+        self.update_config('email', self.get_input("Enter your email", self.config['email']))
+    
+    def _set_default_branch(self) -> None:
+        """Prompt for and save the default branch"""
+        self.update_config('default_branch', self.get_input("Enter default branch", self.config['default_branch']))
+    
+    def _toggle_auto_push(self) -> None:
+        """Toggle pushing after commits"""
+        self.toggle_config('auto_push')
+    
+    def _toggle_emoji(self) -> None:
+        """Toggle emoji output"""
+        self.toggle_config('show_emoji')
+    
+    def _toggle_no_pause(self) -> None:
+        """Toggle skipping the pause after each action"""
+        self.toggle_config('no_pause')
+    
+    def _set_clone_jobs(self) -> None:
+        """Prompt for the number of parallel clone jobs"""
+        self._set_clone_number('clone_jobs', "Parallel clone jobs (0 = one per CPU)", 64)
+    
+    def _set_clone_depth(self) -> None:
+        """Prompt for the shallow clone depth"""
+        self._set_clone_number('clone_depth', "Clone depth (0 = full history)", 1000000)
+    
+    def _set_clone_number(self, key: str, prompt: str, max_value: int) -> None:
+        """
+        Prompt for a non-negative integer clone setting and save it.
+        
+        Args:
+            key: Configuration key
+            prompt: Prompt text to display
+            max_value: Largest accepted value
+        """
+        value = self.get_input(prompt, str(self.config.get(key, 0)))
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            self.print_error("Please enter a valid number!")
+            return
+        
+        if not 0 <= number <= max_value:
+            self.print_error(f"Value must be between 0 and {max_value}!")
+            return
+        
+        self.config[key] = number
+        self._schedule_save()
+        self.print_success(f"{_pretty(key)} updated!")
+    
+    def _set_clone_filter(self) -> None:
+        """Choose the partial clone filter used by interactive clone"""
+        filters = {
+            "None (full clone)": '',
+            "blob:none (fetch file contents on demand)": 'blob:none',
+            "tree:0 (fetch trees and contents on demand)": 'tree:0'
+        }
+        choice = self.get_choice("Select clone filter:", list(filters))
+        
+        self.config['clone_filter'] = filters[choice]
+        self._schedule_save()
+        self.print_success("Clone Filter updated!")
+    
+    def interactive_advanced_features_menu(self):
+        """Interactive advanced features configuration menu"""
+        # Option label -> feature config section (None opens the overview)
+        feature_sections = {
+            "🗂️  Stash Management": 'stash_management',
+            "📝 Commit Templates": 'commit_templates',
+            "🔀 Branch Workflows": 'branch_workflows',
+            "⚔️  Conflict Resolution": 'conflict_resolution',
+            "🏥 Repository Health": 'health_dashboard',
+            "💾 Smart Backup": 'backup_system',
+            "🔧 All Features Overview": None
+        }
+        options = list(feature_sections) + ["Back to configuration menu"]
+        
+        while True:
+            self.clear_screen()
+            lines = ["🚀 Advanced Features Configuration\n" + "=" * 40]
+            
+            # Show current feature status
+            features = self.config.get('advanced_features', {})
+            for feature_name, feature_config in features.items():
+                status = "✅ Configured" if feature_config else "⚠️  Default"
+                lines.append(f"{_pretty(feature_name)}: {status}")
+            
+            lines.append("-" * 50 + "\n")
+            # Render the whole frame in one write
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
+            
+            choice = self.get_choice("Select Feature to Configure:", options)
+            
+            if choice not in feature_sections:
+                return
+            section = feature_sections[choice]
+            if section is None:
+                self.interactive_all_features_overview()
+            else:
+                self.interactive_feature_config_menu(section)
+    
+    def interactive_feature_config_menu(self, feature_name: str):
+        """
+        Interactive configuration menu for a specific feature.
+        
+        Args:
+            feature_name: Name of the feature to configure
+        """
+        feature_display_name = _pretty(feature_name)
+        
+        while True:
+            self.clear_screen()
+            lines = [f"⚙️ {feature_display_name} Configuration\n" + "=" * 50]
+            
+            # Get current feature configuration
+            feature_config = self.get_feature_config(feature_name)
+            
+            # Display current settings
+            for key, display_key, kind in _feature_schema_for(feature_config):
+                value = feature_config[key]
+                if kind == 'bool':
+                    display_value = "✅ Enabled" if value else "❌ Disabled"
+                elif kind == 'list':
+                    display_value = f"[{', '.join(map(str, value))}]"
+                else:
+                    display_value = str(value)
+                lines.append(f"{display_key}: {display_value}")
+            
+            lines.append("-" * 50 + "\n")
+            # Render the whole frame in one write
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
+            
+            # Generate options based on feature configuration
+            options = self._get_feature_config_options(feature_name, feature_config)
+            options.extend(["Reset to Defaults", "Back to features menu"])
+            
+            choice = self.get_choice(f"{feature_display_name} Options:", options)
+            
+            if choice == "Reset to Defaults":
+                if self.confirm(f"Reset {feature_display_name} to default settings?", False):
+                    self.reset_config_to_defaults(feature_name)
+                    self._linger(1)
+            elif choice == "Back to features menu":
+                return
+            else:
+                self._handle_feature_config_choice(feature_name, choice, feature_config)
+                self._linger(1)
     
-    def _show_health_help(self):
-        """Show repository health help"""
-        self.clear_screen()
-        print("🏥 Repository Health Help\n" + "=" * 26)
-        print("""
-🎯 Purpose:
-Monitor repository health, identify issues, and provide
-cleanup recommendations for optimal Git repository maintenance.
-
-✨ Key Features:
-• Branch analysis and cleanup recommendations
-• Large file detection and management
-• Repository statistics and metrics
-• Stale branch identification
-• Automated health scoring
-
-📋 Health Dashboard Sections:
-
-1️⃣  Branch Analysis:
-   📊 Active Branches:
-   • List all local and remote branches
-   • Show ahead/behind status vs main branch
-   • Identify merge status and relationships
-
-   🗑️  Stale Branches:
-   • Find branches older than threshold (default: 30 days)
-   • Show last commit date and author
-   • Recommend branches for cleanup
-
-   🔀 Unmerged Branches:
-   • Identify branches not merged to main
-   • Show unique commits per branch
-   • Highlight potential work in progress
-
-2️⃣  Repository Statistics:
-   📈 Size Metrics:
-   • Total repository size
-   • Object count and pack statistics
-   • Growth trends over time
-
-   👥 Contributor Analysis:
-   • Active contributors and commit counts
-   • Contribution patterns and frequency
-   • Team collaboration metrics
-
-   📅 Activity Metrics:
-   • Commit frequency over time
-   • Peak activity periods
-   • Development velocity trends
-
-3️⃣  File Analysis:
-   📦 Large Files:
-   • Files exceeding size threshold (default: 10MB)
-   • Binary file detection and analysis
-   • Storage optimization recommendations
-
-   🗂️  File Type Distribution:
-   • Code vs documentation vs assets
-   • Language distribution statistics
-   • File organization insights
-
-4️⃣  Health Scoring:
-   🎯 Overall Score:
-   • Composite health score (0-100)
-   • Weighted scoring across categories
-   • Trend analysis over time
-
-   ⚠️  Issue Categories:
-   • Critical: Immediate attention required
-   • Warning: Should be addressed soon
-   • Info: Optimization opportunities
-
-📋 Cleanup Recommendations:
-
-🧹 Automated Cleanup:
-• Delete merged branches
-• Remove stale remote tracking branches
-• Clean up unreferenced objects
-• Optimize repository packing
-
-🔍 Manual Review:
-• Large files that could be moved to LFS
-• Branches that might need merging
-• Contributors who might need access review
-• Configuration optimizations
-
-🔧 Configuration Options:
-• stale_branch_days: Days before branch considered stale
-• large_file_threshold_mb: Size threshold for large files
-• auto_refresh: Automatically refresh dashboard
-• show_contributor_stats: Include contributor analysis
-• max_branches_to_analyze: Limit for performance
-
-📊 Export Options:
-• JSON format for automation
-• Text report for documentation
-• CSV format for spreadsheet analysis
-• Integration with external tools
-
-💡 Best Practices:
-• Regular health checks (weekly/monthly)
-• Address critical issues promptly
-• Use cleanup recommendations as guidelines
-• Monitor trends over time
-
-🔄 Automation:
-• Schedule regular health checks
-• Set up alerts for critical issues
-• Integrate with CI/CD pipelines
-• Export metrics for monitoring systems
-        """)
-        input("\nPress Enter to continue...")
+    def _get_feature_config_options(self, feature_name: str, feature_config: Dict) -> List[str]:
+        """
+        Get configuration options for a specific feature.
+        
+        Args:
+            feature_name: Name of the feature
+            feature_config: Current feature configuration
+            
+        Returns:
+            List of configuration option strings
+        """
+        options = []
+        
+        for key, display_key, kind in _feature_schema_for(feature_config):
+            if kind == 'bool':
+                action = "Disable" if feature_config[key] else "Enable"
+                options.append(f"{action} {display_key}")
+            elif kind:
+                options.append(f"{_FEATURE_SETTING_ACTIONS[kind]} {display_key}")
+        
+        return options
     
-    def _show_backup_help(self):
-        """Show smart backup help"""
-        self.clear_screen()
-        print("💾 Smart Backup Help\n" + "=" * 20)
-        print("""
-🎯 Purpose:
-Automated backup system for protecting important branches
-with multiple destinations and intelligent scheduling.
-
-✨ Key Features:
-• Multiple backup destinations
-• Scheduled and event-based backups
-• Backup verification and integrity checks
-• Restoration with conflict detection
-• Retention policy management
-
-📋 Backup System Components:
-
-1️⃣  Backup Configuration:
-   🎯 Backup Remotes:
-   • Configure multiple backup destinations
-   • Support for different remote types (Git, cloud)
-   • Automatic remote verification and testing
-
-   📅 Backup Schedules:
-   • Time-based: Daily, weekly, monthly
-   • Event-based: Before major operations
-   • Manual: On-demand backup creation
-
-   🎛️  Backup Policies:
-   • Which branches to backup automatically
-   • Retention periods for old backups
-   • Compression and optimization settings
-
-2️⃣  Backup Operations:
-   💾 Create Backup:
-   • Single branch or multiple branches
-   • Full repository or incremental
-   • Metadata and configuration backup
-
-   📋 List Backups:
-   • View all available backup versions
-   • Show backup dates and contents
-   • Compare backup versions
-
-   🔄 Restore Backup:
-   • Restore specific branches or entire repository
-   • Conflict detection with current state
-   • Selective restoration options
-
-3️⃣  Backup Types:
-
-   🔄 Incremental Backups:
-   • Only backup changes since last backup
-   • Faster backup process
-   • Efficient storage usage
-
-   📦 Full Backups:
-   • Complete repository backup
-   • Independent restore capability
-   • Higher storage requirements
-
-   🎯 Selective Backups:
-   • Backup specific branches only
-   • Custom file inclusion/exclusion
-   • Metadata-only backups
-
-4️⃣  Backup Destinations:
-
-   🌐 Remote Git Repositories:
-   • GitHub, GitLab, Bitbucket
-   • Self-hosted Git servers
-   • Multiple remote redundancy
-
-   ☁️  Cloud Storage:
-   • Integration with cloud providers
-   • Encrypted backup storage
-   • Cross-region redundancy
-
-   💽 Local Storage:
-   • External drives and NAS
-   • Network attached storage
-   • Local backup verification
-
-🔧 Advanced Features:
-
-🔐 Security:
-• Backup encryption options
-• Secure credential management
-• Access control and permissions
-
-📊 Monitoring:
-• Backup success/failure notifications
-• Storage usage monitoring
-• Backup performance metrics
-
-🔄 Automation:
-• Pre-commit backup hooks
-• CI/CD integration
-• Automated testing of backups
-
-🔧 Configuration Options:
-• backup_remotes: List of backup destinations
-• auto_backup_branches: Branches to backup automatically
-• retention_days: How long to keep backups
-• backup_frequency: How often to backup
-• compress_backups: Enable backup compression
-• verify_backup_integrity: Verify backup after creation
-
-💡 Best Practices:
-• Multiple backup destinations for redundancy
-• Regular backup verification and testing
-• Appropriate retention policies
-• Monitor backup storage usage
-• Test restoration procedures regularly
-
-⚠️  Important Notes:
-• Backups include commit history and metadata
-• Large repositories may take time to backup
-• Network connectivity required for remote backups
-• Verify backup integrity regularly
-
-🗃️  Storage:
-Backup logs stored in ~/.gitwrapper_backups.log
-        """)
-        input("\nPress Enter to continue...")
+    def _handle_feature_config_choice(self, feature_name: str, choice: str, feature_config: Dict):
+        """
+        Handle a feature configuration choice.
+        
+        Args:
+            feature_name: Name of the feature
+            choice: User's choice
+            feature_config: Current feature configuration
+        """
+        # Options read "<Action> <Title Cased Key>" (see _get_feature_config_options),
+        # so the snake_case key comes straight back out of the choice
+        display_key = choice.partition(' ')[2]
+        key = display_key.lower().replace(' ', '_')
+        value = feature_config.get(key, _MISSING)
+        if isinstance(value, bool):
+            # Toggle boolean value
+            new_value = not value
+            self.set_feature_config(feature_name, key, new_value)
+            status = "enabled" if new_value else "disabled"
+            self.print_success(f"{display_key} {status}!")
+            
+        elif isinstance(value, (int, float)):
+            # Get numeric input
+            new_value = self._get_numeric_input(key, value, feature_name)
+            if new_value is not None:
+                self.set_feature_config(feature_name, key, new_value)
+                self.print_success(f"{display_key} set to {new_value}!")
+            
+        elif isinstance(value, str):
+            # Get string input
+            new_value = self.get_input(f"Enter new {display_key.lower()}", value)
+            if new_value:
+                self.set_feature_config(feature_name, key, new_value)
+                self.print_success(f"{display_key} updated!")
+            
+        elif isinstance(value, list):
+            # Handle list input
+            self._handle_list_config(feature_name, key, value, display_key)
+    
+    def _get_numeric_input(self, key: str, current_value: float, feature_name: str) -> Optional[float]:
+        """
+        Get numeric input with validation.
+        
+        Args:
+            key: Configuration key
+            current_value: Current value
+            feature_name: Name of the feature
+            
+        Returns:
+            New numeric value or None if invalid
+        """
+        input_str = self.get_input(f"Enter new value for {key.replace('_', ' ')}", str(current_value))
+        if not input_str:
+            return None
+        
+        # Classify once: whole numbers become int, anything with a decimal point float
+        input_str = input_str.strip()
+        if not _NUM_RE.match(input_str):
+            self.print_error("Please enter a valid number!")
+            return None
+        new_value = float(input_str) if '.' in input_str else int(input_str)
+        
+        # Validate the value
+        if self._validate_feature_config_value(feature_name, key, new_value):
+            return new_value
+        else:
+            self.print_error("Invalid value! Please check the allowed range.")
+            return None
+    
+    def _handle_list_config(self, feature_name: str, key: str, current_list: List, display_key: str):
+        """
+        Handle list configuration editing.
+        
+        Args:
+            feature_name: Name of the feature
+            key: Configuration key
+            current_list: Current list value
+            display_key: Display name for the key
+        """
+        while True:
+            self.clear_screen()
+            lines = [f"📝 Edit {display_key}\n" + "=" * 30]
+            
+            if current_list:
+                lines.append("Current items:")
+                lines.extend(f"  {i}. {item}" for i, item in enumerate(current_list, 1))
+            else:
+                lines.append("No items configured")
+            
+            lines.append("-" * 30 + "\n")
+            # Render the whole frame in one write
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
+            
+            choice = self.get_choice("List Options:", self._LIST_EDIT_OPTS)
+            
+            if choice == "Add Item":
+                new_item = self.get_input("Enter new item")
+                if new_item and new_item not in current_list:
+                    current_list.append(new_item)
+                    self.set_feature_config(feature_name, key, current_list, persist=False)
+                    self.print_success(f"Added '{new_item}'!")
+                    self._linger(1)
+                elif new_item in current_list:
+                    self.print_error("Item already exists!")
+                    self._linger(1)
+                    
+            elif choice == "Remove Item" and current_list:
+                item_to_remove = self.get_choice("Select item to remove:", current_list)
+                current_list.remove(item_to_remove)
+                self.set_feature_config(feature_name, key, current_list, persist=False)
+                self.print_success(f"Removed '{item_to_remove}'!")
+                self._linger(1)
+                
+            elif choice == "Clear All":
+                if self.confirm("Clear all items?", False):
+                    current_list.clear()
+                    self.set_feature_config(feature_name, key, current_list, persist=False)
+                    self.print_success("All items cleared!")
+                    self._linger(1)
+                    
+            elif choice == "Done":
+                # Edits were batched; write them before leaving the editor
+                self._flush_config()
+                break
     
-    def _show_config_help(self):
-        """Show configuration help"""
+    def interactive_all_features_overview(self):
+        """Show overview of all feature configurations"""
         self.clear_screen()
-        print("🔧 Configuration Help\n" + "=" * 21)
-        print("""
-🎯 Purpose:
-Comprehensive configuration management for all Git Wrapper
-features with validation, import/export, and reset capabilities.
-
-✨ Key Features:
-• Feature-specific configuration sections
-• Configuration validation and migration
-• Import/export configuration profiles
-• Reset to defaults with granular control
-• Interactive configuration menus
-
-📋 Configuration Categories:
-
-1️⃣  Basic Settings:
-   👤 User Information:
-   • name: Your name for commits
-   • email: Your email for commits
-   • default_branch: Preferred default branch name
-
-   🎨 Interface Settings:
-   • show_emoji: Enable/disable emoji in output
-   • auto_push: Automatically push after commits
-   • default_remote: Preferred remote for operations
-
-2️⃣  Advanced Feature Settings:
-
-   🗂️  Stash Management:
-   • auto_name_stashes: Suggest names automatically
-   • max_stashes: Maximum stashes to keep
-   • show_preview_lines: Lines in stash preview
-   • confirm_deletions: Require deletion confirmation
-
-   📝 Commit Templates:
-   • default_template: Default template type
-   • auto_suggest: Automatically suggest templates
-   • validate_conventional: Enable format validation
-   • require_scope: Make scope field mandatory
-
-   🔀 Branch Workflows:
-   • default_workflow: Preferred workflow type
-   • auto_track_remotes: Automatic remote tracking
-   • base_branch: Default base branch
-   • auto_cleanup_merged: Clean up after merge
-
-   ⚔️  Conflict Resolution:
-   • preferred_editor: Default editor for conflicts
-   • auto_stage_resolved: Auto-stage resolved files
-   • show_conflict_markers: Highlight markers
-   • backup_before_resolve: Create safety backups
-
-   🏥 Repository Health:
-   • stale_branch_days: Days before branch is stale
-   • large_file_threshold_mb: Large file size limit
-   • auto_refresh: Auto-refresh dashboard
-   • max_branches_to_analyze: Analysis limit
-
-   💾 Smart Backup:
-   • backup_remotes: List of backup destinations
-   • auto_backup_branches: Branches to backup
-   • retention_days: Backup retention period
-   • backup_frequency: How often to backup
-
-🔧 Configuration Management:
-
-📝 Interactive Configuration:
-• Feature-by-feature configuration menus
-• Input validation and help text
-• Preview changes before saving
-• Undo/redo configuration changes
-
-📤 Export Configuration:
-• Export to JSON file for sharing
-• Create configuration templates
-• Backup current configuration
-• Share team configuration standards
-
-📥 Import Configuration:
-• Import from JSON file
-• Merge with existing configuration
-• Validate imported settings
-• Apply team configuration standards
-
-🔄 Reset Configuration:
-• Reset all settings to defaults
-• Reset specific feature settings
-• Selective configuration reset
-• Confirmation prompts for safety
-
-🔧 Configuration Files:
-
-🏠 User Configuration:
-Location: ~/.gitwrapper_config.json
-• Global settings for all repositories
-• User preferences and defaults
-• Feature enable/disable settings
-
-🗂️  Repository-Specific:
-Location: .git/gitwrapper_*.json
-• Repository-specific overrides
-• Local workflow configurations
-• Project-specific settings
-
-📋 Configuration Validation:
-
-✅ Automatic Validation:
-• Type checking for all values
-• Range validation for numeric settings
-• Path validation for file/directory settings
-• Format validation for structured data
-
-🔧 Migration Support:
-• Automatic migration between versions
-• Backward compatibility maintenance
-• Configuration upgrade notifications
-• Safe migration with backups
-
-💡 Best Practices:
-• Regular configuration backups
-• Team configuration standardization
-• Feature-specific customization
-• Performance-conscious settings
-
-🔧 Troubleshooting:
-• Configuration validation errors
-• Reset to defaults if corrupted
-• Import/export for configuration transfer
-• Debug mode for detailed logging
-
-🗃️  Storage:
-Main config: ~/.gitwrapper_config.json
-Backups: ~/.gitwrapper_config.json.backup
-        """)
-        input("\nPress Enter to continue...")
+        if self._overview_cache is None:
+            self._overview_cache = self._render_overview()
+        sys.stdout.write(self._overview_cache)
+        sys.stdout.flush()
+        
+        self._pause("\nPress Enter to continue...")
+    
+    def _render_overview(self) -> str:
+        """
+        Format every feature's settings for the all-features overview.
+        
+        Returns:
+            The overview text, ending in a newline
+        """
+        lines = ["🔧 All Features Configuration Overview\n" + "=" * 50]
+        
+        features = self.config.get('advanced_features', {})
+        
+        for feature_name, feature_config in features.items():
+            lines.append(f"\n📋 {_pretty(feature_name)}:")
+            lines.append("-" * 30)
+            
+            for key, value in feature_config.items():
+                display_key = _pretty(key)
+                if isinstance(value, bool):
+                    display_value = "✅ Yes" if value else "❌ No"
+                elif isinstance(value, list):
+                    display_value = f"[{len(value)} items]"
+                else:
+                    display_value = str(value)
+                lines.append(f"  {display_key}: {display_value}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def interactive_import_export_menu(self):
+        """Interactive import/export configuration menu"""
+        while True:
+            self.clear_screen()
+            print("📁 Import/Export Configuration\n" + "=" * 40)
+            
+            choice = self.get_choice("Import/Export Options:", self._IMPORT_EXPORT_OPTS)
+            
+            if choice == "Export Configuration":
+                export_path = self.get_input("Export path (leave empty for default)", "")
+                if self.export_config(export_path if export_path else None):
+                    self._linger(2)
+                    
+            elif choice == "Import Configuration":
+                import_path = self.get_input("Import path")
+                if import_path:
+                    if self.import_config(import_path):
+                        self._linger(2)
+                        
+            elif choice == "Show Current Config Path":
+                self.print_info(f"Current config file: {self.config_file.absolute()}")
+                self._linger(2)
+                
+            elif choice == "Back to configuration menu":
+                return
+    
+    def interactive_reset_config_menu(self):
+        """Interactive reset configuration menu"""
+        while True:
+            self.clear_screen()
+            print("🔄 Reset Configuration\n" + "=" * 30)
+            
+            choice = self.get_choice("Reset Options:", self._RESET_OPTS)
+            
+            if choice == "Reset Specific Feature":
+                features = list(self.config.get('advanced_features', {}).keys())
+                if features:
+                    feature = self.get_choice("Select feature to reset:", features)
+                    if self.reset_config_to_defaults(feature):
+                        self._linger(2)
+                else:
+                    self.print_info("No features configured")
+                    self._linger(2)
+                    
+            elif choice == "Reset All Advanced Features":
+                if self.confirm("Reset ALL advanced feature settings?", False):
+                    default_features = self._get_default_for_path('advanced_features')
+                    self.config['advanced_features'] = default_features
+                    self.save_config()
+                    self.print_success("All advanced features reset to defaults!")
+                    self._linger(2)
+                    
+            elif choice == "Reset Everything":
+                if self.reset_config_to_defaults():
+                    self._linger(2)
+                    
+            elif choice == "Back to configuration menu":
+                return
+    
+    def interactive_set_default_remote_config(self):
+        """Set default remote from config menu"""
+        if not self.is_git_repo():
+            self.print_error("Not in a git repository")
+            return
+        
+        remotes = self.get_remotes()
+        if not remotes:
+            self.print_info("No remotes configured in current repository")
+            return
+        
+        current_default = self.config.get('default_remote', 'origin')
+        remote = self.get_choice("Select default remote:", remotes, current_default)
+        
+        self.config['default_remote'] = remote
+        self._schedule_save()
+        self.print_success(f"Default remote set to: {remote}")
+    
+    def update_config(self, key, value):
+        """Update configuration value"""
+        if value:
+            self.config[key] = value
+            self._refresh_emoji_prefixes()
+            self._schedule_save()
+            self.print_success(f"{_pretty(key)} updated!")
+    
+    def toggle_config(self, key):
+        """Toggle boolean configuration value"""
+        self.config[key] = not self.config[key]
+        self._refresh_emoji_prefixes()
+        self._schedule_save()
+        status = 'enabled' if self.config[key] else 'disabled'
+        self.print_success(f"{_pretty(key)} {status}!")
+    
+    def get_feature_config(self, feature_name: str, key: str = None) -> Any:
+        """
+        Get feature-specific configuration.
+        
+        Args:
+            feature_name: Name of the feature
+            key: Specific configuration key, or None for entire feature config
+            
+        Returns:
+            Configuration value or entire feature config
+        """
+        feature_config = self.config.get('advanced_features', {}).get(feature_name, {})
+        return feature_config.get(key) if key else feature_config
+    
+    def set_feature_config(self, feature_name: str, key: str, value: Any, persist: bool = True) -> bool:
+        """
+        Set feature-specific configuration.
+        
+        Args:
+            feature_name: Name of the feature
+            key: Configuration key to set
+            value: Value to set
+            persist: Write the config file now; False only marks it for saving
+                so several edits share one write
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            feature_config = self.config.setdefault('advanced_features', {}).setdefault(feature_name, {})
+            
+            # Validate the value before setting
+            if self._validate_feature_config_value(feature_name, key, value):
+                feature_config[key] = value
+                if persist:
+                    self.save_config()
+                else:
+                    self._schedule_save()
+                return True
+            else:
+                self.print_error(f"Invalid value for {feature_name}.{key}: {value}")
+                return False
+                
+        except Exception as e:
+            self.print_error(f"Failed to set configuration: {str(e)}")
+            return False
+    
+    def _validate_feature_config_value(self, feature_name: str, key: str, value: Any) -> bool:
+        """
+        Validate a feature configuration value.
+        
+        Args:
+            feature_name: Name of the feature
+            key: Configuration key
+            value: Value to validate
+            
+        Returns:
+            True if valid, False otherwise
+        """
+        spec = _FEATURE_SCHEMA.get(feature_name, {}).get(key)
+        if spec is None:
+            # If no specific validation rule, allow any value
+            return True
+        
+        kind, low, high = spec
+        if type(kind) is range:
+            # Exact type test also keeps bools out of integer settings
+            return type(value) is int and value in kind
+        if isinstance(kind, frozenset):
+            return isinstance(value, str) and value in kind
+        # bool is an int subclass, but a toggle is never a valid size
+        if isinstance(value, bool) and kind is not bool:
+            return False
+        if not isinstance(value, kind):
+            return False
+        if kind is list:
+            # map() keeps the per-item check in C instead of a generator frame
+            return all(map(str.__instancecheck__, value))
+        if kind is str:
+            return len(value) >= (low or 0)
+        return (low is None or low <= value) and (high is None or value <= high)
     
-    def _show_tips_help(self):
-        """Show tips and best practices"""
+    def show_help(self):
+        """Show comprehensive help information with feature-specific documentation"""
+        # Use the dedicated help system if available (looked up once per session)
+        if self._help_system is None:
+            self._help_system = self.get_feature_manager('help') or False
+        if self._help_system:
+            self._help_system.show_help()
+            return
+            
+        # Fallback to basic help if help system is not available
         self.clear_screen()
-        print("💡 Tips & Best Practices\n" + "=" * 26)
-        print("""
-🎯 General Usage Tips:
-
-⌨️  Navigation:
-• Use Ctrl+C to exit any operation safely
-• Default values are shown in [brackets] - just press Enter
-• Numbers in menus correspond to options
-• Most operations have confirmation prompts
-
-🔄 Workflow Efficiency:
-• Use quick commands (gw status, gw commit) for speed
-• Set up default remote to avoid repeated selections
-• Enable auto_push for streamlined commits
-• Use named stashes for better organization
-
-📋 Feature-Specific Best Practices:
-
-🗂️  Stash Management:
-• Use descriptive names for stashes
-• Regular cleanup prevents clutter
-• Preview stashes before applying
-• Search functionality saves time with many stashes
-
-📝 Commit Templates:
-• Adopt Conventional Commits for consistency
-• Use scopes to organize changes by component
-• Create custom templates for team standards
-• Enable validation to catch format errors
-
-🔀 Branch Workflows:
-• Choose workflow that matches team size
-• Use feature branches for all new work
-• Regular integration prevents large conflicts
-• Clean up merged branches promptly
-
-⚔️  Conflict Resolution:
-• Understand both sides before resolving
-• Use preview to see conflict context
-• Test resolved code before committing
-• Keep merge commits descriptive
-
-🏥 Repository Health:
-• Run health checks regularly (weekly/monthly)
-• Address critical issues promptly
-• Use cleanup recommendations as guidelines
-• Monitor repository growth trends
-
-💾 Smart Backup:
-• Set up multiple backup destinations
-• Test restoration procedures regularly
-• Use appropriate retention policies
-• Monitor backup success/failure
-
-🔧 Performance Tips:
-
-⚡ Speed Optimization:
-• Use quick commands for common operations
-• Enable lazy loading for large repositories
-• Set reasonable limits for analysis operations
-• Use incremental backups for large repos
-
-💾 Storage Management:
-• Regular cleanup of stale branches
-• Monitor large files and consider Git LFS
-• Use repository health dashboard insights
-• Optimize Git configuration for your workflow
-
-🛡️ Safety Practices:
-
-🔒 Data Protection:
-• Always backup before major operations
-• Use confirmation prompts for destructive actions
-• Test in feature branches before main
-• Keep multiple backup destinations
-
-🔍 Quality Assurance:
-• Use commit templates for consistency
-• Regular conflict resolution practice
-• Monitor repository health metrics
-• Validate configuration changes
-
-👥 Team Collaboration:
-
-🤝 Team Standards:
-• Share configuration profiles
-• Establish commit message standards
-• Use consistent branch naming
-• Regular repository health reviews
-
-📚 Documentation:
-• Document custom workflows
-• Share best practices with team
-• Keep configuration changes documented
-• Regular training on advanced features
-
-🔧 Troubleshooting:
-
-🐛 Common Issues:
-• Configuration corruption: Reset to defaults
-• Feature not working: Check initialization
-• Performance issues: Adjust limits in config
-• Backup failures: Verify remote connectivity
-
-🔍 Debug Mode:
-• Enable debug mode for detailed logging
-• Check feature status in configuration menu
-• Verify Git repository status
-• Review error messages carefully
-
-📞 Getting Help:
-• Use context-sensitive help in feature menus
-• Check configuration validation messages
-• Review operation logs for errors
-• Reset problematic features to defaults
-
-🚀 Advanced Usage:
-
-🔧 Customization:
-• Create custom commit templates
-• Configure workflow-specific settings
-• Set up automated backup schedules
-• Customize health check thresholds
-
-🔗 Integration:
-• Use with existing Git workflows
-• Integrate with CI/CD pipelines
-• Export metrics for monitoring
-• Share configurations across team
-
-Remember: This tool is designed to enhance your Git workflow,
-not replace Git knowledge. Understanding Git fundamentals
-will help you use these features more effectively!
-        """)
-        input("\nPress Enter to continue...")
+        sys.stdout.write(self._HELP_HEADER)
+        
+        help_options = self._HELP_OPTS
+        while True:
+            sys.stdout.write(self._HELP_MENU_TEXT)
+            sys.stdout.flush()
+            
+            try:
+                raw = input(self._HELP_PROMPT).strip()
+                # Only Unicode decimal digits pass, so forms int() would also take
+                # ('+3', '3_0') are rejected and int() below cannot fail; surrounding
+                # spaces were already stripped
+                if not raw.isdecimal():
+                    print("Please enter a valid number!")
+                    continue
+                choice = int(raw)
+                if not 1 <= choice <= len(help_options):
+                    print("Invalid choice!")
+                    continue
+                
+                _, method_name, args = help_options[choice - 1]
+                if method_name is None:
+                    return
+                getattr(self, method_name)(*args)
+                
+                self.clear_screen()
+                sys.stdout.write(self._HELP_HEADER)
+            except KeyboardInterrupt:
+                return
+    
+    def _show_help_page(self, text):
+        """Show one fallback help page and wait for the user"""
+        self.clear_screen()
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        self._pause("\nPress Enter to continue...")
     
     def clear_screen(self):
         """Clear terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._clear_seq:
+            sys.stdout.write(self._clear_seq)
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
+    
+    def _detect_clear_sequence(self) -> Optional[str]:
+        """
+        Decide whether the terminal can be cleared with ANSI escapes.
+        
+        Returns:
+            The ANSI clear sequence, or None to fall back to spawning cls/clear
+        """
+        if self.platform_info.get('is_windows', False):
+            if not self._check_windows_color_support():
+                return None
+            try:
+                import colorama
+                colorama.just_fix_windows_console()
+            except (ImportError, AttributeError):
+                # Running any command once switches the console into VT mode
+                os.system('')
+        elif os.environ.get('TERM') == 'dumb':
+            return None
+        
+        # Clear screen and scrollback, then home the cursor
+        return '\x1b[2J\x1b[3J\x1b[H'
     
     def _initialize_features(self):
         """Initialize all feature managers (lazy loading)"""
@@ -3296,6 +4428,9 @@ will help you use these features more effectively!
                     print(f"  {failed['description']}: {failed['error']}")
         
         self._features_initialized = True
+        self._has_adv = len(self._feature_managers) > 0
+        # Feature managers may have filled in their default settings
+        self._overview_cache = None
     
     def get_feature_manager(self, feature_name: str):
         """
@@ -3311,9 +4446,11 @@ will help you use these features more effectively!
         return self._feature_managers.get(feature_name)
     
     def has_advanced_features(self) -> bool:
-        """Check if advanced features are available."""
-        self._initialize_features()
-        return len(self._feature_managers) > 0
+        """Check if advanced features are available (answered once per session)."""
+        if self._has_adv is None:
+            self._initialize_features()
+            self._has_adv = len(self._feature_managers) > 0
+        return self._has_adv
     
     def get_feature_status(self) -> dict:
         """
@@ -3360,7 +4497,7 @@ will help you use these features more effectively!
         """
         if not self.is_git_repo():
             self.print_error("Advanced features require a Git repository!")
-            input("Press Enter to continue...")
+            self._pause()
             return
         
         feature_manager = self.get_feature_manager(feature_name)
@@ -3369,10 +4506,10 @@ will help you use these features more effectively!
                 feature_manager.interactive_menu()
             except Exception as e:
                 self.print_error(f"Error in {feature_name} feature: {str(e)}")
-                input("Press Enter to continue...")
+                self._pause()
         else:
             self.print_error(f"Feature '{feature_name}' is not available!")
-            input("Press Enter to continue...")
+            self._pause()
     
     def _detect_platform(self) -> Dict[str, Any]:
         """
@@ -3623,39 +4760,16 @@ will help you use these features more effectively!
         Returns:
             Path to Git executable, or None if not found
         """
-        # Common Git executable names
-        git_names = ['git']
-        if platform.system().lower() == 'windows':
-            git_names.extend(['git.exe', 'git.cmd', 'git.bat'])
+        # Check PATH first (shutil.which honours PATHEXT on Windows)
+        git_path = _resolve_git_path()
+        if git_path and os.path.isfile(git_path) and os.access(git_path, os.X_OK):
+            return git_path
         
-        # Check PATH first
-        for git_name in git_names:
-            try:
-                if platform.system().lower() == 'windows':
-                    # Use 'where' command on Windows
-                    result = subprocess.run(
-                        ['where', git_name],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                        shell=True
-                    )
-                else:
-                    # Use 'which' command on Unix-like systems
-                    result = subprocess.run(
-                        ['which', git_name],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    git_path = result.stdout.strip().split('\n')[0]
-                    # Verify the executable exists and is executable
-                    if os.path.isfile(git_path) and os.access(git_path, os.X_OK):
-                        return git_path
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                continue
+        if platform.system().lower() == 'windows':
+            for git_name in ['git.exe', 'git.cmd', 'git.bat']:
+                git_path = shutil.which(git_name)
+                if git_path and os.path.isfile(git_path) and os.access(git_path, os.X_OK):
+                    return git_path
         
         # Check common installation paths
         common_paths = []
@@ -4650,29 +5764,32 @@ will help you use these features more effectively!
         except Exception:
             return False
 
+# Command-line subcommands mapped to the wrapper method that handles them
+_CLI_COMMANDS = {
+    'status': 'interactive_status',
+    'commit': 'interactive_commit',
+    'sync': 'interactive_sync',
+    'push': 'interactive_push_menu',
+    'config': 'interactive_config_menu',
+    'help': 'show_help'
+}
+
+
 def main():
     """Main entry point"""
-    git = InteractiveGitWrapper()
-    
+    # Validate the subcommand before paying for config loading and git probing
     if len(sys.argv) > 1:
         command = sys.argv[1].lower()
         
-        handlers = {
-            'status': git.interactive_status,
-            'commit': git.interactive_commit,
-            'sync': git.interactive_sync,
-            'push': git.interactive_push_menu,
-            'config': git.interactive_config_menu,
-            'help': git.show_help
-        }
-        
-        if command in handlers:
-            handlers[command]()
+        handler_name = _CLI_COMMANDS.get(command)
+        if handler_name:
+            getattr(InteractiveGitWrapper(), handler_name)()
         else:
             print(f"Unknown command: {command}")
             print("Available commands: status, commit, sync, push, config")
             print("Or run 'gw' without arguments for interactive mode")
     else:
+        git = InteractiveGitWrapper()
         try:
             git.show_main_menu()
         except KeyboardInterrupt:
@@ -60,6 +60,36 @@ class TestConfigurationManagement(unittest.TestCase):
             self.assertIn(feature, advanced_features)
             self.assertIsInstance(advanced_features[feature], dict)
     
+    def test_default_config_copies_are_independent(self):
+        """Test that default configs are mutable copies of a shared template."""
+        first = self.wrapper._get_default_config()
+        first['advanced_features']['stash_management']['max_stashes'] = 1
+        first['advanced_features']['commit_templates']['template_categories'].append('custom')
+
+        second = self.wrapper._get_default_config()
+        self.assertEqual(second['advanced_features']['stash_management']['max_stashes'], 50)
+        self.assertNotIn('custom', second['advanced_features']['commit_templates']['template_categories'])
+        self.assertIsInstance(second['advanced_features']['backup_system']['backup_remotes'], list)
+        self.assertIn('platform', second)
+
+        categories = self.wrapper._get_default_for_path(
+            'advanced_features.commit_templates.template_categories')
+        self.assertEqual(categories, second['advanced_features']['commit_templates']['template_categories'])
+        self.assertIsInstance(categories, list)
+        self.assertIsNone(self.wrapper._get_default_for_path('advanced_features.nonexistent'))
+
+        # Repeated lookups are served from the path cache
+        import git_wrapper
+        hits = git_wrapper._default_for_path.cache_info().hits
+        self.wrapper._get_default_for_path('advanced_features.commit_templates.template_categories')
+        self.assertEqual(git_wrapper._default_for_path.cache_info().hits, hits + 1)
+
+    def test_split_path_interns_keys(self):
+        """Test that split config path keys are interned for identity lookups."""
+        import git_wrapper
+        keys = git_wrapper._split_path('advanced_features.stash_management.max_stashes')
+        self.assertIs(keys[1], git_wrapper._split_path('stash_management')[0])
+
     def test_config_validation(self):
         """Test configuration validation functionality."""
         # Test valid values
@@ -77,7 +107,57 @@ class TestConfigurationManagement(unittest.TestCase):
             'stash_management', 'max_stashes', 300))  # Too high
         self.assertFalse(self.wrapper._validate_feature_config_value(
             'branch_workflows', 'default_workflow', 'invalid_workflow'))
+        self.assertFalse(self.wrapper._validate_feature_config_value(
+            'stash_management', 'max_stashes', True))  # Toggle, not a count
+        self.assertTrue(self.wrapper._validate_feature_config_value(
+            'stash_management', 'max_stashes', 200))  # Upper bound is inclusive
+        self.assertFalse(self.wrapper._validate_feature_config_value(
+            'stash_management', 'max_stashes', 50.0))  # Count must be a whole number
+        self.assertFalse(self.wrapper._validate_feature_config_value(
+            'backup_system', 'backup_remotes', ['origin', 1]))
+        self.assertFalse(self.wrapper._validate_feature_config_value(
+            'backup_system', 'backup_frequency', ['daily']))
+        self.assertTrue(self.wrapper._validate_feature_config_value(
+            'health_dashboard', 'large_file_threshold_mb', 0.5))
+        self.assertTrue(self.wrapper._validate_feature_config_value(
+            'unknown_feature', 'anything', object()))
+    
+    def test_validate_config_null_and_unresolved_paths(self):
+        """Test that stored nulls are checked while unresolved paths are skipped."""
+        self.wrapper.config['clone_filter'] = None
+        self.wrapper.config['advanced_features']['stash_management'] = 'not a dict'
+
+        self.wrapper._validate_config()
+
+        self.assertEqual(self.wrapper.config['clone_filter'], '')
+        self.assertEqual(self.wrapper.config['advanced_features']['stash_management'], 'not a dict')
     
+    def test_clone_command_options(self):
+        """Test that clone performance settings are applied to the clone command."""
+        default_config = self.wrapper._get_default_config()
+        self.assertEqual(default_config['clone_jobs'], 0)
+        self.assertEqual(default_config['clone_filter'], '')
+        self.assertEqual(default_config['clone_depth'], 0)
+
+        # Defaults: one job per CPU, full clone
+        cmd = self.wrapper._build_clone_command('https://example.com/repo.git')
+        self.assertEqual(cmd[:2], ['git', 'clone'])
+        self.assertEqual(cmd[-1], 'https://example.com/repo.git')
+        self.assertIn(f'--jobs={os.cpu_count() or 1}', cmd)
+        self.assertFalse(any(arg.startswith(('--filter', '--depth')) for arg in cmd))
+
+        self.wrapper.config.update({'clone_jobs': 4, 'clone_filter': 'blob:none', 'clone_depth': 1})
+        with patch('git_wrapper._git_version', return_value=(2, 40, 0)):
+            cmd = self.wrapper._build_clone_command('https://example.com/repo.git')
+        self.assertIn('--jobs=4', cmd)
+        self.assertIn('--filter=blob:none', cmd)
+        self.assertIn('--depth=1', cmd)
+
+        # Old git versions do not support partial clone
+        with patch('git_wrapper._git_version', return_value=(2, 17, 1)):
+            cmd = self.wrapper._build_clone_command('https://example.com/repo.git')
+        self.assertNotIn('--filter=blob:none', cmd)
+
     def test_nested_config_access(self):
         """Test nested configuration value access."""
         # Set a nested value
@@ -147,6 +227,18 @@ class TestConfigurationManagement(unittest.TestCase):
         # Check that existing key was preserved
         self.assertEqual(base_config['level1']['level2']['keep_key'], 'keep_value')
     
+    def test_deep_merge_config_short_circuits(self):
+        """Test that empty, identical and shared overlays leave the base untouched."""
+        shared = {'keep': 1}
+        base_config = {'level1': shared, 'flag': True}
+
+        self.wrapper._deep_merge_config(base_config, {})
+        self.wrapper._deep_merge_config(base_config, base_config)
+        self.wrapper._deep_merge_config(base_config, {'level1': shared, 'other': {}})
+
+        self.assertIs(base_config['level1'], shared)
+        self.assertEqual(base_config, {'level1': {'keep': 1}, 'flag': True, 'other': {}})
+    
     def test_config_migration(self):
         """Test configuration migration from older versions."""
         # Create old version config
@@ -206,6 +298,20 @@ class TestConfigurationManagement(unittest.TestCase):
         self.assertEqual(
             self.wrapper.get_feature_config('stash_management', 'max_stashes'), 75)
     
+    def test_config_export_import_unicode_and_invalid_json(self):
+        """Test exporting non-ASCII values as UTF-8 and rejecting malformed imports."""
+        self.wrapper.config['name'] = 'Zoë Müller'
+        export_path = Path(self.temp_dir) / 'unicode_export.json'
+        with patch.object(self.wrapper, 'print_success'):
+            self.assertTrue(self.wrapper.export_config(str(export_path)))
+        self.assertEqual(json.loads(export_path.read_bytes())['name'], 'Zoë Müller')
+
+        bad_path = Path(self.temp_dir) / 'bad.json'
+        bad_path.write_text('{"name": ', encoding='utf-8')
+        with patch.object(self.wrapper, 'print_error') as mock_error:
+            self.assertFalse(self.wrapper.import_config(str(bad_path)))
+        self.assertTrue(mock_error.call_args.args[0].startswith("Invalid JSON in import file"))
+
     @patch('builtins.input', return_value='y')
     def test_reset_config_to_defaults(self, mock_input):
         """Test resetting configuration to defaults."""
@@ -280,6 +386,143 @@ class TestConfigurationManagement(unittest.TestCase):
         
         self.assertEqual(backup_config['name'], 'Initial User')
     
+    def test_config_parse_memo(self):
+        """Test that the parsed config is reused while the file is unchanged on disk."""
+        with open(self.config_file, 'w') as f:
+            json.dump({'name': 'Cached User'}, f)
+
+        self.wrapper.load_config()
+        self.assertFalse(self.config_file.with_name(self.config_file.name + '.cache').exists())
+
+        # A reload of the unchanged file skips parsing it again
+        with patch.object(self.wrapper.safe_file_ops, 'safe_read_json') as mock_read:
+            self.wrapper.load_config()
+        mock_read.assert_not_called()
+        self.assertEqual(self.wrapper.config['name'], 'Cached User')
+
+        # Editing the file invalidates the memo
+        with open(self.config_file, 'w') as f:
+            json.dump({'name': 'Edited User'}, f)
+        self.wrapper.load_config()
+        self.assertEqual(self.wrapper.config['name'], 'Edited User')
+
+        # The saved file already passed validation, so reloading it skips
+        # both parsing and another validation pass
+        self.wrapper.config['name'] = 'Saved User'
+        self.wrapper.save_config()
+        with patch.object(self.wrapper.safe_file_ops, 'safe_read_json') as mock_read, \
+             patch.object(self.wrapper, '_validate_config') as mock_validate:
+            self.wrapper.load_config()
+        mock_read.assert_not_called()
+        mock_validate.assert_not_called()
+        self.assertEqual(self.wrapper.config['name'], 'Saved User')
+
+        # Files not written by save_config are still validated
+        with open(self.config_file, 'w') as f:
+            json.dump({'name': 'Hand Edited'}, f)
+        with patch.object(self.wrapper, '_validate_config') as mock_validate:
+            self.wrapper.load_config()
+        mock_validate.assert_called_once_with()
+
+    def test_save_verification_is_opt_in(self):
+        """Test that the reload check after saving only runs when enabled."""
+        with patch.object(self.wrapper, '_verify_saved_config', return_value=True) as mock_verify:
+            self.wrapper.save_config()
+            mock_verify.assert_not_called()
+
+            self.wrapper.config['verify_on_save'] = True
+            self.wrapper.save_config()
+            mock_verify.assert_called_once_with()
+
+        with open(self.config_file, 'r') as f:
+            self.assertTrue(json.load(f)['verify_on_save'])
+
+    def test_debounced_config_save(self):
+        """Test that rapid settings changes are written back once."""
+        with patch.object(self.wrapper, 'save_config') as mock_save, \
+             patch.object(self.wrapper, 'print_success'):
+            self.wrapper.toggle_config('auto_push')
+            self.wrapper.toggle_config('show_emoji')
+            self.wrapper.update_config('name', 'Debounced User')
+            mock_save.assert_not_called()
+
+            # Pending changes are flushed in one write
+            self.wrapper._flush_config()
+            mock_save.assert_called_once_with()
+
+    def test_pending_save_flushed_at_menu_boundary(self):
+        """Test that pending changes are written on the main thread when a menu comes back."""
+        self.wrapper._schedule_save()
+        with patch.object(self.wrapper, 'save_config') as mock_save, \
+             patch.object(self.wrapper, 'clear_screen'), \
+             patch.object(self.wrapper, 'get_choice', return_value='Back to main menu'), \
+             patch('builtins.print'):
+            self.wrapper.interactive_config_menu()
+        mock_save.assert_called_once_with()
+
+    def test_failed_save_stays_pending(self):
+        """Test that a save that fails is retried by the next flush."""
+        import git_wrapper
+        self.wrapper._schedule_save()
+        with patch.object(self.wrapper.safe_file_ops, 'atomic_write_json', return_value=False), \
+             patch.object(self.wrapper, 'print_error'):
+            self.wrapper._flush_config()
+        self.assertTrue(self.wrapper._config_dirty)
+        self.assertIn(self.wrapper, git_wrapper._UNSAVED_WRAPPERS)
+
+        self.wrapper._flush_config()
+        self.assertFalse(self.wrapper._config_dirty)
+        self.assertNotIn(self.wrapper, git_wrapper._UNSAVED_WRAPPERS)
+
+    def test_pending_save_written_before_reload(self):
+        """Test that pending changes reach disk before the file is read back."""
+        with patch.object(self.wrapper, 'get_choice', return_value='tree:0 (fetch trees and contents on demand)'):
+            self.wrapper._set_clone_filter()
+        self.assertTrue(self.wrapper._config_dirty)
+
+        self.wrapper.load_config()
+
+        self.assertFalse(self.wrapper._config_dirty)
+        self.assertEqual(self.wrapper.config['clone_filter'], 'tree:0')
+        with open(self.config_file, 'r') as f:
+            self.assertEqual(json.load(f)['clone_filter'], 'tree:0')
+
+        # A direct save supersedes a pending one
+        self.wrapper._schedule_save()
+        self.wrapper.save_config()
+        self.assertFalse(self.wrapper._config_dirty)
+
+    def test_emoji_prefixes_follow_config(self):
+        """Test that print helper prefixes track the show_emoji setting."""
+        with patch('builtins.print') as mock_print:
+            self.wrapper.print_success("done")
+            self.wrapper.toggle_config('show_emoji')
+            self.wrapper.print_error("failed")
+            self.wrapper._flush_config()
+
+            self.wrapper.config['show_emoji'] = True
+            self.wrapper.save_config()
+            self.wrapper.print_info("note")
+
+        self.assertEqual([c.args[0] for c in mock_print.call_args_list],
+                         ["✅ done", "Show Emoji disabled!", "failed", "ℹ️  note"])
+
+    def test_fast_json_matches_stdlib_output(self):
+        """Test that the orjson path writes the same file as the stdlib encoder."""
+        from features.safe_file_operations import SafeFileOperations
+
+        fast_path = Path(self.temp_dir) / 'fast.json'
+        stdlib_path = Path(self.temp_dir) / 'stdlib.json'
+        self.wrapper.config['name'] = 'Jürgen Ünicode'
+        self.assertTrue(SafeFileOperations().atomic_write_json(
+            fast_path, self.wrapper.config, backup=False))
+        self.assertTrue(SafeFileOperations(fast_json=False).atomic_write_json(
+            stdlib_path, self.wrapper.config, backup=False))
+
+        self.assertEqual(fast_path.read_text(encoding='utf-8'),
+                         stdlib_path.read_text(encoding='utf-8'))
+        self.assertEqual(SafeFileOperations().safe_read_json(fast_path), self.wrapper.config)
+
     def test_invalid_config_file_handling(self):
         """Test handling of invalid configuration files."""
         # Create invalid JSON file
@@ -294,6 +537,18 @@ class TestConfigurationManagement(unittest.TestCase):
         self.assertEqual(self.wrapper.config['name'], default_config['name'])
         self.assertEqual(self.wrapper.config['config_version'], default_config['config_version'])
 
+    def test_empty_config_file_uses_defaults_without_reading(self):
+        """Test that an empty config file is treated like a missing one."""
+        self.config_file.write_text('')
+
+        with patch.object(self.wrapper.safe_file_ops, 'safe_read_json') as mock_read, \
+             patch.object(self.wrapper, 'print_error') as mock_error:
+            self.wrapper.load_config()
+
+        mock_read.assert_not_called()
+        mock_error.assert_not_called()
+        self.assertEqual(self.wrapper.config['name'], self.wrapper._get_default_config()['name'])
+
 
 if __name__ == '__main__':
     # Run the tests
@@ -185,6 +185,21 @@ class TestCrossPlatformCompatibility(unittest.TestCase):
             if test_input:
                 self.assertTrue(decoded)
     
+    def test_clear_screen_uses_ansi_sequence(self):
+        """Test that clearing the screen writes escapes instead of spawning a shell."""
+        self.wrapper._clear_seq = '\x1b[2J\x1b[3J\x1b[H'
+        with patch('git_wrapper.os.system') as mock_system, \
+             patch('git_wrapper.sys.stdout') as mock_stdout:
+            self.wrapper.clear_screen()
+        mock_system.assert_not_called()
+        mock_stdout.write.assert_called_once_with('\x1b[2J\x1b[3J\x1b[H')
+
+        # Terminals without ANSI support fall back to the shell command
+        self.wrapper._clear_seq = None
+        with patch('git_wrapper.os.system') as mock_system:
+            self.wrapper.clear_screen()
+        mock_system.assert_called_once()
+
     def test_platform_specific_config(self):
         """Test platform-specific configuration generation."""
         config = self.wrapper.get_platform_specific_config()
@@ -50,6 +50,11 @@ class TestFeatureInitialization(unittest.TestCase):
             # Second call should not trigger initialization again
             result2 = self.git_wrapper.has_advanced_features()
             self.assertTrue(result2)
+
+        # The answer is memoized for the session
+        with patch.object(self.git_wrapper, '_initialize_features') as mock_init:
+            self.assertTrue(self.git_wrapper.has_advanced_features())
+            mock_init.assert_not_called()
     
     def test_feature_manager_retrieval(self):
         """Test getting specific feature managers"""
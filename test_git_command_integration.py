@@ -9,6 +9,8 @@ import shutil
 import os
 import subprocess
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import sys
@@ -17,6 +19,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from git_wrapper import InteractiveGitWrapper
+from features.git_command_executor import RetryStrategy
 
 
 class TestGitCommandIntegration(unittest.TestCase):
@@ -348,6 +351,556 @@ class TestGitCommandIntegration(unittest.TestCase):
             os.chdir(original_dir)
             shutil.rmtree(non_git_dir, ignore_errors=True)
     
+    def test_git_capture_helpers(self):
+        """Test bytes and text capture helpers against a real repository"""
+        self.assertTrue(self.git_wrapper.is_git_repo())
+
+        self.assertEqual(self.git_wrapper.run_git_capture_bytes(['git', 'status', '--porcelain']), b'')
+        with open('new_file.txt', 'w') as f:
+            f.write('content\n')
+        status = self.git_wrapper.run_git_capture_bytes(['git', 'status', '--porcelain'])
+        self.assertIsInstance(status, bytes)
+        self.assertIn(b'new_file.txt', status)
+
+        head = self.git_wrapper.run_git_capture_text(['git', 'rev-parse', '--abbrev-ref', 'HEAD'])
+        self.assertIsInstance(head, str)
+        self.assertTrue(head)
+
+        # Failing commands yield empty output instead of raising
+        self.assertEqual(self.git_wrapper.run_git_capture_bytes(['git', 'rev-parse', 'no-such-ref']), b'')
+        self.assertEqual(self.git_wrapper.run_git_capture_text(['git', 'rev-parse', 'no-such-ref']), '')
+
+    def test_repo_detection_cached_per_directory(self):
+        """Test that repository detection is cached and can be invalidated"""
+        with patch.object(self.git_wrapper, 'run_git_capture_bytes',
+                          wraps=self.git_wrapper.run_git_capture_bytes) as mock_capture:
+            self.assertTrue(self.git_wrapper.is_git_repo())
+            self.assertTrue(self.git_wrapper.is_git_repo())
+            self.assertEqual(mock_capture.call_count, 1)
+
+            self.git_wrapper.invalidate_repo_cache()
+            self.assertTrue(self.git_wrapper.is_git_repo())
+            self.assertEqual(mock_capture.call_count, 2)
+
+    def test_repo_detection_cache_expiry(self):
+        """Test that cached repository detection expires and stays bounded"""
+        with patch.object(self.git_wrapper, 'run_git_capture_bytes',
+                          wraps=self.git_wrapper.run_git_capture_bytes) as mock_capture, \
+             patch('git_wrapper.time.monotonic', return_value=1000.0) as mock_clock:
+            self.assertTrue(self.git_wrapper.is_git_repo())
+            mock_clock.return_value += self.git_wrapper._REPO_CACHE_TTL / 2
+            self.assertTrue(self.git_wrapper.is_git_repo())
+            self.assertEqual(mock_capture.call_count, 1)
+
+            mock_clock.return_value += self.git_wrapper._REPO_CACHE_TTL
+            self.assertTrue(self.git_wrapper.is_git_repo())
+            self.assertEqual(mock_capture.call_count, 2)
+
+        with patch.object(self.git_wrapper, 'run_git_capture_text', return_value=''):
+            for i in range(self.git_wrapper._REPO_CACHE_SIZE + 5):
+                self.git_wrapper._cwd = os.path.join(self.test_dir, f'dir{i}')
+                self.assertFalse(self.git_wrapper.is_git_repo())
+        self.git_wrapper._cwd = None
+        self.assertEqual(len(self.git_wrapper._repo_cwd_cache), self.git_wrapper._REPO_CACHE_SIZE)
+
+        # Git availability is only probed once
+        with patch('git_wrapper._resolve_git_path') as mock_resolve:
+            self.git_wrapper.check_git_available()
+            mock_resolve.assert_not_called()
+
+    def test_git_availability_probed_lazily(self):
+        """Test that git availability is checked on first git use, not at construction"""
+        with patch('git_wrapper._resolve_git_path', return_value=None), \
+             patch('git_wrapper.subprocess.run', side_effect=FileNotFoundError) as mock_run:
+            wrapper = InteractiveGitWrapper()
+            self.assertFalse(any(c.args[0][0] == 'git' for c in mock_run.call_args_list))
+
+            with patch.object(wrapper, 'print_error') as mock_error, \
+                 self.assertRaises(SystemExit):
+                wrapper.is_git_repo()
+        mock_error.assert_called_once_with("Git is not installed or not available in PATH")
+        self.assertFalse(wrapper.git_available)
+
+    def test_run_git_command_reuses_configs(self):
+        """Test that identical run_git_command settings share one executor config"""
+        with patch.object(self.git_wrapper.git_executor, 'execute',
+                          wraps=self.git_wrapper.git_executor.execute) as mock_execute:
+            self.git_wrapper.run_git_command(['git', 'status'], capture_output=True)
+            self.git_wrapper.run_git_command(['git', 'log', '-1'], capture_output=True, timeout=30)
+            self.git_wrapper.run_git_command(['git', 'status'], capture_output=True)
+
+        first, second, third = (c.args[1] for c in mock_execute.call_args_list)
+        self.assertIs(first, third)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.timeout, 30)
+        self.assertEqual(first.retry_strategy, RetryStrategy.EXPONENTIAL)
+        self.assertTrue(first.capture_output)
+        self.assertFalse(first.show_output)
+
+    def test_shown_output_runs_with_stdout_flushed(self):
+        """Test that pending output is flushed before git writes to the terminal"""
+        stream = Mock()
+        events = []
+        stream.flush.side_effect = lambda: events.append('flush')
+        with patch('git_wrapper.sys.stdout', stream), \
+             patch.object(self.git_wrapper.git_executor, 'execute',
+                          side_effect=lambda *a: events.append('git') or Mock(success=True)):
+            self.assertTrue(self.git_wrapper.run_git_command(['git', 'status']))
+
+        self.assertEqual(events, ['flush', 'git'])
+        stream.reconfigure.assert_not_called()
+
+    def test_failure_suggestions_by_keyword_and_operation(self):
+        """Test troubleshooting suggestions picked from stderr keywords and the git operation"""
+        result = Mock(stderr="ssh: Could not resolve hostname; Permission denied", execution_time=45.0,
+                      return_code=128)
+        suggestions = self.git_wrapper._generate_enhanced_git_suggestions(['git', 'push'], result)
+
+        self.assertEqual(suggestions[0], "Command took 45.0 seconds - consider increasing timeout")
+        self.assertLess(suggestions.index("Check your internet connection"),
+                        suggestions.index("Check file and directory permissions"))
+        self.assertIn("Verify your authentication credentials", suggestions)
+        self.assertEqual(suggestions[-1],
+                         "Return code 128 often indicates a Git usage error - check command syntax")
+
+        result = Mock(stderr="", execution_time=0.1, return_code=0)
+        self.assertEqual(self.git_wrapper._generate_enhanced_git_suggestions(['git', 'status'], result), [])
+
+    def test_run_git_batch_chains_commands(self):
+        """Test that batched commands run in order and stop at the first failure"""
+        output = self.git_wrapper.run_git_batch(
+            [['git', 'config', 'user.name'], ['git', 'log', '--format=%s', '-1']],
+            capture_output=True
+        )
+        self.assertEqual(output.splitlines(), ['Test User', 'Initial commit'])
+
+        # Arguments with shell metacharacters reach git verbatim
+        with open('batch.txt', 'w') as f:
+            f.write('batch\n')
+        message = "Batch commit; $(echo not run) 'quoted'"
+        self.assertTrue(self.git_wrapper.run_git_batch(
+            [['git', 'add', 'batch.txt'], ['git', 'commit', '-q', '-m', message]]
+        ))
+        log = subprocess.run(['git', 'log', '--format=%s', '-1'], capture_output=True, text=True)
+        self.assertEqual(log.stdout.strip(), message)
+
+        # A failing command prevents the rest of the chain from running
+        self.assertEqual(self.git_wrapper.run_git_batch(
+            [['git', 'rev-parse', 'no-such-ref'], ['git', 'tag', 'should-not-exist']],
+            capture_output=True
+        ), "")
+        tags = subprocess.run(['git', 'tag'], capture_output=True, text=True)
+        self.assertNotIn('should-not-exist', tags.stdout)
+
+        # Non-git commands and options that run other programs are rejected
+        self.assertFalse(self.git_wrapper.run_git_batch([['echo', 'hi']]))
+        with patch('git_wrapper.subprocess.run') as mock_run:
+            self.assertFalse(self.git_wrapper.run_git_batch(
+                [['git', 'status'], ['git', 'fetch', '--upload-pack=touch pwned', 'origin']]
+            ))
+        mock_run.assert_not_called()
+
+    def test_commands_target_recorded_directory(self):
+        """Test that git commands run against the recorded directory via git -C"""
+        other_dir = tempfile.mkdtemp(suffix=' with space')
+        try:
+            subprocess.run(['git', 'init', '-q', other_dir], check=True)
+            subprocess.run(['git', '-C', other_dir, 'checkout', '-q', '-b', 'elsewhere'], check=True)
+
+            self.assertEqual(
+                self.git_wrapper.run_git_command(['git', 'symbolic-ref', '--short', 'HEAD'],
+                                                 capture_output=True, cwd=other_dir),
+                'elsewhere'
+            )
+
+            self.git_wrapper._cwd = other_dir
+            self.assertEqual(
+                self.git_wrapper.run_git_capture_text(['git', 'symbolic-ref', '--short', 'HEAD']),
+                'elsewhere'
+            )
+            self.assertEqual(
+                self.git_wrapper.run_git_batch([['git', 'symbolic-ref', '--short', 'HEAD']],
+                                               capture_output=True),
+                'elsewhere'
+            )
+        finally:
+            shutil.rmtree(other_dir, ignore_errors=True)
+
+    def test_recorded_directory_with_shell_characters(self):
+        """Test that a working directory named with shell metacharacters passes validation"""
+        parent = tempfile.mkdtemp()
+        try:
+            project = os.path.join(parent, 'R&D #1; a|b')
+            os.makedirs(project)
+            subprocess.run(['git', 'init', '-q', project], check=True)
+            os.chdir(project)
+
+            self.assertTrue(self.git_wrapper.run_git_command(['git', 'status'], show_output=False))
+            self.git_wrapper._refresh_cwd()
+            self.assertTrue(self.git_wrapper.run_git_command(['git', 'status'], show_output=False))
+        finally:
+            os.chdir(self.test_dir)
+            shutil.rmtree(parent, ignore_errors=True)
+
+    def test_clone_probes_new_checkout(self):
+        """Test that cloning records the new checkout's state for the status view"""
+        clone_parent = tempfile.mkdtemp()
+        try:
+            os.chdir(clone_parent)
+            with patch('builtins.input', side_effect=[f'file://{self.test_dir}', 'copy', 'y', '']), \
+                 patch.object(self.git_wrapper, 'clear_screen'), \
+                 patch('builtins.print'):
+                self.git_wrapper.interactive_clone()
+
+            state = self.git_wrapper._repo_state
+            self.assertIsNotNone(state)
+            self.assertEqual(state['path'], os.path.join(os.path.realpath(clone_parent), 'copy'))
+            self.assertEqual(state['remotes'], {'origin': f'file://{self.test_dir}'})
+            self.assertEqual(state['upstream'], f"origin/{state['branch']}")
+            self.assertEqual((state['ahead'], state['behind'], state['changes']), (0, 0, 0))
+            self.assertEqual(os.path.realpath(os.getcwd()), os.path.realpath(state['path']))
+        finally:
+            os.chdir(self.test_dir)
+            shutil.rmtree(clone_parent, ignore_errors=True)
+
+        self.assertEqual(self.git_wrapper._clone_target_dir('git@github.com:user/repo.git'), 'repo')
+        self.assertEqual(self.git_wrapper._clone_target_dir('https://example.com/user/repo/'), 'repo')
+
+    def test_clone_succeeds_when_directory_guess_is_wrong(self):
+        """Test that a clone is reported as successful even if its checkout cannot be probed"""
+        clone_parent = tempfile.mkdtemp()
+        try:
+            os.chdir(clone_parent)
+            with patch('builtins.input', side_effect=[f'file://{self.test_dir}', '']), \
+                 patch.object(self.git_wrapper, 'clear_screen'), \
+                 patch.object(self.git_wrapper, '_clone_target_dir', return_value='not-what-git-picked'), \
+                 patch('builtins.print'):
+                self.git_wrapper.interactive_clone()
+
+            self.git_wrapper.print_success.assert_called_with("Repository cloned successfully!")
+            self.git_wrapper.print_error.assert_not_called()
+            self.assertIsNone(self.git_wrapper._repo_state)
+            self.assertTrue(os.path.isdir(os.path.join(clone_parent, os.path.basename(self.test_dir), '.git')))
+        finally:
+            os.chdir(self.test_dir)
+            shutil.rmtree(clone_parent, ignore_errors=True)
+
+    def test_clone_interrupt_returns_to_menu(self):
+        """Test that Ctrl-C during a clone cancels only the clone"""
+        with patch('builtins.input', side_effect=['https://example.com/repo.git', '']), \
+             patch.object(self.git_wrapper, 'clear_screen'), \
+             patch.object(self.git_wrapper, 'run_git_batch', side_effect=KeyboardInterrupt), \
+             patch('builtins.print'):
+            self.git_wrapper.interactive_clone()
+
+        self.git_wrapper.print_info.assert_called_with("\nClone cancelled")
+        self.git_wrapper.print_success.assert_not_called()
+
+    def test_repo_snapshot_single_probe(self):
+        """Test that branch, remotes and changes come from one probe"""
+        subprocess.run(['git', 'remote', 'add', 'origin', 'https://example.com/repo.git'], check=True)
+        subprocess.run(['git', 'mv', 'README.md', 'renamed.md'], check=True)
+
+        with patch('git_wrapper.subprocess.run', wraps=subprocess.run) as mock_run:
+            state = self.git_wrapper._load_repo_snapshot()
+        self.assertEqual(mock_run.call_count, 1)
+
+        branch = subprocess.run(['git', 'branch', '--show-current'], capture_output=True, text=True).stdout.strip()
+        self.assertEqual(state['branch'], branch)
+        self.assertEqual(state['remotes'], {'origin': 'https://example.com/repo.git'})
+        self.assertEqual(state['changes'], 1)
+
+    def test_push_to_remotes_in_parallel(self):
+        """Test pushing one branch to several remotes concurrently"""
+        remote_dirs = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+        try:
+            for name, path in zip(('first', 'second'), remote_dirs):
+                subprocess.run(['git', 'init', '--bare', path], check=True, capture_output=True)
+                subprocess.run(['git', 'remote', 'add', name, path], check=True)
+            subprocess.run(['git', 'remote', 'add', 'broken', os.path.join(self.test_dir, 'missing')],
+                           check=True)
+            branch = subprocess.run(['git', 'branch', '--show-current'],
+                                    capture_output=True, text=True).stdout.strip()
+
+            with patch('builtins.print'), \
+                 patch('git_wrapper.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_pool, \
+                 patch.object(InteractiveGitWrapper, '_PUSH_WORKERS', 2):
+                failed = self.git_wrapper._push_to_remotes(['first', 'broken', 'second'], branch)
+
+            self.assertEqual(failed, ['broken'])
+            mock_pool.assert_called_once_with(max_workers=2)
+            for path in remote_dirs:
+                result = subprocess.run(['git', '--git-dir', path, 'rev-parse', branch],
+                                        capture_output=True, text=True)
+                self.assertEqual(result.returncode, 0)
+        finally:
+            for path in remote_dirs:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def test_push_needing_credentials_retried_serially(self):
+        """Test that remotes failing on auth in the parallel push are retried with prompts allowed"""
+        parallel_envs = []
+        stderr_by_remote = {
+            'private': "fatal: could not read Username for 'https://example.com': terminal prompts disabled",
+            'gone': "fatal: repository not found",
+        }
+
+        def fake_popen(cmd, **kwargs):
+            parallel_envs.append(kwargs['env'])
+            error = stderr_by_remote.get(cmd[-2], '')
+            process = Mock(returncode=128 if error else 0)
+            process.communicate.return_value = ('', error)
+            return process
+
+        with patch('builtins.print'), \
+             patch('git_wrapper.subprocess.Popen', side_effect=fake_popen), \
+             patch.object(self.git_wrapper, 'run_git_capture_text', return_value=''), \
+             patch.dict(os.environ, {}, clear=False) as env, \
+             patch.object(self.git_wrapper, 'run_git_command', return_value=True) as mock_run:
+            env.pop('GIT_SSH_COMMAND', None)
+            env.pop('GIT_SSH', None)
+            failed = self.git_wrapper._push_to_remotes(['public', 'private', 'gone'], 'main')
+
+        self.assertEqual(failed, ['gone'])
+        mock_run.assert_called_once_with(['git', 'push', 'private', 'main'], operation_type='push')
+        self.assertEqual(len(parallel_envs), 3)
+        for push_env in parallel_envs:
+            self.assertEqual(push_env['GIT_TERMINAL_PROMPT'], '0')
+            self.assertIn('BatchMode=yes', push_env['GIT_SSH_COMMAND'])
+
+    def test_push_interrupt_kills_running_pushes(self):
+        """Test that Ctrl-C stops the parallel pushes instead of waiting for them"""
+        started = []
+        real_popen = subprocess.Popen
+
+        def slow_popen(cmd, **kwargs):
+            process = real_popen([sys.executable, '-c', 'import time; time.sleep(30)'], **kwargs)
+            started.append(process)
+            return process
+
+        def interrupted(futures):
+            # Ctrl-C arrives once both workers are busy
+            deadline = time.monotonic() + 10
+            while len(started) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            raise KeyboardInterrupt
+
+        begin = time.monotonic()
+        with patch('builtins.print'), \
+             patch('git_wrapper.subprocess.Popen', side_effect=slow_popen), \
+             patch('git_wrapper.as_completed', side_effect=interrupted), \
+             patch.object(self.git_wrapper, 'run_git_capture_text', return_value=''), \
+             patch.object(InteractiveGitWrapper, '_PUSH_WORKERS', 2):
+            failed = self.git_wrapper._push_to_remotes(['first', 'second', 'third'], 'main')
+
+        self.assertLess(time.monotonic() - begin, 10)
+        self.assertEqual(failed, ['first', 'second', 'third'])
+        self.assertEqual(len(started), 2)
+        for process in started:
+            self.assertIsNotNone(process.poll())
+        self.git_wrapper.print_info.assert_called_with("\nPush cancelled")
+
+    def test_ref_exists(self):
+        """Test branch existence checks through a single rev-parse call"""
+        branch = subprocess.run(['git', 'branch', '--show-current'], capture_output=True, text=True).stdout.strip()
+
+        self.assertTrue(self.git_wrapper.ref_exists('HEAD'))
+        self.assertTrue(self.git_wrapper.ref_exists(f'refs/heads/{branch}'))
+        self.assertFalse(self.git_wrapper.ref_exists('refs/heads/does-not-exist'))
+        self.assertFalse(self.git_wrapper.ref_exists('bad\nref'))
+
+        with patch('git_wrapper.subprocess.run', wraps=subprocess.run) as mock_run:
+            self.git_wrapper.ref_exists(f'refs/heads/{branch}')
+        mock_run.assert_called_once()
+        self.assertEqual(mock_run.call_args.args[0][-4:],
+                         ['rev-parse', '--verify', '--quiet', f'refs/heads/{branch}'])
+
+    def test_remotes_cached_until_git_config_changes(self):
+        """Test that remote names are cached and refreshed when .git/config changes"""
+        self.assertEqual(self.git_wrapper.get_remotes(), [])
+
+        subprocess.run(['git', 'remote', 'add', 'origin', 'https://example.com/repo.git'], check=True)
+        self.assertEqual(self.git_wrapper.get_remotes(), ['origin'])
+
+        with patch.object(self.git_wrapper, 'run_git_command') as mock_run:
+            self.assertEqual(self.git_wrapper.get_remotes(), ['origin'])
+            mock_run.assert_not_called()
+
+        subprocess.run(['git', 'remote', 'add', 'backup', 'https://example.com/backup.git'], check=True)
+        self.assertEqual(sorted(self.git_wrapper.get_remotes()), ['backup', 'origin'])
+
+    def test_local_branches_cached_until_branch_change(self):
+        """Test that local branches are listed once and relisted after a branch change"""
+        current, branches = self.git_wrapper._get_local_branches()
+        self.assertIn(current, branches)
+
+        with patch.object(self.git_wrapper, 'run_git_command') as mock_run:
+            self.assertEqual(self.git_wrapper._get_local_branches(), (current, branches))
+            mock_run.assert_not_called()
+
+        with patch.object(self.git_wrapper, 'get_input', return_value='feature-x'), \
+             patch('builtins.input', return_value=''), \
+             patch('builtins.print'):
+            self.git_wrapper.interactive_create_branch()
+
+        current, branches = self.git_wrapper._get_local_branches()
+        self.assertEqual(current, 'feature-x')
+        self.assertIn('feature-x', branches)
+
+        # A checkout behind the wrapper's back is noticed through HEAD
+        subprocess.run(['git', 'checkout', '-q', '-b', 'outside'], check=True)
+        current, branches = self.git_wrapper._get_local_branches()
+        self.assertEqual(current, 'outside')
+        self.assertIn('outside', branches)
+
+    def test_init_runs_as_one_git_batch(self):
+        """Test that init, saved identity and origin are applied in a single batch"""
+        new_repo = os.path.join(self.test_dir, 'fresh')
+        os.mkdir(new_repo)
+        os.chdir(new_repo)
+        self.git_wrapper.config.update({'name': 'Init User', 'email': 'init@example.com'})
+
+        with patch.object(self.git_wrapper, 'confirm', side_effect=[True, True]), \
+             patch.object(self.git_wrapper, 'get_input', return_value='https://example.com/fresh.git'), \
+             patch.object(self.git_wrapper, '_schedule_save'), \
+             patch.object(self.git_wrapper, 'run_git_batch',
+                          wraps=self.git_wrapper.run_git_batch) as mock_batch, \
+             patch('builtins.input', return_value=''), \
+             patch('builtins.print'):
+            self.git_wrapper.interactive_init()
+
+        mock_batch.assert_called_once()
+        self.assertEqual(len(mock_batch.call_args[0][0]), 4)
+        email = subprocess.run(['git', 'config', 'user.email'], capture_output=True, text=True).stdout.strip()
+        self.assertEqual(email, 'init@example.com')
+        self.assertEqual(self.git_wrapper.get_remotes(), ['origin'])
+        self.assertEqual(self.git_wrapper.config['default_remote'], 'origin')
+
+    def test_head_and_remotes_read_from_git_dir(self):
+        """Test reading the branch and remotes from .git without running git"""
+        subprocess.run(['git', 'remote', 'add', 'origin', 'https://example.com/repo.git'], check=True)
+        subprocess.run(['git', 'remote', 'add', 'backup', 'https://example.com/backup.git'], check=True)
+        branch = subprocess.run(['git', 'branch', '--show-current'],
+                                capture_output=True, text=True).stdout.strip()
+        git_remotes = subprocess.run(['git', 'remote'], capture_output=True, text=True).stdout.split()
+
+        self.git_wrapper._git_dir()
+        with patch.object(self.git_wrapper, 'run_git_command') as mock_run, \
+             patch('git_wrapper.subprocess.run') as mock_subprocess:
+            self.assertEqual(self.git_wrapper._read_head_ref(), branch)
+            self.assertEqual(self.git_wrapper.get_remotes(), git_remotes)
+            mock_run.assert_not_called()
+            mock_subprocess.assert_not_called()
+
+        with patch.object(self.git_wrapper, 'run_git_capture_text') as mock_capture:
+            self.assertEqual(self.git_wrapper._current_branch(), branch)
+            mock_capture.assert_not_called()
+
+        subprocess.run(['git', 'checkout', '-q', '--detach'], check=True)
+        self.assertEqual(self.git_wrapper._read_head_ref(), '')
+        self.assertEqual(self.git_wrapper._current_branch(), '')
+
+        # Config files pulling in other files are left to git
+        with open(os.path.join('.git', 'config'), 'a') as f:
+            f.write('[include]\n\tpath = extra.config\n')
+        self.assertIsNone(self.git_wrapper._read_remotes_from_config(os.path.join('.git', 'config')))
+
+    def test_head_stub_left_to_git(self):
+        """Test that a reftable HEAD stub or missing refs/heads falls back to git"""
+        git_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(git_dir, 'HEAD'), 'w') as f:
+                f.write('ref: refs/heads/.invalid\n')
+            os.makedirs(os.path.join(git_dir, 'refs'))
+            # Reftable keeps refs/heads as a plain file so older git refuses the repository
+            with open(os.path.join(git_dir, 'refs', 'heads'), 'w') as f:
+                f.write('this repository uses the reftable format\n')
+
+            with patch.object(self.git_wrapper, '_git_dir', return_value=git_dir), \
+                 patch.object(self.git_wrapper, 'run_git_capture_text', return_value='main') as mock_capture:
+                self.assertIsNone(self.git_wrapper._read_head_ref())
+                self.assertEqual(self.git_wrapper._current_branch(), 'main')
+                mock_capture.assert_called_once_with(['git', 'branch', '--show-current'])
+
+                with open(os.path.join(git_dir, 'HEAD'), 'w') as f:
+                    f.write('ref: refs/heads/main\n')
+                self.assertIsNone(self.git_wrapper._read_head_ref())
+        finally:
+            shutil.rmtree(git_dir, ignore_errors=True)
+
+    def test_menu_snapshot_uses_one_git_call(self):
+        """Test that the main menu header costs at most one git process"""
+        with open('new.txt', 'w') as f:
+            f.write('x')
+        branch = subprocess.run(['git', 'branch', '--show-current'],
+                                capture_output=True, text=True).stdout.strip()
+        self.assertTrue(self.git_wrapper.is_git_repo())  # repository probe is cached per directory
+
+        with patch.object(self.git_wrapper, 'run_git_capture_bytes',
+                          wraps=self.git_wrapper.run_git_capture_bytes) as mock_capture:
+            self.assertEqual(self.git_wrapper._repo_snapshot(), (True, branch, 1))
+            self.assertEqual(mock_capture.call_count, 1)
+
+            # HEAD not readable from disk: branch and status come from one v2 call
+            mock_capture.reset_mock()
+            with patch.object(self.git_wrapper, '_read_head_ref', return_value=None):
+                self.assertEqual(self.git_wrapper._repo_snapshot(), (True, branch, 1))
+            self.assertEqual(mock_capture.call_count, 1)
+            self.assertIn('--porcelain=v2', mock_capture.call_args.args[0])
+
+    def test_remote_urls_from_one_listing(self):
+        """Test that remote URLs for the remote menu come from a single git call"""
+        subprocess.run(['git', 'remote', 'add', 'origin', 'https://example.com/repo.git'], check=True)
+        subprocess.run(['git', 'remote', 'add', 'backup', 'https://example.com/backup.git'], check=True)
+        subprocess.run(['git', 'remote', 'set-url', '--push', 'backup', 'https://example.com/push.git'],
+                       check=True)
+
+        with patch.object(self.git_wrapper, 'run_git_capture_bytes',
+                          wraps=self.git_wrapper.run_git_capture_bytes) as mock_capture:
+            urls = self.git_wrapper._get_remote_urls()
+
+        self.assertEqual(urls, {'backup': 'https://example.com/backup.git',
+                                'origin': 'https://example.com/repo.git'})
+        self.assertEqual(mock_capture.call_count, 1)
+
+    def test_commit_message_kept_verbatim(self):
+        """Test that shell metacharacters in a commit message reach git unchanged"""
+        with open('notes.txt', 'w') as f:
+            f.write('notes')
+        message = "Fix `quoting` of $HOME; it's \"done\" & tested"
+        self.git_wrapper.config['auto_push'] = False
+
+        with patch.object(self.git_wrapper, 'confirm', return_value=True), \
+             patch.object(self.git_wrapper, 'get_input', return_value=message), \
+             patch.object(self.git_wrapper, 'clear_screen'), \
+             patch('builtins.input', return_value=''), \
+             patch('builtins.print'):
+            self.git_wrapper.interactive_commit()
+
+        subject = subprocess.run(['git', 'log', '-1', '--format=%s'],
+                                 capture_output=True, text=True).stdout.strip()
+        self.assertEqual(subject, message)
+
+    def test_remote_changes_invalidate_cached_remotes(self):
+        """Test that a successful remote change drops the cached list even if .git/config looks unchanged"""
+        self.assertEqual(self.git_wrapper.get_remotes(), [])
+        key = self.git_wrapper._remotes_cache[os.getcwd()][0]
+        self.git_wrapper._remotes_cache[os.getcwd()] = (key, ['stale'])
+
+        with patch.object(self.git_wrapper, 'get_input', side_effect=['mirror', 'https://example.com/m.git']), \
+             patch.object(self.git_wrapper, 'run_git_command', return_value=True), \
+             patch.object(self.git_wrapper, 'confirm', return_value=False), \
+             patch('builtins.input', return_value=''):
+            self.git_wrapper.interactive_add_remote()
+
+        self.assertEqual(self.git_wrapper.get_remotes(), [])
+
+    def test_remote_listing_ignores_trailing_newline(self):
+        """Test that the git remote fallback yields no empty remote name"""
+        with patch.object(self.git_wrapper, '_read_remotes_from_config', return_value=None), \
+             patch.object(self.git_wrapper, 'run_git_command', return_value='origin\nupstream\n'):
+            self.assertEqual(self.git_wrapper.get_remotes(), ['origin', 'upstream'])
+
     def test_git_command_timeout_handling(self):
         """Test handling of long-running git commands"""
         health_dashboard = self.git_wrapper.get_feature_manager('health')
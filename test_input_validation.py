@@ -166,6 +166,17 @@ class TestInputValidation(unittest.TestCase):
         long_name = "a" * 300
         self.assertEqual(len(self.validator.sanitize_filename(long_name)), 255)
     
+    def test_validate_directory(self):
+        """Test resolving a new directory name under a base directory."""
+        base = Path(os.getcwd()).resolve()
+        
+        self.assertEqual(self.validator.validate_directory("clone", base), base / "clone")
+        self.assertEqual(self.validator.validate_directory("re?po", base).name, "re_po")
+        
+        for directory in ("", "..", "a/b", "../escape"):
+            with self.assertRaises(InputValidationError):
+                self.validator.validate_directory(directory, base)
+    
     def test_sanitize_path(self):
         """Test path sanitization."""
         # Test basic sanitization
@@ -223,6 +234,36 @@ class TestInputValidation(unittest.TestCase):
         self.assertTrue(self.validator.validate_input("main", {"validator_type": "branch_name"}, "field"))
         self.assertFalse(self.validator.validate_input("main*", {"validator_type": "branch_name"}, "field"))
 
+    def test_precompiled_patterns(self):
+        """Test control-character handling and caching of caller-supplied patterns."""
+        from features import input_validator
+
+        self.assertFalse(self.validator.validate_input("a\x1bb", {}, "field"))
+        self.assertTrue(self.validator.validate_input("a\tb", {}, "field"))
+        self.assertEqual(self.validator.sanitize_shell_input("ab\x07c\x7f"), "abc")
+
+        input_validator._compile_pattern.cache_clear()
+        for value in ("abc", "ABC", "def"):
+            self.validator.validate_input(value, {"pattern": r"^[a-z]+$"}, "field")
+        self.assertEqual(input_validator._compile_pattern.cache_info().misses, 1)
+
+        self.assertEqual(self.validator.sanitize_url("git@github.com:user/repo.git"),
+                         "git@github.com:user/repo.git")
+        self.assertEqual(self.validator.sanitize_url("not a url"), "")
+
+    def test_cheap_rejection_matches_patterns(self):
+        """Test that the character pre-checks agree with the full patterns."""
+        samples = ["plainword", "user@host", "user@host.com", "a.b", "git@github.com:u/r.git",
+                   "https://x.io/r", "ftp://x.io/r", "abc1234", "g" * 8, "a" * 41, "a" * 40 + "\n"]
+        for sample in samples:
+            with self.subTest(sample=sample):
+                self.assertEqual(self.validator.validate_url(sample),
+                                 bool(self.validator.PATTERNS['url'].match(sample)))
+                self.assertEqual(self.validator.validate_email(sample),
+                                 bool(self.validator.PATTERNS['email'].match(sample)))
+                self.assertEqual(self.validator.validate_commit_hash(sample),
+                                 bool(self.validator.PATTERNS['commit_hash'].match(sample)))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
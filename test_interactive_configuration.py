@@ -13,10 +13,12 @@ Tests the interactive configuration menus including:
 import unittest
 import tempfile
 import json
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 # Import the main class
+import git_wrapper
 from git_wrapper import InteractiveGitWrapper
 
 
@@ -54,6 +56,13 @@ class TestInteractiveConfiguration(unittest.TestCase):
         self.assertIn('Set Max Stashes', options)
         self.assertIn('Change Default Template', options)
         self.assertIn('Modify Backup Remotes', options)
+        
+        # Same keys and value types reuse the display rows; only the toggle verb follows the value
+        feature_config['auto_name_stashes'] = False
+        hits = git_wrapper._feature_display_schema.cache_info().hits
+        options = self.wrapper._get_feature_config_options('stash_management', feature_config)
+        self.assertIn('Enable Auto Name Stashes', options)
+        self.assertEqual(git_wrapper._feature_display_schema.cache_info().hits, hits + 1)
     
     @patch('builtins.input', side_effect=['75'])
     def test_get_numeric_input_valid(self, mock_input):
@@ -67,6 +76,13 @@ class TestInteractiveConfiguration(unittest.TestCase):
         result = self.wrapper._get_numeric_input('max_stashes', 50, 'stash_management')
         self.assertIsNone(result)
     
+    @patch('builtins.input', side_effect=['2.5', '.5', 'nan', '1e3'])
+    def test_get_numeric_input_float_and_non_decimal(self, mock_input):
+        """Test that decimals parse as floats and other float spellings are rejected."""
+        for expected in (2.5, 0.5, None, None):
+            result = self.wrapper._get_numeric_input('large_file_threshold_mb', 10, 'health_dashboard')
+            self.assertEqual(result, expected)
+    
     @patch('builtins.input', side_effect=['-5'])
     def test_get_numeric_input_out_of_range(self, mock_input):
         """Test numeric input with out-of-range value."""
@@ -85,6 +101,41 @@ class TestInteractiveConfiguration(unittest.TestCase):
         self.assertIn('new_item', current_list)
         self.assertEqual(len(current_list), 2)
     
+    @patch('builtins.input', side_effect=['first', 'second'])
+    def test_handle_list_config_writes_once_on_done(self, mock_input):
+        """Test that list edits are batched into one config write when the editor closes."""
+        current_list = []
+        writes_while_lingering = []
+        threads = threading.active_count()
+        
+        # On a real terminal every edit lingers; nothing may be written or
+        # waiting to be written in the background meanwhile
+        with patch.object(self.wrapper, 'clear_screen'), \
+             patch.object(self.wrapper, '_save_config_now', return_value=True) as mock_save, \
+             patch.object(self.wrapper, 'get_choice', side_effect=['Add Item', 'Add Item', 'Done']), \
+             patch('git_wrapper.sys.stdin.isatty', return_value=True), \
+             patch('git_wrapper.time.sleep', side_effect=lambda _: writes_while_lingering.append(
+                       (mock_save.call_count, threading.active_count()))):
+            self.wrapper._handle_list_config('backup_system', 'backup_remotes', current_list, 'Backup Remotes')
+        
+        self.assertEqual(current_list, ['first', 'second'])
+        self.assertEqual(writes_while_lingering, [(0, threads), (0, threads)])
+        mock_save.assert_called_once_with()
+        self.assertFalse(self.wrapper._config_dirty)
+    
+    def test_handle_list_config_renders_frame_in_one_write(self):
+        """Test that the list editor draws each frame with a single stdout write."""
+        with patch.object(self.wrapper, 'clear_screen'), \
+             patch.object(self.wrapper, 'get_choice', return_value='Done'), \
+             patch('builtins.print'), \
+             patch('git_wrapper.sys.stdout') as mock_stdout:
+            self.wrapper._handle_list_config('backup_system', 'backup_remotes', ['origin', 'mirror'], 'Backup Remotes')
+        
+        frames = [c.args[0] for c in mock_stdout.write.call_args_list if 'Edit Backup Remotes' in c.args[0]]
+        self.assertEqual(frames, [
+            "📝 Edit Backup Remotes\n" + "=" * 30 + "\nCurrent items:\n  1. origin\n  2. mirror\n" + "-" * 30 + "\n"
+        ])
+    
     def test_handle_list_config_remove_item(self):
         """Test removing item from list configuration."""
         current_list = ['item1', 'item2']
@@ -141,6 +192,14 @@ class TestInteractiveConfiguration(unittest.TestCase):
             self.wrapper._handle_feature_config_choice('backup_system', 'Modify Backup Remotes', feature_config)
             mock_handle_list.assert_called_once()
     
+    def test_handle_feature_config_choice_matches_whole_key(self):
+        """Test that a choice maps to its own key, not one whose name it merely contains."""
+        feature_config = {'days': False, 'cleanup_days': True}
+        
+        with patch.object(self.wrapper, 'set_feature_config', return_value=True) as mock_set:
+            self.wrapper._handle_feature_config_choice('stash_management', 'Disable Cleanup Days', feature_config)
+            mock_set.assert_called_once_with('stash_management', 'cleanup_days', False)
+    
     @patch('builtins.input')
     def test_interactive_all_features_overview(self, mock_input):
         """Test the all features overview display."""
@@ -150,6 +209,29 @@ class TestInteractiveConfiguration(unittest.TestCase):
         # Should not raise any exceptions
         self.assertTrue(True)
     
+    @patch('builtins.input')
+    def test_all_features_overview_renders_in_one_write(self, mock_input):
+        """Test that the overview is emitted with a single stdout write."""
+        self.wrapper.config['advanced_features'] = {'stash_management': {'max_stashes': 50, 'auto_name_stashes': True}}
+        with patch.object(self.wrapper, 'clear_screen'), \
+             patch('git_wrapper.sys.stdout') as mock_stdout:
+            self.wrapper.interactive_all_features_overview()
+        
+        mock_stdout.write.assert_called_once_with(
+            "🔧 All Features Configuration Overview\n" + "=" * 50 +
+            "\n\n📋 Stash Management:\n" + "-" * 30 +
+            "\n  Max Stashes: 50\n  Auto Name Stashes: ✅ Yes\n"
+        )
+        
+        # Reopening reuses the rendered text until the config is saved
+        with patch.object(self.wrapper, 'clear_screen'), \
+             patch.object(self.wrapper, '_render_overview', wraps=self.wrapper._render_overview) as mock_render:
+            self.wrapper.interactive_all_features_overview()
+            mock_render.assert_not_called()
+            self.wrapper.set_feature_config('stash_management', 'max_stashes', 75)
+            self.wrapper.interactive_all_features_overview()
+            mock_render.assert_called_once()
+    
     def test_feature_config_validation_integration(self):
         """Test integration of feature configuration with validation."""
         # Test setting valid configuration
@@ -192,6 +192,190 @@ class TestMenuIntegration(unittest.TestCase):
                 self.git_wrapper.handle_menu_choice(choice_text)
                 mock_method.assert_called_once()
 
+    def test_main_menu_option_tables(self):
+        """Test that precomputed menu tables match their dispatch targets"""
+        for options in (InteractiveGitWrapper._MENU_IN_REPO,
+                        InteractiveGitWrapper._MENU_IN_REPO_ADV,
+                        InteractiveGitWrapper._MENU_OUT_REPO):
+            self.assertEqual(options[-1][0], "🚪 Exit")
+            for label, method_name, args in options:
+                self.assertTrue(callable(getattr(self.git_wrapper, method_name)), label)
+
+        self.assertIn("  1. 📊 Show Status", InteractiveGitWrapper._MENU_IN_REPO_TEXT)
+        self.assertIn("  1. 🎯 Initialize Repository", InteractiveGitWrapper._MENU_OUT_REPO_TEXT)
+
+    def test_help_system_looked_up_once(self):
+        """Test that show_help resolves the help feature manager only on first use"""
+        help_system = Mock()
+        with patch.object(self.git_wrapper, 'get_feature_manager', return_value=help_system) as mock_get:
+            self.git_wrapper.show_help()
+            self.git_wrapper.show_help()
+
+        mock_get.assert_called_once_with('help')
+        self.assertEqual(help_system.show_help.call_count, 2)
+
+    def test_fallback_help_menu_dispatch(self):
+        """Test that the fallback help menu renders once per frame and dispatches by index"""
+        for label, method_name, args in InteractiveGitWrapper._HELP_OPTS[:-1]:
+            self.assertTrue(callable(getattr(self.git_wrapper, method_name)), label)
+        self.assertIsNone(InteractiveGitWrapper._HELP_OPTS[-1][1])
+
+        with patch.object(self.git_wrapper, 'get_feature_manager', return_value=None), \
+             patch.object(self.git_wrapper, 'clear_screen'), \
+             patch.object(self.git_wrapper, '_show_help_page') as mock_page, \
+             patch('builtins.input', side_effect=['10', '11']), \
+             patch('git_wrapper.sys.stdout') as mock_stdout:
+            self.git_wrapper.show_help()
+
+        mock_page.assert_called_once_with(InteractiveGitWrapper._HELP_OPTS[9][2][0])
+        written = [c.args[0] for c in mock_stdout.write.call_args_list]
+        self.assertEqual(written.count(InteractiveGitWrapper._HELP_MENU_TEXT), 2)
+
+    def test_fallback_help_rejects_non_numeric_choices(self):
+        """Test that blank, non-digit and out-of-range help choices re-prompt without dispatching"""
+        with patch.object(self.git_wrapper, 'get_feature_manager', return_value=None), \
+             patch.object(self.git_wrapper, 'clear_screen'), \
+             patch.object(self.git_wrapper, '_show_help_page') as mock_page, \
+             patch('builtins.input', side_effect=['', 'abc', '\u00b2', '0', ' 11 ']), \
+             patch('builtins.print') as mock_print, \
+             patch('git_wrapper.sys.stdout'):
+            self.git_wrapper.show_help()
+
+        mock_page.assert_not_called()
+        messages = [c.args[0] for c in mock_print.call_args_list]
+        self.assertEqual(messages.count("Please enter a valid number!"), 3)
+        self.assertEqual(messages.count("Invalid choice!"), 1)
+
+    def test_submenus_dispatch_by_exact_label(self):
+        """Test that push, feature config and diff submenus map labels straight to actions"""
+        snapshot = {'branch': 'main', 'remotes': {'origin': 'url'}}
+        with patch.object(self.git_wrapper, 'clear_screen'), \
+             patch.object(self.git_wrapper, '_load_repo_snapshot', return_value=snapshot), \
+             patch.object(self.git_wrapper, 'get_choice', return_value="Push to all remotes"), \
+             patch.object(self.git_wrapper, 'interactive_push_all') as mock_push_all:
+            self.git_wrapper.interactive_push_menu()
+        mock_push_all.assert_called_once_with(snapshot)
+
+        with patch.object(self.git_wrapper, 'clear_screen'), \
+             patch.object(self.git_wrapper, 'get_choice',
+                          side_effect=["🏥 Repository Health", "Back to configuration menu"]), \
+             patch.object(self.git_wrapper, 'interactive_feature_config_menu') as mock_feature:
+            self.git_wrapper.interactive_advanced_features_menu()
+        mock_feature.assert_called_once_with('health_dashboard')
+
+        with patch.object(self.git_wrapper, 'clear_screen'), \
+             patch.object(self.git_wrapper, 'get_choice', return_value="Staged changes"), \
+             patch.object(self.git_wrapper, 'run_git_command') as mock_run, \
+             patch('builtins.input', return_value=''), \
+             patch('builtins.print'):
+            self.git_wrapper.interactive_diff()
+        mock_run.assert_called_once_with(['git', 'diff', '--cached'])
+
+    def test_multiple_choice_deduplicates_and_reprompts(self):
+        """Test that multiple choice drops repeats and re-prompts on out-of-range numbers"""
+        choices = ['origin', 'backup', 'mirror']
+        with patch.object(self.git_wrapper, '_read_number', side_effect=['1,4,0', '3,1,3']), \
+             patch('builtins.print') as mock_print:
+            result = self.git_wrapper.get_multiple_choice("Select remotes:", choices)
+
+        self.assertEqual(result, ['mirror', 'origin'])
+        mock_print.assert_any_call("Invalid choice: 0, 4")
+
+    def test_pause_only_waits_on_interactive_terminal(self):
+        """Test that the post-action pause is skipped for piped stdin and when no_pause is set"""
+        self.git_wrapper.config['no_pause'] = False
+        with patch('git_wrapper.sys.stdin') as mock_stdin, \
+             patch('builtins.input', return_value='') as mock_input:
+            mock_stdin.isatty.return_value = True
+            self.git_wrapper._pause()
+            mock_input.assert_called_once_with("Press Enter to continue...")
+
+            mock_input.reset_mock()
+            self.git_wrapper.config['no_pause'] = True
+            self.git_wrapper._pause()
+
+            self.git_wrapper.config['no_pause'] = False
+            mock_stdin.isatty.return_value = False
+            self.git_wrapper._pause()
+            mock_input.assert_not_called()
+
+    def test_status_linger_skipped_when_not_pausing(self):
+        """Test that post-action sleeps follow the same rules as the Enter pause"""
+        self.git_wrapper.config['no_pause'] = False
+        with patch('git_wrapper.sys.stdin') as mock_stdin, \
+             patch('git_wrapper.time.sleep') as mock_sleep:
+            mock_stdin.isatty.return_value = True
+            self.git_wrapper._linger(2)
+            mock_sleep.assert_called_once_with(2)
+
+            mock_sleep.reset_mock()
+            mock_stdin.isatty.return_value = False
+            self.git_wrapper._linger(2)
+            mock_sleep.assert_not_called()
+
+    @patch('git_wrapper.InteractiveGitWrapper.is_git_repo')
+    def test_main_menu_dispatches_by_index(self, mock_is_git_repo):
+        """Test that a numeric main menu selection calls the matching handler"""
+        mock_is_git_repo.return_value = True
+
+        with patch.object(self.git_wrapper, 'clear_screen'), \
+             patch.object(self.git_wrapper, 'has_advanced_features', return_value=True), \
+             patch.object(self.git_wrapper, 'run_git_capture_text', return_value='main'), \
+             patch.object(self.git_wrapper, 'run_git_capture_bytes', return_value=b''), \
+             patch.object(self.git_wrapper, '_read_number', side_effect=['1', '9', KeyboardInterrupt]), \
+             patch.object(self.git_wrapper, 'interactive_status') as mock_status, \
+             patch.object(self.git_wrapper, '_handle_feature_menu') as mock_feature_menu, \
+             patch('git_wrapper.os.getcwd', return_value=os.path.join(os.sep, 'work', 'proj')) as mock_getcwd, \
+             patch('git_wrapper.sys.stdout') as mock_stdout:
+
+            self.git_wrapper.show_main_menu()
+
+        mock_status.assert_called_once_with()
+        mock_feature_menu.assert_called_once_with('stash')
+        # The working directory is resolved once, not on every redraw
+        mock_getcwd.assert_called_once_with()
+        # Each frame is rendered with a single write
+        frames = [c.args[0] for c in mock_stdout.write.call_args_list
+                  if "🚀 Interactive Git Wrapper" in c.args[0]]
+        self.assertEqual(len(frames), 3)
+        self.assertIn("📁 Directory: proj\n", frames[0])
+        self.assertIn(InteractiveGitWrapper._MENU_IN_REPO_ADV_TEXT, frames[0])
+
+    @patch('git_wrapper.InteractiveGitWrapper.is_git_repo')
+    def test_main_menu_invalid_choice_shown_on_next_frame(self, mock_is_git_repo):
+        """Test that invalid menu input is reported on the next frame without sleeping"""
+        mock_is_git_repo.return_value = False
+
+        with patch.object(self.git_wrapper, 'clear_screen'), \
+             patch.object(self.git_wrapper, '_read_number', side_effect=['99', 'abc', KeyboardInterrupt]), \
+             patch.object(self.git_wrapper, 'print_error') as mock_print_error, \
+             patch('git_wrapper.time.sleep') as mock_sleep, \
+             patch('builtins.print'):
+
+            self.git_wrapper.show_main_menu()
+
+        mock_sleep.assert_not_called()
+        self.assertEqual(
+            [c.args[0] for c in mock_print_error.call_args_list],
+            ["Invalid choice!", "Please enter a valid number!"]
+        )
+        self.assertIsNone(self.git_wrapper._pending_error)
+
+    def test_cli_dispatch_defers_construction(self):
+        """Test that the CLI only builds the wrapper for known subcommands"""
+        import git_wrapper
+
+        with patch.object(sys, 'argv', ['gw', 'bogus']), \
+             patch('git_wrapper.InteractiveGitWrapper') as mock_cls, \
+             patch('builtins.print'):
+            git_wrapper.main()
+        mock_cls.assert_not_called()
+
+        with patch.object(sys, 'argv', ['gw', 'status']), \
+             patch('git_wrapper.InteractiveGitWrapper') as mock_cls:
+            git_wrapper.main()
+        mock_cls.return_value.interactive_status.assert_called_once_with()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file